@@ -1,5 +1,6 @@
 """Broker client adapters."""
 
-from .alpaca import AlpacaPaperEquitiesClient
+from .alpaca import AlpacaPaperEquitiesClient, AsyncAlpacaPaperEquitiesClient
+from .ratelimit import TokenBucket
 
-__all__ = ["AlpacaPaperEquitiesClient"]
+__all__ = ["AlpacaPaperEquitiesClient", "AsyncAlpacaPaperEquitiesClient", "TokenBucket"]
@@ -1,47 +1,267 @@
-"""Simplified Alpaca paper-trading client."""
+"""Alpaca paper-trading clients."""
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import asyncio
+import email.utils
+import math
+import random
+import time
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+
+import httpx
+
+from .ratelimit import TokenBucket
+
+DEFAULT_BURST = 10
+# Alpaca allows 200 trading API requests per minute per account.
+DEFAULT_SUSTAINED = 200
+RETRYABLE_STATUS = frozenset({429, 500, 502, 503, 504})
+HTTP_NOT_FOUND = 404
+HTTP_UNPROCESSABLE = 422
+
+
+def _retry_after_seconds(value: str | None) -> float | None:
+    """Return the delay requested by a ``Retry-After`` header value.
+
+    RFC 9110 allows either delta-seconds or an HTTP-date; dates in the past
+    mean no delay. Returns ``None`` when the value is missing or unusable.
+    """
+
+    if not value:
+        return None
+    try:
+        seconds = float(value)
+    except ValueError:
+        try:
+            when = email.utils.parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if when.tzinfo is None:
+            when = when.replace(tzinfo=timezone.utc)  # noqa: UP017 - datetime.UTC needs 3.11
+        now = datetime.now(timezone.utc)  # noqa: UP017 - datetime.UTC needs 3.11
+        seconds = (when - now).total_seconds()
+    if not math.isfinite(seconds):
+        return None
+    return max(0.0, seconds)
 
 
 @dataclass
 class AlpacaPaperEquitiesClient:
-    """Minimal REST wrapper for Alpaca paper-trading equities endpoint."""
+    """Minimal REST wrapper for Alpaca paper-trading equities endpoint.
+
+    When ``ratelimit`` is set every call first takes a token from it,
+    blocking the calling thread until one is available.
+    """
 
     api_key: str
     api_secret: str
     base_url: str = "https://paper-api.alpaca.markets"
+    ratelimit: TokenBucket | None = None
 
     def submit_order(self, payload: dict[str, object]) -> dict[str, object]:
         """Submit an order payload and return a placeholder broker response."""
 
+        self._acquire()
         _ = payload
         return {"status": "accepted", "id": "paper-order"}
 
     def cancel_order(self, order_id: str) -> bool:
         """Cancel the provided order identifier and return ``True`` when accepted."""
 
+        self._acquire()
         _ = order_id
         return True
 
     def get_order_status(self, order_id: str) -> dict[str, object]:
         """Return a placeholder order status document."""
 
+        self._acquire()
         _ = order_id
         return {"status": "filled", "filled_qty": 0}
 
     def get_account(self) -> dict[str, object]:
         """Return a snapshot of the simulated account state."""
 
+        self._acquire()
         return {"status": "ACTIVE", "equity": 0.0}
 
+    def _acquire(self) -> None:
+        if self.ratelimit is not None:
+            while not self.ratelimit.try_acquire():
+                time.sleep(self.ratelimit.delay())
+
     def configure_ratelimit(
         self,
         *,
         burst: int | None = None,
         sustained: int | None = None,
     ) -> None:
-        """Placeholder ratelimit configuration hook for future instrumentation."""
+        """Install or adjust the token bucket guarding outbound requests.
+
+        ``burst`` caps back-to-back requests and ``sustained`` is the refill
+        rate in requests per minute.
+        """
+
+        if self.ratelimit is None:
+            self.ratelimit = TokenBucket(
+                burst=burst or DEFAULT_BURST, sustained=sustained or DEFAULT_SUSTAINED
+            )
+        else:
+            self.ratelimit.reconfigure(burst=burst, sustained=sustained)
+
+
+@dataclass
+class AsyncAlpacaPaperEquitiesClient:
+    """Async Alpaca client with pooled keep-alive connections and rate limiting.
+
+    Requests share one ``httpx.AsyncClient`` so connection setup is paid once
+    per pooled socket. Every request first takes a token from ``ratelimit``;
+    throttled (429) responses drain the bucket for the ``Retry-After`` period
+    and are retried, as are transport errors and 5xx responses on idempotent
+    calls, using exponential backoff with full jitter. Pass ``transport`` to
+    route requests to a local stub server or mock in tests.
+    """
+
+    api_key: str
+    api_secret: str
+    base_url: str = "https://paper-api.alpaca.markets"
+    max_connections: int = 20
+    max_keepalive_connections: int = 10
+    timeout: float = 10.0
+    max_retries: int = 3
+    backoff: float = 0.1
+    transport: httpx.AsyncBaseTransport | None = None
+    ratelimit: TokenBucket = field(
+        default_factory=lambda: TokenBucket(
+            burst=DEFAULT_BURST, sustained=DEFAULT_SUSTAINED
+        )
+    )
+    _http: httpx.AsyncClient | None = field(default=None, init=False, repr=False)
+
+    async def __aenter__(self) -> AsyncAlpacaPaperEquitiesClient:
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the pooled connections."""
+
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
+
+    def _client(self) -> httpx.AsyncClient:
+        if self._http is None:
+            self._http = httpx.AsyncClient(
+                base_url=self.base_url,
+                headers={
+                    "APCA-API-KEY-ID": self.api_key,
+                    "APCA-API-SECRET-KEY": self.api_secret,
+                },
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_keepalive_connections,
+                ),
+                timeout=self.timeout,
+                transport=self.transport,
+            )
+        return self._http
+
+    def configure_ratelimit(
+        self,
+        *,
+        burst: int | None = None,
+        sustained: int | None = None,
+    ) -> None:
+        """Adjust the token bucket limits (``sustained`` in requests per minute)."""
+
+        self.ratelimit.reconfigure(burst=burst, sustained=sustained)
+
+    def _backoff_delay(self, attempt: int) -> float:
+        return random.uniform(0.0, self.backoff * 2**attempt)
+
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        *,
+        idempotent: bool,
+        json: dict[str, object] | None = None,
+    ) -> httpx.Response:
+        client = self._client()
+        attempt = 0
+        while True:
+            await self.ratelimit.acquire()
+            exhausted = attempt >= self.max_retries
+            try:
+                response = await client.request(method, path, json=json)
+            except httpx.TransportError:
+                if not idempotent or exhausted:
+                    raise
+            else:
+                throttled = response.status_code == httpx.codes.TOO_MANY_REQUESTS
+                if throttled:
+                    # Without a usable Retry-After the backoff below applies.
+                    delay = _retry_after_seconds(response.headers.get("Retry-After"))
+                    self.ratelimit.drain(delay or 0.0)
+                retryable = response.status_code in RETRYABLE_STATUS and (
+                    idempotent or throttled
+                )
+                if not retryable or exhausted:
+                    return response
+            await asyncio.sleep(self._backoff_delay(attempt))
+            attempt += 1
+
+    async def submit_order(self, payload: dict[str, object]) -> dict[str, object]:
+        """Submit an order payload and return the broker's order document.
+
+        Orders carrying a ``client_order_id`` are deduplicated by Alpaca and
+        are therefore retried like idempotent calls.
+        """
+
+        response = await self._request(
+            "POST",
+            "/v2/orders",
+            json=payload,
+            idempotent="client_order_id" in payload,
+        )
+        response.raise_for_status()
+        return response.json()
+
+    async def submit_orders(
+        self, payloads: Sequence[dict[str, object]]
+    ) -> list[dict[str, object]]:
+        """Submit several orders concurrently over the shared connection pool."""
+
+        return list(
+            await asyncio.gather(*(self.submit_order(payload) for payload in payloads))
+        )
+
+    async def cancel_order(self, order_id: str) -> bool:
+        """Cancel ``order_id`` and return ``True`` when the broker accepted it."""
+
+        response = await self._request(
+            "DELETE", f"/v2/orders/{order_id}", idempotent=True
+        )
+        if response.status_code in (HTTP_NOT_FOUND, HTTP_UNPROCESSABLE):
+            return False
+        response.raise_for_status()
+        return True
+
+    async def get_order_status(self, order_id: str) -> dict[str, object]:
+        """Return the broker's order document for ``order_id``."""
+
+        response = await self._request("GET", f"/v2/orders/{order_id}", idempotent=True)
+        response.raise_for_status()
+        return response.json()
+
+    async def get_account(self) -> dict[str, object]:
+        """Return the paper account snapshot."""
 
-        _ = (burst, sustained)
+        response = await self._request("GET", "/v2/account", idempotent=True)
+        response.raise_for_status()
+        return response.json()
@@ -0,0 +1,97 @@
+"""Token-bucket rate limiting for broker adapters."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+
+SECONDS_PER_MINUTE = 60.0
+
+
+@dataclass
+class TokenBucket:
+    """Token bucket holding up to ``burst`` tokens refilled at ``sustained``/minute.
+
+    Broker limits are published per minute, so ``sustained`` uses the same
+    unit. :meth:`acquire` waits for a token instead of failing, which turns an
+    exhausted bucket into backpressure on the caller rather than a 429 from
+    the broker.
+    """
+
+    burst: int
+    sustained: int
+    clock: Callable[[], float] = time.monotonic
+    tokens: float = field(init=False)
+    updated: float = field(init=False)
+
+    def __post_init__(self) -> None:
+        if self.burst <= 0 or self.sustained <= 0:
+            raise ValueError("burst and sustained must be positive")
+        self.tokens = float(self.burst)
+        self.updated = self.clock()
+        self._lock = asyncio.Lock()
+
+    @property
+    def rate(self) -> float:
+        """Return the refill rate in tokens per second."""
+
+        return self.sustained / SECONDS_PER_MINUTE
+
+    def _refill(self) -> None:
+        now = self.clock()
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def reconfigure(
+        self, *, burst: int | None = None, sustained: int | None = None
+    ) -> None:
+        """Change the bucket limits, keeping the tokens accrued so far."""
+
+        self._refill()
+        if burst is not None:
+            if burst <= 0:
+                raise ValueError("burst must be positive")
+            self.burst = burst
+            self.tokens = min(self.tokens, burst)
+        if sustained is not None:
+            if sustained <= 0:
+                raise ValueError("sustained must be positive")
+            self.sustained = sustained
+
+    def try_acquire(self, tokens: float = 1.0) -> bool:
+        """Take ``tokens`` immediately when available and report success."""
+
+        self._refill()
+        if self.tokens >= tokens:
+            self.tokens -= tokens
+            return True
+        return False
+
+    def delay(self, tokens: float = 1.0) -> float:
+        """Return the seconds until ``tokens`` can be taken."""
+
+        self._refill()
+        return max(0.0, (tokens - self.tokens) / self.rate)
+
+    def drain(self, seconds: float = 0.0) -> None:
+        """Empty the bucket, optionally pushing the next refill ``seconds`` out.
+
+        Used when the broker reports throttling despite local accounting, for
+        example after a ``Retry-After`` response.
+        """
+
+        self._refill()
+        self.tokens = -seconds * self.rate
+
+    async def acquire(self, tokens: float = 1.0) -> None:
+        """Wait until ``tokens`` are available, then take them.
+
+        Waiters are served in arrival order so a burst of callers drains the
+        bucket smoothly instead of stampeding on every refill.
+        """
+
+        async with self._lock:
+            while not self.try_acquire(tokens):
+                await asyncio.sleep(self.delay(tokens))
@@ -1,5 +1,7 @@
 """Market data adapters."""
 
+from .chain import OptionChain
 from .options import SimulatedOptionsClient
+from .snapshots import ChainSnapshot, SnapshotStore
 
-__all__ = ["SimulatedOptionsClient"]
+__all__ = ["ChainSnapshot", "OptionChain", "SimulatedOptionsClient", "SnapshotStore"]
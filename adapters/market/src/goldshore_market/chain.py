@@ -0,0 +1,246 @@
+"""Columnar option-chain container."""
+
+from __future__ import annotations
+
+import math
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+from datetime import date
+
+import numpy as np
+import numpy.typing as npt
+
+DAYS_PER_YEAR = 365.0
+
+ContractKey = tuple[str, str, float, str]
+
+
+@dataclass(frozen=True)
+class OptionChain:
+    """Option chain for one underlying stored as parallel NumPy columns.
+
+    Rows are kept sorted by ``(expiry, strike, put-before-call)`` so that an
+    expiry, and a strike band inside a single expiry, are contiguous ranges
+    that can be returned as zero-copy views. Instances are immutable; slicing
+    never copies column data unless a band spans several expiries.
+    """
+
+    symbol: str
+    strike: npt.NDArray[np.float64]
+    expiry: npt.NDArray[np.datetime64]
+    is_call: npt.NDArray[np.bool_]
+    bid: npt.NDArray[np.float64]
+    ask: npt.NDArray[np.float64]
+    open_interest: npt.NDArray[np.int64]
+    implied_volatility: npt.NDArray[np.float64]
+
+    @classmethod
+    def from_columns(  # noqa: PLR0913
+        cls,
+        symbol: str,
+        *,
+        strike: Iterable[float],
+        expiry: Iterable[date | str] | npt.NDArray[np.datetime64],
+        option_type: Iterable[str] | npt.NDArray[np.bool_],
+        bid: Iterable[float],
+        ask: Iterable[float],
+        open_interest: Iterable[int] | None = None,
+        implied_volatility: Iterable[float] | None = None,
+    ) -> OptionChain:
+        """Build a chain from column iterables, sorting rows into chain order.
+
+        ``option_type`` accepts ``"call"``/``"put"`` strings or a boolean call
+        mask. Missing open interest defaults to zero and missing implied
+        volatility to ``NaN``.
+        """
+
+        strikes = np.asarray(strike, dtype=np.float64)
+        size = strikes.size
+        types = np.asarray(option_type)
+        calls = types if types.dtype == np.bool_ else types == "call"
+        columns = {
+            "strike": strikes,
+            "expiry": np.asarray(expiry, dtype="datetime64[D]"),
+            "is_call": np.asarray(calls, dtype=np.bool_),
+            "bid": np.asarray(bid, dtype=np.float64),
+            "ask": np.asarray(ask, dtype=np.float64),
+            "open_interest": (
+                np.zeros(size, dtype=np.int64)
+                if open_interest is None
+                else np.asarray(open_interest, dtype=np.int64)
+            ),
+            "implied_volatility": (
+                np.full(size, np.nan)
+                if implied_volatility is None
+                else np.asarray(implied_volatility, dtype=np.float64)
+            ),
+        }
+        for name, column in columns.items():
+            if column.shape != (size,):
+                raise ValueError(f"Column {name!r} must have shape ({size},)")
+
+        order = np.lexsort((columns["is_call"], strikes, columns["expiry"]))
+        if np.any(order[1:] < order[:-1]):
+            columns = {name: column[order] for name, column in columns.items()}
+        return cls(symbol=symbol, **columns)
+
+    @classmethod
+    def from_records(
+        cls, symbol: str, records: Iterable[Mapping[str, object]]
+    ) -> OptionChain:
+        """Build a chain from the dictionaries produced by :meth:`to_records`."""
+
+        rows = list(records)
+        return cls.from_columns(
+            symbol,
+            strike=[row["strike"] for row in rows],
+            expiry=[row["expiry"] for row in rows],
+            option_type=[row["type"] for row in rows],
+            bid=[row.get("bid", np.nan) for row in rows],
+            ask=[row.get("ask", np.nan) for row in rows],
+            open_interest=[row.get("open_interest", 0) for row in rows],
+            implied_volatility=[row.get("iv", np.nan) for row in rows],
+        )
+
+    @classmethod
+    def empty(cls, symbol: str) -> OptionChain:
+        """Return a chain with no contracts."""
+
+        return cls.from_columns(
+            symbol, strike=[], expiry=[], option_type=[], bid=[], ask=[]
+        )
+
+    def __len__(self) -> int:
+        return int(self.strike.size)
+
+    @property
+    def nbytes(self) -> int:
+        """Return the memory held by the column buffers."""
+
+        return sum(
+            column.nbytes
+            for column in (
+                self.strike,
+                self.expiry,
+                self.is_call,
+                self.bid,
+                self.ask,
+                self.open_interest,
+                self.implied_volatility,
+            )
+        )
+
+    @property
+    def mid(self) -> npt.NDArray[np.float64]:
+        """Return the bid/ask midpoint of every contract."""
+
+        return 0.5 * (self.bid + self.ask)
+
+    @property
+    def expiries(self) -> npt.NDArray[np.datetime64]:
+        """Return the distinct listed expiries in ascending order."""
+
+        starts = np.ones(len(self), dtype=np.bool_)
+        starts[1:] = self.expiry[1:] != self.expiry[:-1]
+        return self.expiry[starts]
+
+    def _rows(self, rows: slice | npt.NDArray[np.bool_]) -> OptionChain:
+        return OptionChain(
+            symbol=self.symbol,
+            strike=self.strike[rows],
+            expiry=self.expiry[rows],
+            is_call=self.is_call[rows],
+            bid=self.bid[rows],
+            ask=self.ask[rows],
+            open_interest=self.open_interest[rows],
+            implied_volatility=self.implied_volatility[rows],
+        )
+
+    def for_expiry(self, expiry: date | str | np.datetime64) -> OptionChain:
+        """Return a zero-copy view of the contracts expiring on ``expiry``."""
+
+        key = np.datetime64(expiry, "D")
+        start, stop = np.searchsorted(self.expiry, [key, key + 1])
+        return self._rows(slice(int(start), int(stop)))
+
+    def moneyness_band(self, spot: float, low: float, high: float) -> OptionChain:
+        """Return contracts whose ``strike / spot`` lies within ``[low, high]``.
+
+        A single-expiry chain is returned as a zero-copy view; bands spanning
+        several expiries are gathered with a boolean mask.
+        """
+
+        lower, upper = spot * low, spot * high
+        if len(self.expiries) <= 1:
+            start = int(np.searchsorted(self.strike, lower, side="left"))
+            stop = int(np.searchsorted(self.strike, upper, side="right"))
+            return self._rows(slice(start, stop))
+        return self._rows((self.strike >= lower) & (self.strike <= upper))
+
+    def time_to_expiry(self, as_of: date) -> npt.NDArray[np.float64]:
+        """Return ACT/365 year fractions from ``as_of`` to each contract expiry."""
+
+        days = self.expiry - np.datetime64(as_of, "D")
+        return days.astype(np.float64) / DAYS_PER_YEAR
+
+    def pricing_inputs(self, as_of: date) -> dict[str, npt.NDArray[np.generic]]:
+        """Return keyword arguments for the ``goldshore_options`` batch APIs.
+
+        The mapping supplies ``option_type``, ``strike`` and ``time_to_expiry``;
+        callers add the market inputs, e.g.
+        ``price_and_greeks(spot=s, volatility=chain.implied_volatility,
+        rate=r, **chain.pricing_inputs(as_of))``.
+        """
+
+        return {
+            "option_type": self.is_call,
+            "strike": self.strike,
+            "time_to_expiry": self.time_to_expiry(as_of),
+        }
+
+    def contract_keys(self) -> list[ContractKey]:
+        """Return hashable per-contract keys suitable for an ``IVCache``."""
+
+        expiries = np.datetime_as_string(self.expiry, unit="D").tolist()
+        types = np.where(self.is_call, "call", "put").tolist()
+        return [
+            (self.symbol, expiry, strike, kind)
+            for expiry, strike, kind in zip(
+                expiries, self.strike.tolist(), types, strict=True
+            )
+        ]
+
+    def to_records(self) -> list[dict[str, object]]:
+        """Return JSON-ready dictionaries, one per contract.
+
+        Intended for the HTTP edge only; in-process consumers should read the
+        columns directly.
+        """
+
+        expiries = np.datetime_as_string(self.expiry, unit="D").tolist()
+        types = np.where(self.is_call, "call", "put").tolist()
+        ivs = [
+            None if math.isnan(iv) else iv for iv in self.implied_volatility.tolist()
+        ]
+        return [
+            {
+                "symbol": self.symbol,
+                "expiry": expiry,
+                "strike": strike,
+                "type": kind,
+                "bid": bid,
+                "ask": ask,
+                "open_interest": open_interest,
+                "iv": iv,
+            }
+            for expiry, strike, kind, bid, ask, open_interest, iv in zip(
+                expiries,
+                self.strike.tolist(),
+                types,
+                self.bid.tolist(),
+                self.ask.tolist(),
+                self.open_interest.tolist(),
+                ivs,
+                strict=True,
+            )
+        ]
@@ -2,30 +2,96 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from collections.abc import Sequence
+from dataclasses import dataclass, field
 from datetime import date
 
+import numpy as np
+import numpy.typing as npt
+from goldshore_options import OptionType, VolSurface, price_and_greeks
+
+from .chain import OptionChain
+from .snapshots import SnapshotStore
+
+_GREEK_NAMES = ("delta", "gamma", "theta", "vega", "rho")
+
 
 @dataclass
 class SimulatedOptionsClient:
     """In-memory market data client for option chains."""
 
+    surfaces: dict[str, VolSurface] = field(default_factory=dict)
+    chains: dict[str, OptionChain] = field(default_factory=dict)
+    quotes: dict[str, dict[str, float]] = field(default_factory=dict)
+
+    def set_chain(self, chain: OptionChain) -> None:
+        """Replace the stored chain for ``chain.symbol``."""
+
+        self.chains[chain.symbol] = chain
+
     def get_chain(
         self,
         symbol: str,
         *,
         expiry: date | None = None,
-    ) -> list[dict[str, object]]:
-        """Return a placeholder option chain for ``symbol`` and optional ``expiry``."""
+    ) -> OptionChain:
+        """Return the stored chain for ``symbol``, optionally for one ``expiry``.
+
+        Expiry filtering returns a zero-copy view; unknown symbols yield an
+        empty chain.
+        """
 
-        _ = (symbol, expiry)
-        return []
+        chain = self.chains.get(symbol)
+        if chain is None:
+            return OptionChain.empty(symbol)
+        return chain if expiry is None else chain.for_expiry(expiry)
+
+    def set_quote(self, symbol: str, *, bid: float, ask: float, last: float) -> None:
+        """Replace the stored NBBO snapshot for ``symbol``."""
+
+        self.quotes[symbol] = {"bid": bid, "ask": ask, "last": last}
 
     def get_quote(self, symbol: str) -> dict[str, float]:
-        """Return a placeholder NBBO snapshot for ``symbol``."""
+        """Return the stored NBBO snapshot for ``symbol``, zeroed when unknown."""
+
+        quote = self.quotes.get(symbol)
+        return dict(quote) if quote else {"bid": 0.0, "ask": 0.0, "last": 0.0}
+
+    def snapshot(self, store: SnapshotStore) -> int:
+        """Append every stored chain and quote to ``store``.
+
+        Returns the number of snapshots written.
+        """
+
+        symbols = sorted(self.chains.keys() | self.quotes.keys())
+        for symbol in symbols:
+            chain = self.chains.get(symbol)
+            store.append(
+                OptionChain.empty(symbol) if chain is None else chain,
+                quote=self.quotes.get(symbol),
+            )
+        return len(symbols)
 
-        _ = symbol
-        return {"bid": 0.0, "ask": 0.0, "last": 0.0}
+    def restore(self, store: SnapshotStore) -> int:
+        """Load the latest snapshot of every symbol in ``store``.
+
+        Restored chains are memory-mapped views, so a restart can serve the
+        last chain without re-pulling it. Returns the number of symbols loaded.
+        """
+
+        symbols = store.symbols()
+        for symbol in symbols:
+            snapshot = store.latest(symbol)
+            if snapshot is None:
+                continue
+            self.chains[symbol] = snapshot.chain
+            self.quotes[symbol] = snapshot.quote
+        return len(symbols)
+
+    def set_surface(self, symbol: str, surface: VolSurface) -> None:
+        """Register the implied-volatility surface used to price ``symbol``."""
+
+        self.surfaces[symbol] = surface
 
     def get_greeks(
         self,
@@ -33,8 +99,50 @@ class SimulatedOptionsClient:
         *,
         strike: float,
         expiry: date,
+        option_type: OptionType = "call",
     ) -> dict[str, float]:
-        """Return placeholder greek sensitivities for the specified contract."""
+        """Return greek sensitivities for the specified contract.
+
+        Contracts are priced off the registered :class:`VolSurface` for
+        ``symbol``; symbols without a surface report zero sensitivities.
+        """
+
+        greeks = self.get_greeks_batch(
+            symbol, strike=strike, expiry=expiry, option_type=option_type
+        )
+        return {name: float(values) for name, values in greeks.items()}
+
+    def get_greeks_batch(
+        self,
+        symbol: str,
+        *,
+        strike: float | Sequence[float] | npt.NDArray[np.float64],
+        expiry: date | Sequence[date] | npt.NDArray[np.datetime64],
+        option_type: OptionType | Sequence[str] | npt.NDArray[np.str_] = "call",
+    ) -> dict[str, npt.NDArray[np.float64]]:
+        """Return greeks for many contracts on ``symbol`` in one vectorized call.
+
+        ``strike``, ``expiry`` and ``option_type`` broadcast against each other;
+        symbols without a surface report zero sensitivities.
+        """
+
+        surface = self.surfaces.get(symbol)
+        strikes = np.asarray(strike, dtype=np.float64)
+        if surface is None:
+            shape = np.broadcast_shapes(
+                strikes.shape,
+                np.shape(np.asarray(expiry, dtype="datetime64[D]")),
+                np.shape(option_type),
+            )
+            return {name: np.zeros(shape) for name in _GREEK_NAMES}
 
-        _ = (symbol, strike, expiry)
-        return {"delta": 0.0, "gamma": 0.0, "theta": 0.0, "vega": 0.0, "rho": 0.0}
+        greeks = price_and_greeks(
+            option_type=option_type,
+            spot=surface.spot,
+            strike=strikes,
+            time_to_expiry=surface.time_to_expiry(expiry),
+            volatility=surface.vol(strikes, expiry),
+            rate=surface.rate,
+            dividend_yield=surface.dividend_yield,
+        )
+        return {name: getattr(greeks, name) for name in _GREEK_NAMES}
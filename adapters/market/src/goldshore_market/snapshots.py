@@ -0,0 +1,243 @@
+"""Append-only, memory-mapped option-chain snapshot store."""
+
+from __future__ import annotations
+
+import bisect
+import mmap
+import os
+from collections.abc import Iterator, Mapping
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+from goldshore_utils import from_nanos, to_nanos, utc_now
+
+from .chain import OptionChain
+
+DATA_FILE = "chains.dat"
+INDEX_FILE = "chains.idx"
+
+INDEX_DTYPE = np.dtype(
+    [
+        ("symbol", "S16"),
+        ("timestamp", "<i8"),
+        ("offset", "<i8"),
+        ("rows", "<i8"),
+        ("bid", "<f8"),
+        ("ask", "<f8"),
+        ("last", "<f8"),
+    ]
+)
+
+# Column order inside a data block; every column is written contiguously.
+_COLUMNS = (
+    ("strike", np.dtype("<f8")),
+    ("expiry", np.dtype("<M8[D]")),
+    ("bid", np.dtype("<f8")),
+    ("ask", np.dtype("<f8")),
+    ("implied_volatility", np.dtype("<f8")),
+    ("open_interest", np.dtype("<i8")),
+    ("is_call", np.dtype("?")),
+)
+_ALIGNMENT = 8
+
+
+def _block_size(rows: int) -> int:
+    size = sum(dtype.itemsize * rows for _, dtype in _COLUMNS)
+    return -(-size // _ALIGNMENT) * _ALIGNMENT
+
+
+@dataclass(frozen=True)
+class ChainSnapshot:
+    """Option chain and underlying quote captured at ``timestamp``.
+
+    ``chain`` columns are read-only views into the memory-mapped data file.
+    """
+
+    symbol: str
+    timestamp: datetime
+    quote: dict[str, float]
+    chain: OptionChain
+
+
+class SnapshotStore:
+    """Persist chain snapshots to an append-only columnar file pair.
+
+    ``chains.dat`` holds one block per snapshot with each column stored
+    contiguously, and ``chains.idx`` holds fixed-width records keyed by
+    ``(symbol, timestamp)`` that point into it. The index record is written
+    after its data block, so a torn write leaves at most an unindexed tail that
+    is ignored on reopen. Reads map the data file and return zero-copy views,
+    which makes cold starts and replays independent of chain parsing.
+    """
+
+    def __init__(self, directory: str | os.PathLike[str]) -> None:
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._data = open(self.directory / DATA_FILE, "ab+")
+        self._index = open(self.directory / INDEX_FILE, "ab+")
+        self._map: mmap.mmap | None = None
+        self._records: list[np.void] = list(self._load_index())
+        self._by_symbol: dict[str, tuple[list[int], list[int]]] = {}
+        for position, record in enumerate(self._records):
+            timestamps, positions = self._by_symbol.setdefault(
+                record["symbol"].decode(), ([], [])
+            )
+            timestamps.append(int(record["timestamp"]))
+            positions.append(position)
+
+    def _load_index(self) -> np.ndarray:
+        self._index.seek(0)
+        raw = self._index.read()
+        complete = len(raw) - len(raw) % INDEX_DTYPE.itemsize
+        if complete != len(raw):
+            self._index.truncate(complete)
+        records = np.frombuffer(raw[:complete], dtype=INDEX_DTYPE).copy()
+        end = 0
+        if records.size:
+            end = int(records["offset"][-1]) + _block_size(int(records["rows"][-1]))
+        if self._data.seek(0, os.SEEK_END) > end:
+            self._data.truncate(end)
+        return records
+
+    def __enter__(self) -> SnapshotStore:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the underlying files; outstanding views stay readable."""
+
+        self._data.close()
+        self._index.close()
+        self._map = None
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def symbols(self) -> list[str]:
+        """Return every symbol with at least one stored snapshot."""
+
+        return sorted(self._by_symbol)
+
+    def append(
+        self,
+        chain: OptionChain,
+        *,
+        quote: Mapping[str, float] | None = None,
+        timestamp: datetime | None = None,
+    ) -> None:
+        """Append ``chain`` and the underlying ``quote`` as a new snapshot.
+
+        Timestamps default to :func:`goldshore_utils.utc_now` and must not go
+        backwards for a given symbol.
+        """
+
+        symbol = chain.symbol
+        nanos = to_nanos(timestamp or utc_now())
+        timestamps, positions = self._by_symbol.get(symbol, ([], []))
+        if timestamps and nanos < timestamps[-1]:
+            raise ValueError(f"Snapshot for {symbol} is older than the latest stored")
+        encoded = symbol.encode()
+        if len(encoded) > INDEX_DTYPE["symbol"].itemsize:
+            raise ValueError(f"Symbol {symbol!r} is too long for the snapshot index")
+
+        rows = len(chain)
+        offset = self._data.seek(0, os.SEEK_END)
+        for name, dtype in _COLUMNS:
+            column = np.ascontiguousarray(getattr(chain, name), dtype)
+            self._data.write(column.view(np.uint8).data)
+        written = self._data.tell() - offset
+        self._data.write(b"\0" * (_block_size(rows) - written))
+        self._data.flush()
+
+        quote = quote or {}
+        record = np.array(
+            [
+                (
+                    encoded,
+                    nanos,
+                    offset,
+                    rows,
+                    quote.get("bid", 0.0),
+                    quote.get("ask", 0.0),
+                    quote.get("last", 0.0),
+                )
+            ],
+            dtype=INDEX_DTYPE,
+        )
+        self._index.write(record.tobytes())
+        self._index.flush()
+
+        self._records.append(record[0])
+        timestamps.append(nanos)
+        positions.append(len(self._records) - 1)
+        self._by_symbol[symbol] = (timestamps, positions)
+
+    def _view(self, position: int) -> ChainSnapshot:
+        record = self._records[position]
+        offset, rows = int(record["offset"]), int(record["rows"])
+        end = offset + _block_size(rows)
+        if rows and (self._map is None or len(self._map) < end):
+            self._map = mmap.mmap(self._data.fileno(), 0, access=mmap.ACCESS_READ)
+
+        columns: dict[str, np.ndarray] = {}
+        cursor = offset
+        for name, dtype in _COLUMNS:
+            columns[name] = (
+                np.frombuffer(self._map, dtype=dtype, count=rows, offset=cursor)
+                if rows
+                else np.empty(0, dtype=dtype)
+            )
+            cursor += dtype.itemsize * rows
+
+        symbol = record["symbol"].decode()
+        return ChainSnapshot(
+            symbol=symbol,
+            timestamp=from_nanos(int(record["timestamp"])),
+            quote={
+                "bid": float(record["bid"]),
+                "ask": float(record["ask"]),
+                "last": float(record["last"]),
+            },
+            chain=OptionChain(symbol=symbol, **columns),
+        )
+
+    def latest(self, symbol: str) -> ChainSnapshot | None:
+        """Return the most recent snapshot for ``symbol``."""
+
+        entry = self._by_symbol.get(symbol)
+        return self._view(entry[1][-1]) if entry else None
+
+    def at(self, symbol: str, timestamp: datetime) -> ChainSnapshot | None:
+        """Return the last snapshot for ``symbol`` taken at or before ``timestamp``."""
+
+        entry = self._by_symbol.get(symbol)
+        if not entry:
+            return None
+        index = bisect.bisect_right(entry[0], to_nanos(timestamp)) - 1
+        return self._view(entry[1][index]) if index >= 0 else None
+
+    def history(
+        self,
+        symbol: str,
+        *,
+        start: datetime | None = None,
+        end: datetime | None = None,
+    ) -> Iterator[ChainSnapshot]:
+        """Yield snapshots for ``symbol`` with ``start <= timestamp < end``."""
+
+        entry = self._by_symbol.get(symbol)
+        if not entry:
+            return
+        timestamps, positions = entry
+        first = 0 if start is None else bisect.bisect_left(timestamps, to_nanos(start))
+        last = (
+            len(timestamps)
+            if end is None
+            else bisect.bisect_left(timestamps, to_nanos(end))
+        )
+        for position in positions[first:last]:
+            yield self._view(position)
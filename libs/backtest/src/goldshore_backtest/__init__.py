@@ -0,0 +1,19 @@
+"""Event-driven backtesting for Gold Shore strategies."""
+
+from .broker import SimulatedBroker
+from .data import QuoteStream
+from .engine import BacktestContext, BacktestEngine, BacktestResult, Strategy
+from .strategies import RegimeStrategy
+from .sweep import parameter_grid, run_sweep
+
+__all__ = [
+    "BacktestContext",
+    "BacktestEngine",
+    "BacktestResult",
+    "QuoteStream",
+    "RegimeStrategy",
+    "SimulatedBroker",
+    "Strategy",
+    "parameter_grid",
+    "run_sweep",
+]
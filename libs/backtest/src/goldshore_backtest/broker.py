@@ -0,0 +1,87 @@
+"""Simulated broker used in place of the Alpaca client during backtests."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+
+BPS = 1e4
+
+
+@dataclass
+class SimulatedBroker:
+    """Fill market orders against the latest replayed quote.
+
+    Exposes the same methods as ``AlpacaPaperEquitiesClient`` so order logic
+    written against the adapter runs unchanged. Buys fill at the ask and sells
+    at the bid, each worsened by ``slippage_bps``; ``commission`` is charged
+    per unit. Orders in symbols without a quote, and non-market orders, are
+    rejected.
+    """
+
+    cash: float = 0.0
+    slippage_bps: float = 0.0
+    commission: float = 0.0
+    quotes: dict[str, tuple[float, float]] = field(default_factory=dict)
+    positions: dict[str, float] = field(default_factory=dict)
+    orders: dict[str, dict[str, object]] = field(default_factory=dict)
+
+    def update_quote(self, symbol: str, bid: float, ask: float) -> None:
+        """Record the latest top of book for ``symbol``."""
+
+        self.quotes[symbol] = (bid, ask)
+
+    def submit_order(self, payload: dict[str, object]) -> dict[str, object]:
+        """Fill or reject ``payload`` immediately and return the order document."""
+
+        order_id = f"sim-{len(self.orders) + 1}"
+        symbol = str(payload["symbol"])
+        side = str(payload["side"])
+        quantity = float(payload["qty"])
+        order: dict[str, object] = {
+            "id": order_id,
+            "client_order_id": payload.get("client_order_id"),
+            "symbol": symbol,
+            "side": side,
+            "qty": quantity,
+            "filled_qty": 0.0,
+            "filled_avg_price": None,
+            "commission": 0.0,
+            "status": "rejected",
+        }
+        self.orders[order_id] = order
+        quote = self.quotes.get(symbol)
+        if quote is None or payload.get("type", "market") != "market":
+            return order
+
+        bid, ask = quote
+        if side == "buy":
+            price, signed = ask * (1.0 + self.slippage_bps / BPS), quantity
+        else:
+            price, signed = bid * (1.0 - self.slippage_bps / BPS), -quantity
+        fee = self.commission * quantity
+        self.cash -= signed * price + fee
+        self.positions[symbol] = self.positions.get(symbol, 0.0) + signed
+        order.update(
+            status="filled", filled_qty=quantity, filled_avg_price=price, commission=fee
+        )
+        return order
+
+    def cancel_order(self, order_id: str) -> bool:
+        """Return ``False``; simulated market orders fill on submission."""
+
+        _ = order_id
+        return False
+
+    def get_order_status(self, order_id: str) -> dict[str, object]:
+        """Return the stored order document."""
+
+        return self.orders[order_id]
+
+    def get_account(self) -> dict[str, object]:
+        """Return cash and marked equity of the simulated account."""
+
+        equity = self.cash + sum(
+            quantity * 0.5 * sum(self.quotes.get(symbol, (0.0, 0.0)))
+            for symbol, quantity in self.positions.items()
+        )
+        return {"status": "ACTIVE", "cash": self.cash, "equity": equity}
@@ -0,0 +1,96 @@
+"""Columnar market-data streams replayed by the backtest engine."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+from datetime import datetime
+
+import numpy as np
+import numpy.typing as npt
+from goldshore_market import ChainSnapshot, SnapshotStore
+from goldshore_utils import to_nanos
+
+
+@dataclass(frozen=True)
+class QuoteStream:
+    """Time-ordered quotes stored as parallel arrays.
+
+    ``codes`` index into ``symbols`` so millions of events hold one small
+    integer per row instead of a string. ``chains`` are option-chain
+    snapshots delivered to strategies alongside the quotes, in timestamp
+    order.
+    """
+
+    timestamps: npt.NDArray[np.int64]
+    codes: npt.NDArray[np.int32]
+    symbols: tuple[str, ...]
+    bid: npt.NDArray[np.float64]
+    ask: npt.NDArray[np.float64]
+    chains: tuple[ChainSnapshot, ...] = ()
+
+    @classmethod
+    def from_arrays(
+        cls,
+        *,
+        timestamps: Sequence[datetime] | npt.ArrayLike,
+        symbols: Sequence[str] | npt.ArrayLike,
+        bid: npt.ArrayLike,
+        ask: npt.ArrayLike,
+        chains: Iterable[ChainSnapshot] = (),
+    ) -> QuoteStream:
+        """Build a stream, stably sorting rows by timestamp.
+
+        ``timestamps`` may be aware ``datetime`` objects, ``datetime64``
+        values or integer nanoseconds since the epoch.
+        """
+
+        stamps = np.asarray(timestamps)
+        if stamps.dtype == object:
+            stamps = np.array([to_nanos(stamp) for stamp in stamps], dtype=np.int64)
+        elif np.issubdtype(stamps.dtype, np.datetime64):
+            stamps = stamps.astype("datetime64[ns]").astype(np.int64)
+        else:
+            stamps = stamps.astype(np.int64)
+        names, codes = np.unique(np.asarray(symbols, dtype=str), return_inverse=True)
+        order = np.argsort(stamps, kind="stable")
+        return cls(
+            timestamps=stamps[order],
+            codes=codes.astype(np.int32)[order],
+            symbols=tuple(names.tolist()),
+            bid=np.asarray(bid, dtype=np.float64)[order],
+            ask=np.asarray(ask, dtype=np.float64)[order],
+            chains=tuple(sorted(chains, key=lambda snapshot: snapshot.timestamp)),
+        )
+
+    @classmethod
+    def from_snapshots(
+        cls,
+        store: SnapshotStore,
+        *,
+        symbols: Sequence[str] | None = None,
+        start: datetime | None = None,
+        end: datetime | None = None,
+        include_chains: bool = True,
+    ) -> QuoteStream:
+        """Replay quotes, and optionally chains, stored by the market data service."""
+
+        snapshots = [
+            snapshot
+            for symbol in (symbols if symbols is not None else store.symbols())
+            for snapshot in store.history(symbol, start=start, end=end)
+        ]
+        return cls.from_arrays(
+            timestamps=[snapshot.timestamp for snapshot in snapshots],
+            symbols=[snapshot.symbol for snapshot in snapshots],
+            bid=[snapshot.quote["bid"] for snapshot in snapshots],
+            ask=[snapshot.quote["ask"] for snapshot in snapshots],
+            chains=(
+                [snapshot for snapshot in snapshots if len(snapshot.chain)]
+                if include_chains
+                else ()
+            ),
+        )
+
+    def __len__(self) -> int:
+        return int(self.timestamps.size)
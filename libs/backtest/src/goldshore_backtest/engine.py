@@ -0,0 +1,181 @@
+"""Event-driven backtest engine decoupled from wall-clock time."""
+
+from __future__ import annotations
+
+import math
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass, field
+from typing import Protocol
+
+import numpy as np
+import numpy.typing as npt
+from goldshore_market import ChainSnapshot
+from goldshore_risk import Policy, RiskEngine
+from goldshore_utils import SimulatedClock, to_nanos, use_clock
+
+from .broker import SimulatedBroker
+from .data import QuoteStream
+
+_NO_CHAIN = math.inf
+
+
+class Strategy(Protocol):
+    """Callbacks invoked by :class:`BacktestEngine` for each replayed event."""
+
+    def on_quote(
+        self, context: BacktestContext, symbol: str, bid: float, ask: float
+    ) -> None:
+        """React to a quote update; orders go through ``context.submit``."""
+
+
+@dataclass
+class BacktestContext:
+    """State handed to strategies: the clock, risk engine and broker."""
+
+    clock: SimulatedClock
+    risk: RiskEngine
+    broker: SimulatedBroker
+    fills: list[dict[str, object]] = field(default_factory=list)
+    rejected: int = 0
+
+    def position(self, symbol: str) -> float:
+        """Return the current signed position in ``symbol``."""
+
+        return self.broker.positions.get(symbol, 0.0)
+
+    def submit(
+        self, symbol: str, *, side: str, quantity: float
+    ) -> dict[str, object] | None:
+        """Run the pre-trade risk check and send a market order to the broker.
+
+        Returns the broker order, or ``None`` when the risk engine rejects it.
+        """
+
+        signed = quantity if side == "buy" else -quantity
+        if not self.risk.check(symbol, quantity=signed).approved:
+            self.rejected += 1
+            return None
+        order = self.broker.submit_order(
+            {"symbol": symbol, "side": side, "qty": quantity, "type": "market"}
+        )
+        if order["status"] != "filled":
+            self.rejected += 1
+            return order
+        price = float(order["filled_avg_price"])
+        self.risk.on_fill(symbol, quantity=signed, price=price)
+        self.risk.cash -= float(order["commission"])
+        self.fills.append(
+            {
+                "timestamp": self.clock().isoformat(),
+                "symbol": symbol,
+                "side": side,
+                "quantity": quantity,
+                "price": price,
+                "commission": order["commission"],
+            }
+        )
+        return order
+
+
+@dataclass(frozen=True)
+class BacktestResult:
+    """Equity curve and fills produced by one backtest run."""
+
+    timestamps: npt.NDArray[np.int64]
+    equity: npt.NDArray[np.float64]
+    fills: list[dict[str, object]]
+    rejected: int = 0
+    parameters: Mapping[str, object] = field(default_factory=dict)
+
+    def metrics(self) -> dict[str, float]:
+        """Return P&L, return, maximum drawdown and trade counts."""
+
+        start = end = max_drawdown = 0.0
+        if self.equity.size:
+            start, end = float(self.equity[0]), float(self.equity[-1])
+            peaks = np.maximum.accumulate(self.equity)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                drawdowns = np.where(peaks > 0.0, (peaks - self.equity) / peaks, 0.0)
+            max_drawdown = float(drawdowns.max())
+        return {
+            "pnl": end - start,
+            "return": (end - start) / start if start else 0.0,
+            "max_drawdown": max_drawdown,
+            "trades": float(len(self.fills)),
+            "rejected": float(self.rejected),
+        }
+
+    def to_evaluation_request(self, plan_id: str) -> dict[str, object]:
+        """Return the payload accepted by the evaluator's ``/evaluations`` route."""
+
+        return {"plan_id": plan_id, "fills": self.fills}
+
+
+@dataclass
+class BacktestEngine:
+    """Replay a :class:`QuoteStream` through a strategy as fast as possible.
+
+    Time comes from a :class:`SimulatedClock` installed as the process clock
+    for the duration of :meth:`run`, so any code calling
+    ``goldshore_utils.utc_now`` sees replay time. Each quote updates the
+    simulated broker and the risk engine's marks before the strategy runs;
+    orders pass through :meth:`RiskEngine.check` exactly as in the executor.
+    Equity is sampled after every event.
+    """
+
+    strategy: Strategy
+    cash: float = 100_000.0
+    slippage_bps: float = 0.0
+    commission: float = 0.0
+    policies: Sequence[Policy] = ()
+
+    def run(self, stream: QuoteStream) -> BacktestResult:
+        """Replay ``stream`` and return the resulting equity curve and fills."""
+
+        clock = SimulatedClock(int(stream.timestamps[0]) if len(stream) else 0)
+        broker = SimulatedBroker(
+            cash=self.cash, slippage_bps=self.slippage_bps, commission=self.commission
+        )
+        risk = RiskEngine(cash=self.cash, policies=list(self.policies))
+        context = BacktestContext(clock=clock, risk=risk, broker=broker)
+        equity = np.empty(len(stream), dtype=np.float64)
+
+        strategy = self.strategy
+        on_chain = getattr(strategy, "on_chain", None)
+        chains: Sequence[ChainSnapshot] = stream.chains if on_chain else ()
+        chain_times = [to_nanos(snapshot.timestamp) for snapshot in chains]
+        next_chain = 0
+        next_chain_time = chain_times[0] if chain_times else _NO_CHAIN
+        symbols = stream.symbols
+
+        with use_clock(clock):
+            for index, (nanos, code, bid, ask) in enumerate(
+                zip(
+                    stream.timestamps.tolist(),
+                    stream.codes.tolist(),
+                    stream.bid.tolist(),
+                    stream.ask.tolist(),
+                    strict=True,
+                )
+            ):
+                clock.nanos = nanos
+                while next_chain_time <= nanos:
+                    on_chain(context, chains[next_chain])
+                    next_chain += 1
+                    next_chain_time = (
+                        chain_times[next_chain]
+                        if next_chain < len(chain_times)
+                        else _NO_CHAIN
+                    )
+                symbol = symbols[code]
+                broker.quotes[symbol] = (bid, ask)
+                risk.mark(symbol, 0.5 * (bid + ask))
+                strategy.on_quote(context, symbol, bid, ask)
+                equity[index] = risk.equity
+
+        return BacktestResult(
+            timestamps=stream.timestamps,
+            equity=equity,
+            fills=context.fills,
+            rejected=context.rejected,
+        )
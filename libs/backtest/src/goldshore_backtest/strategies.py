@@ -0,0 +1,47 @@
+"""Reference strategies built on the shared signal library."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+
+from goldshore_signals import SignalBook
+from goldshore_signals.streaming import DEFAULT_WINDOW
+
+from .engine import BacktestContext
+
+
+@dataclass
+class RegimeStrategy:
+    """Hold ``quantity`` long in up-trends, short in down-trends, else flat.
+
+    Regimes come from the same :class:`~goldshore_signals.StreamingSignal`
+    used by the services, fed with quote mids. Positions are flattened while
+    volatility is classified ``high``.
+    """
+
+    quantity: float = 100.0
+    window: int = DEFAULT_WINDOW
+    signals: SignalBook = field(init=False)
+
+    def __post_init__(self) -> None:
+        self.signals = SignalBook(window=self.window)
+
+    def on_quote(
+        self, context: BacktestContext, symbol: str, bid: float, ask: float
+    ) -> None:
+        """Trade toward the target position implied by the latest regime."""
+
+        state = self.signals.update(symbol, 0.5 * (bid + ask))
+        if state.regime == "unknown":
+            return
+        target = 0.0
+        if state.volatility != "high":
+            if state.regime == "trending_up":
+                target = self.quantity
+            elif state.regime == "trending_down":
+                target = -self.quantity
+        difference = target - context.position(symbol)
+        if difference > 0.0:
+            context.submit(symbol, side="buy", quantity=difference)
+        elif difference < 0.0:
+            context.submit(symbol, side="sell", quantity=-difference)
@@ -0,0 +1,61 @@
+"""Parameter sweeps over backtests, optionally across a process pool."""
+
+from __future__ import annotations
+
+import itertools
+from collections.abc import Callable, Mapping, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import replace
+
+from .data import QuoteStream
+from .engine import BacktestEngine, BacktestResult, Strategy
+
+StrategyFactory = Callable[..., Strategy]
+
+
+def parameter_grid(**axes: Sequence[object]) -> list[dict[str, object]]:
+    """Return the Cartesian product of ``axes`` as keyword dictionaries."""
+
+    names = list(axes)
+    return [
+        dict(zip(names, values, strict=True))
+        for values in itertools.product(*(axes[name] for name in names))
+    ]
+
+
+def _run_one(
+    stream: QuoteStream,
+    factory: StrategyFactory,
+    parameters: Mapping[str, object],
+    engine_options: Mapping[str, object],
+) -> BacktestResult:
+    engine = BacktestEngine(strategy=factory(**parameters), **engine_options)
+    return replace(engine.run(stream), parameters=dict(parameters))
+
+
+def run_sweep(
+    stream: QuoteStream,
+    factory: StrategyFactory,
+    grid: Sequence[Mapping[str, object]],
+    *,
+    workers: int = 1,
+    **engine_options: object,
+) -> list[BacktestResult]:
+    """Run one backtest per parameter set in ``grid``, in grid order.
+
+    ``factory`` builds a fresh strategy from each parameter set; with
+    ``workers`` above one it must be importable (for example a class defined
+    at module level) because runs execute in a process pool.
+    ``engine_options`` are passed to every :class:`BacktestEngine`.
+    """
+
+    arguments = (
+        itertools.repeat(stream),
+        itertools.repeat(factory),
+        grid,
+        itertools.repeat(engine_options),
+    )
+    if workers > 1 and len(grid) > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(_run_one, *arguments))
+    return list(map(_run_one, *arguments))
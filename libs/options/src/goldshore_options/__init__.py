@@ -9,13 +9,25 @@ from .greeks import (
     option_theta,
     option_vega,
 )
+from .implied import IVCache, IVResult, implied_volatility_batch
+from .kernel import GreeksBatch, OptionType, price_and_greeks
+from .surface import SmileFit, SVIParameters, VolSurface
 
 __all__ = [
+    "GreeksBatch",
+    "IVCache",
+    "IVResult",
+    "OptionType",
+    "SVIParameters",
+    "SmileFit",
+    "VolSurface",
     "black_scholes_price",
     "implied_volatility",
+    "implied_volatility_batch",
     "option_delta",
     "option_gamma",
     "option_rho",
     "option_theta",
     "option_vega",
+    "price_and_greeks",
 ]
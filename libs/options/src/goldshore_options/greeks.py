@@ -1,8 +1,34 @@
-"""Placeholder Black-Scholes pricers and greeks used by the trading stack."""
+"""Scalar Black-Scholes pricers and greeks used by the trading stack.
 
-from typing import Literal
+Each function is a thin wrapper over :func:`goldshore_options.kernel.price_and_greeks`
+so single-contract callers and batch revaluation share one implementation.
+"""
 
-OptionType = Literal["call", "put"]
+from __future__ import annotations
+
+from .implied import implied_volatility_batch
+from .kernel import GreeksBatch, OptionType, price_and_greeks
+
+
+def _evaluate(
+    *,
+    option_type: OptionType,
+    spot: float,
+    strike: float,
+    time_to_expiry: float,
+    volatility: float,
+    rate: float,
+    dividend_yield: float,
+) -> GreeksBatch:
+    return price_and_greeks(
+        option_type=option_type,
+        spot=spot,
+        strike=strike,
+        time_to_expiry=time_to_expiry,
+        volatility=volatility,
+        rate=rate,
+        dividend_yield=dividend_yield,
+    )
 
 
 def black_scholes_price(
@@ -13,16 +39,25 @@ def black_scholes_price(
     time_to_expiry: float,
     volatility: float,
     rate: float,
+    dividend_yield: float = 0.0,
 ) -> float:
     """Return the theoretical Black-Scholes price for the provided option contract.
 
-    The implementation will eventually plug in a numerically stable closed-form
-    solution with dividend support. For now the function returns ``0.0`` so the
-    surrounding services can be wired together without pricing logic.
+    ``dividend_yield`` is a continuously compounded carry rate, which makes the
+    formula the Black-Scholes-Merton variant used for index options.
     """
 
-    _ = (option_type, spot, strike, time_to_expiry, volatility, rate)
-    return 0.0
+    return float(
+        _evaluate(
+            option_type=option_type,
+            spot=spot,
+            strike=strike,
+            time_to_expiry=time_to_expiry,
+            volatility=volatility,
+            rate=rate,
+            dividend_yield=dividend_yield,
+        ).price
+    )
 
 
 def option_delta(
@@ -33,16 +68,25 @@ def option_delta(
     time_to_expiry: float,
     volatility: float,
     rate: float,
+    dividend_yield: float = 0.0,
 ) -> float:
     """Return the first derivative of price with respect to the underlying.
 
-    Delta will be positive for calls and negative for puts; once implemented it
-    should incorporate discounting and carry costs. The placeholder simply
-    returns ``0.0`` for wiring tests.
+    Delta is positive for calls and negative for puts and is discounted by the
+    dividend yield.
     """
 
-    _ = (option_type, spot, strike, time_to_expiry, volatility, rate)
-    return 0.0
+    return float(
+        _evaluate(
+            option_type=option_type,
+            spot=spot,
+            strike=strike,
+            time_to_expiry=time_to_expiry,
+            volatility=volatility,
+            rate=rate,
+            dividend_yield=dividend_yield,
+        ).delta
+    )
 
 
 def option_gamma(
@@ -52,11 +96,21 @@ def option_gamma(
     time_to_expiry: float,
     volatility: float,
     rate: float,
+    dividend_yield: float = 0.0,
 ) -> float:
     """Return the second derivative of price with respect to the underlying."""
 
-    _ = (spot, strike, time_to_expiry, volatility, rate)
-    return 0.0
+    return float(
+        _evaluate(
+            option_type="call",
+            spot=spot,
+            strike=strike,
+            time_to_expiry=time_to_expiry,
+            volatility=volatility,
+            rate=rate,
+            dividend_yield=dividend_yield,
+        ).gamma
+    )
 
 
 def option_theta(
@@ -67,11 +121,21 @@ def option_theta(
     time_to_expiry: float,
     volatility: float,
     rate: float,
+    dividend_yield: float = 0.0,
 ) -> float:
-    """Return the time decay of the option's value under Black-Scholes."""
+    """Return the time decay of the option's value under Black-Scholes, per year."""
 
-    _ = (option_type, spot, strike, time_to_expiry, volatility, rate)
-    return 0.0
+    return float(
+        _evaluate(
+            option_type=option_type,
+            spot=spot,
+            strike=strike,
+            time_to_expiry=time_to_expiry,
+            volatility=volatility,
+            rate=rate,
+            dividend_yield=dividend_yield,
+        ).theta
+    )
 
 
 def option_vega(
@@ -81,11 +145,21 @@ def option_vega(
     time_to_expiry: float,
     volatility: float,
     rate: float,
+    dividend_yield: float = 0.0,
 ) -> float:
-    """Return the sensitivity of price to volatility changes."""
+    """Return the sensitivity of price to a unit change in volatility."""
 
-    _ = (spot, strike, time_to_expiry, volatility, rate)
-    return 0.0
+    return float(
+        _evaluate(
+            option_type="call",
+            spot=spot,
+            strike=strike,
+            time_to_expiry=time_to_expiry,
+            volatility=volatility,
+            rate=rate,
+            dividend_yield=dividend_yield,
+        ).vega
+    )
 
 
 def option_rho(
@@ -96,11 +170,21 @@ def option_rho(
     time_to_expiry: float,
     volatility: float,
     rate: float,
+    dividend_yield: float = 0.0,
 ) -> float:
-    """Return the sensitivity of price to interest-rate shifts."""
+    """Return the sensitivity of price to a unit shift in interest rates."""
 
-    _ = (option_type, spot, strike, time_to_expiry, volatility, rate)
-    return 0.0
+    return float(
+        _evaluate(
+            option_type=option_type,
+            spot=spot,
+            strike=strike,
+            time_to_expiry=time_to_expiry,
+            volatility=volatility,
+            rate=rate,
+            dividend_yield=dividend_yield,
+        ).rho
+    )
 
 
 def implied_volatility(
@@ -112,13 +196,25 @@ def implied_volatility(
     rate: float,
     target_price: float,
     initial_guess: float = 0.2,
+    dividend_yield: float = 0.0,
 ) -> float:
-    """Return a placeholder implied volatility using root finding in production.
+    """Return the volatility that reproduces ``target_price`` under Black-Scholes.
 
-    The final implementation will execute a Newton-Raphson search bounded to
-    realistic volatility ranges. For now we echo the ``initial_guess`` to unblock
-    callers wiring together data flows.
+    Delegates to :func:`goldshore_options.implied.implied_volatility_batch`,
+    which runs a bracketed Newton-Raphson search starting from
+    ``initial_guess``. Returns ``NaN`` when the price violates no-arbitrage
+    bounds and no volatility can reproduce it.
     """
 
-    _ = (option_type, spot, strike, time_to_expiry, rate, target_price)
-    return float(initial_guess)
+    return float(
+        implied_volatility_batch(
+            option_type=option_type,
+            spot=spot,
+            strike=strike,
+            time_to_expiry=time_to_expiry,
+            rate=rate,
+            target_price=target_price,
+            dividend_yield=dividend_yield,
+            initial_guess=initial_guess,
+        ).volatility
+    )
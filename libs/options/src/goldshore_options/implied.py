@@ -0,0 +1,247 @@
+"""Batched implied-volatility inversion with warm starts."""
+
+from __future__ import annotations
+
+from collections.abc import Hashable, Iterable, Sequence
+from dataclasses import dataclass, field
+
+import numpy as np
+import numpy.typing as npt
+from goldshore_utils.metrics import timed
+
+from .kernel import ArrayLike, OptionTypeLike, call_mask, d1_d2, norm_cdf, norm_pdf
+
+_MIN_VEGA = 1e-12
+_FALLBACK_GUESS = 0.3
+
+
+@dataclass(frozen=True)
+class IVResult:
+    """Implied volatilities alongside per-contract convergence statistics.
+
+    ``volatility`` is ``NaN`` wherever the target price violates no-arbitrage
+    bounds, implies a volatility outside the solver's ``[lower, upper]``
+    range or the solver ran out of iterations; ``converged`` flags the
+    successful entries and ``iterations`` counts the pricing passes spent.
+    """
+
+    volatility: npt.NDArray[np.float64]
+    iterations: npt.NDArray[np.int64]
+    converged: npt.NDArray[np.bool_]
+
+    @property
+    def failures(self) -> int:
+        """Return the number of contracts that did not converge."""
+
+        return int(self.converged.size - np.count_nonzero(self.converged))
+
+    @property
+    def max_iterations(self) -> int:
+        """Return the largest iteration count spent on any single contract."""
+
+        return int(self.iterations.max(initial=0))
+
+
+@dataclass
+class IVCache:
+    """Warm-start store mapping contract keys to their last solved volatility."""
+
+    entries: dict[Hashable, float] = field(default_factory=dict)
+
+    def lookup(self, keys: Iterable[Hashable]) -> npt.NDArray[np.float64]:
+        """Return cached volatilities for ``keys`` with ``NaN`` for misses."""
+
+        get = self.entries.get
+        nan = float("nan")
+        return np.fromiter((get(key, nan) for key in keys), dtype=np.float64)
+
+    def store(
+        self,
+        keys: Sequence[Hashable],
+        result: IVResult,
+    ) -> None:
+        """Record the converged volatilities from ``result`` under ``keys``."""
+
+        vols = result.volatility.reshape(-1).tolist()
+        flags = result.converged.reshape(-1).tolist()
+        self.entries.update(
+            (key, vol) for key, vol, ok in zip(keys, vols, flags, strict=True) if ok
+        )
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+
+def _price_and_vega(
+    *,
+    phi: npt.NDArray[np.float64],
+    spot: npt.NDArray[np.float64],
+    strike: npt.NDArray[np.float64],
+    time_to_expiry: npt.NDArray[np.float64],
+    volatility: npt.NDArray[np.float64],
+    rate: npt.NDArray[np.float64],
+    dividend_yield: npt.NDArray[np.float64],
+) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]:
+    d1, d2, _, _ = d1_d2(
+        spot=spot,
+        strike=strike,
+        time_to_expiry=time_to_expiry,
+        volatility=volatility,
+        rate=rate,
+        dividend_yield=dividend_yield,
+    )
+    forward_spot = spot * np.exp(-dividend_yield * time_to_expiry)
+    discounted_strike = strike * np.exp(-rate * time_to_expiry)
+    price = phi * (
+        forward_spot * norm_cdf(phi * d1) - discounted_strike * norm_cdf(phi * d2)
+    )
+    vega = forward_spot * norm_pdf(d1) * np.sqrt(time_to_expiry)
+    return price, vega
+
+
+def _rational_guess(
+    *,
+    call_price: npt.NDArray[np.float64],
+    forward_spot: npt.NDArray[np.float64],
+    discounted_strike: npt.NDArray[np.float64],
+    time_to_expiry: npt.NDArray[np.float64],
+) -> npt.NDArray[np.float64]:
+    """Return the Corrado-Miller closed-form approximation to implied volatility."""
+
+    half_moneyness = 0.5 * (forward_spot - discounted_strike)
+    excess = call_price - half_moneyness
+    radicand = excess * excess - (forward_spot - discounted_strike) ** 2 / np.pi
+    guess = (
+        np.sqrt(2.0 * np.pi / time_to_expiry)
+        / (forward_spot + discounted_strike)
+        * (excess + np.sqrt(np.maximum(radicand, 0.0)))
+    )
+    return np.where(np.isfinite(guess) & (guess > 0.0), guess, _FALLBACK_GUESS)
+
+
+@timed("goldshore_options_iv_solve_seconds", "Batch implied volatility solve")
+def implied_volatility_batch(  # noqa: PLR0915
+    *,
+    option_type: OptionTypeLike,
+    spot: ArrayLike,
+    strike: ArrayLike,
+    time_to_expiry: ArrayLike,
+    rate: ArrayLike,
+    target_price: ArrayLike,
+    dividend_yield: ArrayLike = 0.0,
+    initial_guess: ArrayLike | None = None,
+    keys: Sequence[Hashable] | None = None,
+    cache: IVCache | None = None,
+    tolerance: float = 1e-8,
+    max_iterations: int = 50,
+    lower: float = 1e-4,
+    upper: float = 5.0,
+) -> IVResult:
+    """Solve implied volatility for a whole chain in one vectorised pass.
+
+    Each contract runs a Newton iteration on vega inside a per-contract
+    ``[lower, upper]`` bracket that tightens after every pricing pass; whenever
+    the Newton step leaves the bracket or vega vanishes (deep ITM/OTM wings)
+    the update falls back to bisection, so every contract converges or is
+    reported as a failure. Starting points come from ``cache`` (keyed by
+    ``keys``), then ``initial_guess``, then the Corrado-Miller approximation.
+    Only contracts still iterating are repriced on each pass.
+    """
+
+    is_call, s, k, t, r, q, target = np.broadcast_arrays(
+        call_mask(option_type),
+        *(
+            np.asarray(value, dtype=np.float64)
+            for value in (
+                spot,
+                strike,
+                time_to_expiry,
+                rate,
+                dividend_yield,
+                target_price,
+            )
+        ),
+    )
+    shape = is_call.shape
+    phi = np.where(is_call, 1.0, -1.0).reshape(-1)
+    s, k, t, r, q, target = (array.reshape(-1) for array in (s, k, t, r, q, target))
+    size = phi.size
+
+    forward_spot = s * np.exp(-q * t)
+    discounted_strike = k * np.exp(-r * t)
+    intrinsic = np.maximum(phi * (forward_spot - discounted_strike), 0.0)
+    ceiling = np.where(phi > 0.0, forward_spot, discounted_strike)
+    solvable = (t > 0.0) & (target > intrinsic) & (target < ceiling)
+
+    guess = np.full(size, np.nan)
+    if cache is not None and keys is not None:
+        guess = cache.lookup(keys)
+    if initial_guess is not None:
+        fallback = np.broadcast_to(np.asarray(initial_guess, dtype=np.float64), shape)
+        guess = np.where(np.isnan(guess), fallback.reshape(-1), guess)
+    missing = np.isnan(guess) & solvable
+    if missing.any():
+        call_price = target[missing] + np.where(
+            phi[missing] > 0.0,
+            0.0,
+            forward_spot[missing] - discounted_strike[missing],
+        )
+        guess[missing] = _rational_guess(
+            call_price=call_price,
+            forward_spot=forward_spot[missing],
+            discounted_strike=discounted_strike[missing],
+            time_to_expiry=t[missing],
+        )
+
+    volatility = np.full(size, np.nan)
+    iterations = np.zeros(size, dtype=np.int64)
+    converged = np.zeros(size, dtype=bool)
+
+    active = np.flatnonzero(solvable)
+    sigma = np.clip(guess[active], lower, upper)
+    low = np.full(active.size, lower)
+    high = np.full(active.size, upper)
+
+    for _ in range(max_iterations):
+        if active.size == 0:
+            break
+        price, vega = _price_and_vega(
+            phi=phi[active],
+            spot=s[active],
+            strike=k[active],
+            time_to_expiry=t[active],
+            volatility=sigma,
+            rate=r[active],
+            dividend_yield=q[active],
+        )
+        iterations[active] += 1
+        error = price - target[active]
+
+        accurate = np.abs(error) <= tolerance
+        collapsed = high - low <= tolerance * 1e-2
+        # A bracket collapsed onto ``lower`` or ``upper`` means the price
+        # implies a volatility outside the search range, not a root.
+        solved = accurate | (collapsed & (low > lower) & (high < upper))
+        done = accurate | collapsed
+        if done.any():
+            volatility[active[solved]] = sigma[solved]
+            converged[active[solved]] = True
+            keep = ~done
+            active, sigma, low, high = active[keep], sigma[keep], low[keep], high[keep]
+            error, vega = error[keep], vega[keep]
+
+        above = error > 0.0
+        high = np.where(above, sigma, high)
+        low = np.where(above, low, sigma)
+        newton = sigma - error / np.maximum(vega, _MIN_VEGA)
+        bracketed = (vega > _MIN_VEGA) & (newton > low) & (newton < high)
+        sigma = np.where(bracketed, newton, 0.5 * (low + high))
+
+    result = IVResult(
+        volatility=volatility.reshape(shape),
+        iterations=iterations.reshape(shape),
+        converged=converged.reshape(shape),
+    )
+    if cache is not None and keys is not None:
+        cache.store(keys, result)
+    return result
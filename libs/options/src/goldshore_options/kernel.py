@@ -0,0 +1,277 @@
+"""Vectorised Black-Scholes-Merton kernel shared by the scalar and batch pricers."""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import Literal
+
+import numpy as np
+import numpy.typing as npt
+from goldshore_utils.metrics import timed
+
+OptionType = Literal["call", "put"]
+
+ArrayLike = float | Sequence[float] | npt.NDArray[np.float64]
+OptionTypeLike = OptionType | bool | Sequence[str] | npt.NDArray[np.generic]
+
+_SQRT_2PI = 2.5066282746310002
+_TAIL_CUTOFF = 7.07106781186547
+_UNDERFLOW_CUTOFF = 37.0
+_CDF_NUMERATOR = (
+    3.52624965998911e-02,
+    0.700383064443688,
+    6.37396220353165,
+    33.912866078383,
+    112.079291497871,
+    221.213596169931,
+)
+_CDF_NUMERATOR_CONSTANT = 220.206867912376
+_CDF_DENOMINATOR = (
+    8.83883476483184e-02,
+    1.75566716318264,
+    16.064177579207,
+    86.7807322029461,
+    296.564248779674,
+    637.333633378831,
+    793.826512519948,
+)
+_CDF_DENOMINATOR_CONSTANT = 440.413735824752
+
+# Contracts are evaluated in blocks so every temporary stays cache resident;
+# 8192 doubles (64 KiB) per intermediate roughly halves the wall time of a
+# 100k-contract revaluation compared with whole-array evaluation.
+_BLOCK_SIZE = 8192
+
+
+@dataclass(frozen=True)
+class GreeksBatch:
+    """Prices and first-order sensitivities for a batch of contracts.
+
+    Every field is an array broadcast to the common shape of the inputs. Theta
+    is expressed per year, vega per unit of volatility and rho per unit of rate
+    so callers can rescale to per-day or per-point conventions themselves.
+    """
+
+    price: npt.NDArray[np.float64]
+    delta: npt.NDArray[np.float64]
+    gamma: npt.NDArray[np.float64]
+    theta: npt.NDArray[np.float64]
+    vega: npt.NDArray[np.float64]
+    rho: npt.NDArray[np.float64]
+
+    def __len__(self) -> int:
+        return int(self.price.size)
+
+
+def norm_pdf(x: npt.NDArray[np.float64]) -> npt.NDArray[np.float64]:
+    """Return the standard normal density evaluated element-wise."""
+
+    return np.exp(-0.5 * x * x) / _SQRT_2PI
+
+
+def norm_cdf(x: npt.NDArray[np.float64]) -> npt.NDArray[np.float64]:
+    """Return the standard normal CDF using Hart's double-precision approximation.
+
+    NumPy ships no ``erf`` ufunc, so the rational approximation (absolute error
+    below ``1e-15``) keeps the kernel free of a SciPy dependency. Polynomials
+    are evaluated in place to avoid a temporary per Horner step.
+    """
+
+    x = np.asarray(x, dtype=np.float64)
+    z = np.abs(x).reshape(-1)
+
+    numerator = z * _CDF_NUMERATOR[0]
+    for coefficient in _CDF_NUMERATOR[1:]:
+        numerator += coefficient
+        numerator *= z
+    numerator += _CDF_NUMERATOR_CONSTANT
+    denominator = z * _CDF_DENOMINATOR[0]
+    for coefficient in _CDF_DENOMINATOR[1:]:
+        denominator += coefficient
+        denominator *= z
+    denominator += _CDF_DENOMINATOR_CONSTANT
+
+    exponential = z * z
+    exponential *= -0.5
+    np.exp(exponential, out=exponential)
+    tail = numerator
+    tail *= exponential
+    tail /= denominator
+
+    far = z >= _TAIL_CUTOFF
+    if far.any():
+        zf = z[far]
+        fraction = zf + 0.65
+        fraction = zf + 4.0 / fraction
+        fraction = zf + 3.0 / fraction
+        fraction = zf + 2.0 / fraction
+        fraction = zf + 1.0 / fraction
+        tail[far] = exponential[far] / fraction / _SQRT_2PI
+        tail[z > _UNDERFLOW_CUTOFF] = 0.0
+
+    tail = tail.reshape(x.shape)
+    return np.where(x > 0.0, 1.0 - tail, tail)
+
+
+def call_mask(option_type: OptionTypeLike) -> npt.NDArray[np.bool_]:
+    """Return a boolean array that is ``True`` where ``option_type`` is a call.
+
+    Accepts a single ``"call"``/``"put"`` literal, a sequence or array of those
+    strings, or a boolean array that already encodes calls as ``True``.
+    """
+
+    if isinstance(option_type, str):
+        if option_type not in ("call", "put"):
+            raise ValueError(f"Unsupported option type: {option_type!r}")
+        return np.asarray(option_type == "call")
+
+    values = np.asarray(option_type)
+    if values.dtype == np.bool_:
+        return values
+
+    is_call = values == "call"
+    if not np.all(is_call | (values == "put")):
+        raise ValueError("option_type entries must be 'call' or 'put'")
+    return is_call
+
+
+def d1_d2(
+    *,
+    spot: npt.NDArray[np.float64],
+    strike: npt.NDArray[np.float64],
+    time_to_expiry: npt.NDArray[np.float64],
+    volatility: npt.NDArray[np.float64],
+    rate: npt.NDArray[np.float64],
+    dividend_yield: npt.NDArray[np.float64],
+) -> tuple[
+    npt.NDArray[np.float64],
+    npt.NDArray[np.float64],
+    npt.NDArray[np.float64],
+    npt.NDArray[np.bool_],
+]:
+    """Return ``d1``, ``d2``, ``sigma * sqrt(T)`` and the mask of live contracts.
+
+    Contracts with no remaining time value (expired or zero volatility) are
+    flagged as not live; their ``d1``/``d2`` entries are finite placeholders
+    that callers must override with intrinsic values.
+    """
+
+    sqrt_t = np.sqrt(np.maximum(time_to_expiry, 0.0))
+    sigma_sqrt_t = volatility * sqrt_t
+    live = sigma_sqrt_t > 0.0
+    safe = np.where(live, sigma_sqrt_t, 1.0)
+    d1 = (
+        np.log(spot / strike)
+        + (rate - dividend_yield + 0.5 * volatility * volatility) * time_to_expiry
+    ) / safe
+    return d1, d1 - safe, sigma_sqrt_t, live
+
+
+def _evaluate_block(
+    *,
+    is_call: npt.NDArray[np.bool_],
+    spot: npt.NDArray[np.float64],
+    strike: npt.NDArray[np.float64],
+    time_to_expiry: npt.NDArray[np.float64],
+    volatility: npt.NDArray[np.float64],
+    rate: npt.NDArray[np.float64],
+    dividend_yield: npt.NDArray[np.float64],
+    out: npt.NDArray[np.float64],
+) -> None:
+    s, k, v, r, q = spot, strike, volatility, rate, dividend_yield
+    phi = np.where(is_call, 1.0, -1.0)
+    t = np.maximum(time_to_expiry, 0.0)
+
+    d1, d2, sigma_sqrt_t, live = d1_d2(
+        spot=s, strike=k, time_to_expiry=t, volatility=v, rate=r, dividend_yield=q
+    )
+    carry = np.exp(-q * t)
+    discount = np.exp(-r * t)
+    forward_spot = s * carry
+    discounted_strike = k * discount
+    sqrt_t = np.sqrt(t)
+
+    cdf_d1 = norm_cdf(phi * d1)
+    cdf_d2 = norm_cdf(phi * d2)
+    pdf_d1 = norm_pdf(d1)
+    weighted_d1 = forward_spot * cdf_d1
+    weighted_d2 = discounted_strike * cdf_d2
+    spot_pdf = forward_spot * pdf_d1
+
+    price, delta, gamma, theta, vega, rho = out
+    np.multiply(phi, weighted_d1 - weighted_d2, out=price)
+    np.multiply(phi * carry, cdf_d1, out=delta)
+    np.divide(carry * pdf_d1, s * np.where(live, sigma_sqrt_t, 1.0), out=gamma)
+    np.multiply(spot_pdf, sqrt_t, out=vega)
+    np.multiply(phi, q * weighted_d1 - r * weighted_d2, out=theta)
+    theta -= spot_pdf * v / (2.0 * np.where(t > 0.0, sqrt_t, 1.0))
+    np.multiply(phi * t, weighted_d2, out=rho)
+
+    if not live.all():
+        dead = ~live
+        intrinsic = phi * (forward_spot - discounted_strike)
+        in_the_money = intrinsic > 0.0
+        carry_theta = phi * (q * forward_spot - r * discounted_strike)
+        price[dead] = np.maximum(intrinsic, 0.0)[dead]
+        delta[dead] = np.where(in_the_money, phi * carry, 0.0)[dead]
+        gamma[dead] = 0.0
+        vega[dead] = 0.0
+        theta[dead] = np.where(in_the_money, carry_theta, 0.0)[dead]
+        rho[dead] = np.where(in_the_money, phi * discounted_strike * t, 0.0)[dead]
+
+
+@timed("goldshore_options_price_seconds", "Batch option pricing and greeks")
+def price_and_greeks(
+    *,
+    option_type: OptionTypeLike,
+    spot: ArrayLike,
+    strike: ArrayLike,
+    time_to_expiry: ArrayLike,
+    volatility: ArrayLike,
+    rate: ArrayLike,
+    dividend_yield: ArrayLike = 0.0,
+) -> GreeksBatch:
+    """Price a batch of European options and compute all greeks in one pass.
+
+    Inputs broadcast against each other, so a single spot can be combined with
+    arrays of strikes and expiries. ``d1``/``d2``, the discount factors and the
+    normal CDF/PDF evaluations are computed once and shared by every output.
+    """
+
+    is_call, *inputs = np.broadcast_arrays(
+        call_mask(option_type),
+        *(
+            np.asarray(value, dtype=np.float64)
+            for value in (
+                spot,
+                strike,
+                time_to_expiry,
+                volatility,
+                rate,
+                dividend_yield,
+            )
+        ),
+    )
+    shape = is_call.shape
+    flags = is_call.reshape(-1)
+    s, k, t, v, r, q = (array.reshape(-1) for array in inputs)
+    out = np.empty((6, flags.size), dtype=np.float64)
+
+    for start in range(0, flags.size, _BLOCK_SIZE):
+        block = slice(start, start + _BLOCK_SIZE)
+        _evaluate_block(
+            is_call=flags[block],
+            spot=s[block],
+            strike=k[block],
+            time_to_expiry=t[block],
+            volatility=v[block],
+            rate=r[block],
+            dividend_yield=q[block],
+            out=out[:, block],
+        )
+
+    price, delta, gamma, theta, vega, rho = out.reshape((6, *shape))
+    return GreeksBatch(
+        price=price, delta=delta, gamma=gamma, theta=theta, vega=vega, rho=rho
+    )
@@ -0,0 +1,322 @@
+"""Incrementally maintained implied-volatility surface."""
+
+from __future__ import annotations
+
+import math
+from collections.abc import Hashable, Sequence
+from dataclasses import dataclass, field
+from datetime import date
+
+import numpy as np
+import numpy.typing as npt
+
+from .implied import IVCache, implied_volatility_batch
+from .kernel import ArrayLike, OptionTypeLike
+
+DAYS_PER_YEAR = 365.0
+# Raw SVI has five parameters; thinner smiles are interpolated instead.
+MIN_SVI_QUOTES = 5
+
+_SIGMA_GRID = np.geomspace(0.01, 1.5, 12)
+_CENTRE_POINTS = 12
+_REFINEMENTS = 3
+
+DateLike = date | np.datetime64 | str
+DatesLike = DateLike | Sequence[DateLike] | npt.NDArray[np.datetime64]
+
+
+def _as_days(expiry: DatesLike) -> npt.NDArray[np.datetime64]:
+    return np.asarray(expiry, dtype="datetime64[D]")
+
+
+@dataclass(frozen=True)
+class SVIParameters:
+    """Raw SVI parameters ``w(k) = a + b (rho (k - m) + sqrt((k - m)^2 + sigma^2))``."""
+
+    a: float
+    b: float
+    rho: float
+    m: float
+    sigma: float
+
+    def total_variance(
+        self, log_moneyness: npt.NDArray[np.float64]
+    ) -> npt.NDArray[np.float64]:
+        """Return total implied variance at ``log_moneyness``."""
+
+        shifted = log_moneyness - self.m
+        return self.a + self.b * (
+            self.rho * shifted + np.sqrt(shifted * shifted + self.sigma * self.sigma)
+        )
+
+
+@dataclass(frozen=True)
+class SmileFit:
+    """Cached smile for one expiry in log-forward-moneyness space.
+
+    ``parameters`` holds the SVI fit when the slice has enough quotes; thinner
+    slices fall back to linear interpolation of total variance between the
+    quoted ``knots`` with flat extrapolation.
+    """
+
+    time_to_expiry: float
+    forward: float
+    knots: npt.NDArray[np.float64]
+    knot_variance: npt.NDArray[np.float64]
+    parameters: SVIParameters | None = None
+
+    def total_variance(
+        self, log_moneyness: npt.NDArray[np.float64]
+    ) -> npt.NDArray[np.float64]:
+        """Return total implied variance for ``log_moneyness``."""
+
+        if self.parameters is not None:
+            return np.maximum(self.parameters.total_variance(log_moneyness), 0.0)
+        return np.interp(log_moneyness, self.knots, self.knot_variance)
+
+    def strike_variance(
+        self, strikes: npt.NDArray[np.float64]
+    ) -> npt.NDArray[np.float64]:
+        """Return total implied variance at ``strikes`` against the fit forward."""
+
+        return self.total_variance(np.log(strikes / self.forward))
+
+
+def fit_svi(
+    log_moneyness: npt.NDArray[np.float64],
+    total_variance: npt.NDArray[np.float64],
+) -> SVIParameters | None:
+    """Fit raw SVI with the quasi-explicit method.
+
+    For fixed ``(m, sigma)`` the remaining parameters enter linearly, so each
+    candidate is solved with a 3x3 least-squares system; the ``(m, sigma)``
+    grid is evaluated as one batched solve and refined around the best point.
+    Returns ``None`` when no candidate satisfies the no-arbitrage constraints
+    ``b >= 0``, ``|rho| <= 1`` and non-negative minimum variance.
+    """
+
+    k = np.asarray(log_moneyness, dtype=np.float64)
+    w = np.asarray(total_variance, dtype=np.float64)
+    centres = np.linspace(k.min(), k.max(), _CENTRE_POINTS)
+    sigmas = _SIGMA_GRID
+    best: tuple[float, SVIParameters] | None = None
+
+    for _ in range(_REFINEMENTS):
+        m_grid, s_grid = (grid.reshape(-1) for grid in np.meshgrid(centres, sigmas))
+        shifted = k[None, :] - m_grid[:, None]
+        root = np.sqrt(shifted * shifted + s_grid[:, None] ** 2)
+        design = np.stack([np.ones_like(shifted), shifted, root], axis=2)
+        normal = np.einsum("gni,gnj->gij", design, design)
+        rhs = np.einsum("gni,n->gi", design, w)
+        try:
+            coefficients = np.linalg.solve(normal, rhs[..., None])[..., 0]
+        except np.linalg.LinAlgError:
+            coefficients = np.stack(
+                [
+                    np.linalg.lstsq(a, b, rcond=None)[0]
+                    for a, b in zip(normal, rhs, strict=True)
+                ]
+            )
+        a, c, d = coefficients.T
+        residual = np.einsum("gni,gi->gn", design, coefficients) - w
+        error = np.einsum("gn,gn->g", residual, residual)
+        minimum = a + np.sqrt(np.maximum(d * d - c * c, 0.0)) * s_grid
+        feasible = (d >= 0.0) & (np.abs(c) <= d) & (minimum >= 0.0)
+        error = np.where(feasible, error, np.inf)
+
+        index = int(np.argmin(error))
+        if np.isfinite(error[index]) and (best is None or error[index] < best[0]):
+            b = float(d[index])
+            best = (
+                float(error[index]),
+                SVIParameters(
+                    a=float(a[index]),
+                    b=b,
+                    rho=float(c[index] / b) if b > 0.0 else 0.0,
+                    m=float(m_grid[index]),
+                    sigma=float(s_grid[index]),
+                ),
+            )
+        if best is None:
+            return None
+
+        centre_step = (centres[-1] - centres[0]) / (_CENTRE_POINTS - 1) or 0.01
+        sigma_ratio = float(sigmas[1] / sigmas[0])
+        centres = np.linspace(
+            best[1].m - centre_step, best[1].m + centre_step, _CENTRE_POINTS
+        )
+        sigmas = np.geomspace(
+            best[1].sigma / sigma_ratio, best[1].sigma * sigma_ratio, len(_SIGMA_GRID)
+        )
+
+    return best[1] if best is not None else None
+
+
+@dataclass
+class VolSurface:
+    """Implied-volatility surface keyed by expiry and strike.
+
+    Quotes update incrementally: each change marks only its expiry dirty and
+    the next lookup refits just the dirty slices, reusing cached
+    :class:`SmileFit` objects for the rest. Smiles are fitted in
+    log-forward-moneyness using the spot at fit time and are evaluated
+    against that same forward, so between refits the surface behaves
+    sticky-strike. Between listed expiries total variance is interpolated
+    linearly in time at constant strike.
+    """
+
+    spot: float
+    as_of: date
+    rate: float = 0.0
+    dividend_yield: float = 0.0
+    quotes: dict[np.datetime64, dict[float, float]] = field(default_factory=dict)
+    fits: dict[np.datetime64, SmileFit] = field(default_factory=dict)
+    dirty: set[np.datetime64] = field(default_factory=set)
+
+    def time_to_expiry(self, expiry: DatesLike) -> npt.NDArray[np.float64]:
+        """Return ACT/365 year fractions between ``as_of`` and ``expiry``."""
+
+        days = (_as_days(expiry) - np.datetime64(self.as_of, "D")).astype(np.float64)
+        return days / DAYS_PER_YEAR
+
+    def forward(self, time_to_expiry: ArrayLike) -> npt.NDArray[np.float64]:
+        """Return the forward price of the underlying for ``time_to_expiry``."""
+
+        t = np.asarray(time_to_expiry, dtype=np.float64)
+        return self.spot * np.exp((self.rate - self.dividend_yield) * t)
+
+    def update_quotes(
+        self,
+        expiry: DateLike,
+        strikes: ArrayLike,
+        volatilities: ArrayLike,
+    ) -> None:
+        """Insert or overwrite implied volatilities for one expiry.
+
+        ``NaN`` volatilities remove the corresponding strikes.
+        """
+
+        key = _as_days(expiry)[()]
+        if self.time_to_expiry(key) <= 0.0:
+            raise ValueError(f"Expiry {key} is not after {self.as_of}")
+        smile = self.quotes.setdefault(key, {})
+        strike_list = np.atleast_1d(np.asarray(strikes, dtype=np.float64)).tolist()
+        vol_list = np.broadcast_to(
+            np.asarray(volatilities, dtype=np.float64), (len(strike_list),)
+        ).tolist()
+        for strike, vol in zip(strike_list, vol_list, strict=True):
+            if math.isnan(vol):
+                smile.pop(strike, None)
+            else:
+                smile[strike] = vol
+        if not smile:
+            del self.quotes[key]
+            self.fits.pop(key, None)
+            self.dirty.discard(key)
+            return
+        self.dirty.add(key)
+
+    def update_quote(self, expiry: DateLike, strike: float, volatility: float) -> None:
+        """Insert or overwrite the implied volatility of a single contract."""
+
+        self.update_quotes(expiry, strike, volatility)
+
+    def update_from_prices(  # noqa: PLR0913
+        self,
+        expiry: DateLike,
+        *,
+        option_type: OptionTypeLike,
+        strikes: ArrayLike,
+        prices: ArrayLike,
+        keys: Sequence[Hashable] | None = None,
+        cache: IVCache | None = None,
+    ) -> int:
+        """Invert option prices for one expiry and store the resulting quotes.
+
+        Returns the number of contracts whose volatility failed to converge;
+        those strikes are left out of the smile.
+        """
+
+        result = implied_volatility_batch(
+            option_type=option_type,
+            spot=self.spot,
+            strike=strikes,
+            time_to_expiry=self.time_to_expiry(expiry),
+            rate=self.rate,
+            dividend_yield=self.dividend_yield,
+            target_price=prices,
+            keys=keys,
+            cache=cache,
+        )
+        self.update_quotes(expiry, strikes, result.volatility)
+        return result.failures
+
+    def refit(self) -> list[np.datetime64]:
+        """Refit every dirty expiry and return the expiries that changed."""
+
+        refitted = sorted(self.dirty)
+        for key in refitted:
+            smile = self.quotes[key]
+            t = float(self.time_to_expiry(key))
+            forward = float(self.forward(t))
+            strikes = np.fromiter(smile.keys(), dtype=np.float64, count=len(smile))
+            vols = np.fromiter(smile.values(), dtype=np.float64, count=len(smile))
+            order = np.argsort(strikes)
+            k = np.log(strikes[order] / forward)
+            w = vols[order] ** 2 * t
+            parameters = fit_svi(k, w) if k.size >= MIN_SVI_QUOTES else None
+            self.fits[key] = SmileFit(
+                time_to_expiry=t,
+                forward=forward,
+                knots=k,
+                knot_variance=w,
+                parameters=parameters,
+            )
+        self.dirty.clear()
+        return refitted
+
+    def vol(self, strike: ArrayLike, expiry: DatesLike) -> npt.NDArray[np.float64]:
+        """Return implied volatilities for broadcast ``strike``/``expiry`` arrays.
+
+        Dirty expiries are refitted first. Expiries before the first listed
+        slice or after the last reuse the nearest slice's volatility at the
+        same strike.
+        """
+
+        if self.dirty:
+            self.refit()
+        if not self.fits:
+            raise LookupError("Volatility surface has no quotes")
+
+        strikes, expiries = np.broadcast_arrays(
+            np.asarray(strike, dtype=np.float64), _as_days(expiry)
+        )
+        out = np.empty(strikes.shape, dtype=np.float64)
+        listed = np.array(sorted(self.fits), dtype="datetime64[D]")
+
+        for key in np.unique(expiries):
+            mask = expiries == key
+            t = float(self.time_to_expiry(key))
+            if t <= 0.0:
+                raise ValueError(f"Expiry {key} is not after {self.as_of}")
+            strikes_at = strikes[mask]
+            position = int(np.searchsorted(listed, key))
+            if position < listed.size and listed[position] == key:
+                variance = self.fits[key].strike_variance(strikes_at)
+            elif position in (0, listed.size):
+                nearest = self.fits[listed[min(position, listed.size - 1)]]
+                variance = (
+                    nearest.strike_variance(strikes_at) / nearest.time_to_expiry * t
+                )
+            else:
+                before = self.fits[listed[position - 1]]
+                after = self.fits[listed[position]]
+                weight = (t - before.time_to_expiry) / (
+                    after.time_to_expiry - before.time_to_expiry
+                )
+                variance = (1.0 - weight) * before.strike_variance(
+                    strikes_at
+                ) + weight * after.strike_variance(strikes_at)
+            out[mask] = np.sqrt(variance / t)
+
+        return out
@@ -1,5 +1,24 @@
 """Risk policy primitives for Gold Shore."""
 
-from .policies import DrawdownPolicy, PositionLimitPolicy, VolatilityPolicy
+from .engine import RiskDecision, RiskEngine, RiskSnapshot
+from .policies import DrawdownPolicy, Policy, PositionLimitPolicy, VolatilityPolicy
+from .scenarios import (
+    PortfolioPositions,
+    ScenarioEngine,
+    ScenarioResult,
+    Scenarios,
+)
 
-__all__ = ["DrawdownPolicy", "PositionLimitPolicy", "VolatilityPolicy"]
+__all__ = [
+    "DrawdownPolicy",
+    "Policy",
+    "PortfolioPositions",
+    "PositionLimitPolicy",
+    "RiskDecision",
+    "RiskEngine",
+    "RiskSnapshot",
+    "ScenarioEngine",
+    "ScenarioResult",
+    "Scenarios",
+    "VolatilityPolicy",
+]
@@ -0,0 +1,236 @@
+"""Incrementally maintained portfolio aggregates for pre-trade risk checks."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+
+from goldshore_utils.metrics import timed
+
+from .policies import Policy
+
+
+@dataclass(frozen=True)
+class RiskSnapshot:
+    """Portfolio aggregates at a point in time; satisfies ``RiskContext``."""
+
+    portfolio_value: float
+    open_risk: float
+    drawdown: float
+    volatility: float
+    gross_exposure: float
+    net_exposure: float
+
+
+@dataclass(frozen=True)
+class RiskDecision:
+    """Outcome of a pre-trade check with the names of breached policies."""
+
+    approved: bool
+    breaches: tuple[str, ...] = ()
+    proposed_notional: float = 0.0
+
+
+@dataclass
+class _OpenOrder:
+    symbol: str
+    notional: float
+    price: float
+
+
+@dataclass
+class RiskEngine:
+    """Running portfolio state evaluated by every registered policy at once.
+
+    Positions, marks, gross/net exposure, the notional of working orders and
+    peak equity are updated in place by :meth:`on_fill`, :meth:`mark`,
+    :meth:`on_order`, :meth:`on_order_submitted` and :meth:`on_order_closed`,
+    each touching one symbol.
+    :meth:`check` therefore costs one dictionary lookup per symbol plus one
+    call per policy, independent of the number of positions. Long-running
+    processes can call :meth:`recompute` to clear accumulated rounding.
+    """
+
+    cash: float = 0.0
+    volatility: float = 0.0
+    policies: list[Policy] = field(default_factory=list)
+    quantities: dict[str, float] = field(default_factory=dict)
+    marks: dict[str, float] = field(default_factory=dict)
+    gross_exposure: float = field(default=0.0, init=False)
+    net_exposure: float = field(default=0.0, init=False)
+    open_risk: float = field(default=0.0, init=False)
+    peak_equity: float = field(default=0.0, init=False)
+    _notional: dict[str, float] = field(default_factory=dict, init=False)
+    _pending: dict[str, float] = field(default_factory=dict, init=False)
+    _open: dict[str, _OpenOrder] = field(default_factory=dict, init=False)
+
+    def __post_init__(self) -> None:
+        self.recompute()
+
+    @property
+    def equity(self) -> float:
+        """Return cash plus the marked value of all positions."""
+
+        return self.cash + self.net_exposure
+
+    @property
+    def drawdown(self) -> float:
+        """Return the fractional decline of equity from its running peak."""
+
+        if self.peak_equity <= 0.0:
+            return 0.0
+        return max(0.0, (self.peak_equity - self.equity) / self.peak_equity)
+
+    def notional(self, symbol: str) -> float:
+        """Return the signed marked notional held in ``symbol``."""
+
+        return self._notional.get(symbol, 0.0)
+
+    def add_policy(self, policy: Policy) -> None:
+        """Register ``policy`` for evaluation by :meth:`check`."""
+
+        self.policies.append(policy)
+
+    def recompute(self) -> None:
+        """Rebuild every aggregate from positions, marks and open orders."""
+
+        self._notional = {
+            symbol: quantity * self.marks.get(symbol, 0.0)
+            for symbol, quantity in self.quantities.items()
+        }
+        self.gross_exposure = sum(abs(value) for value in self._notional.values())
+        self.net_exposure = sum(self._notional.values())
+        self._pending = {}
+        for order in self._open.values():
+            self._pending[order.symbol] = (
+                self._pending.get(order.symbol, 0.0) + order.notional
+            )
+        self.open_risk = sum(abs(order.notional) for order in self._open.values())
+        self.peak_equity = max(self.peak_equity, self.equity)
+
+    def _revalue(self, symbol: str) -> None:
+        previous = self._notional.get(symbol, 0.0)
+        current = self.quantities.get(symbol, 0.0) * self.marks.get(symbol, 0.0)
+        self._notional[symbol] = current
+        self.gross_exposure += abs(current) - abs(previous)
+        self.net_exposure += current - previous
+        self.peak_equity = max(self.peak_equity, self.equity)
+
+    def mark(self, symbol: str, price: float) -> None:
+        """Update the reference price of ``symbol``."""
+
+        self.marks[symbol] = price
+        self._revalue(symbol)
+
+    def set_volatility(self, volatility: float) -> None:
+        """Update the volatility estimate seen by the policies."""
+
+        self.volatility = volatility
+
+    def on_order(
+        self, order_id: str, *, symbol: str, quantity: float, price: float
+    ) -> None:
+        """Track a working order with signed ``quantity`` as open risk."""
+
+        notional = quantity * price
+        self._open[order_id] = _OpenOrder(symbol=symbol, notional=notional, price=price)
+        self._pending[symbol] = self._pending.get(symbol, 0.0) + notional
+        self.open_risk += abs(notional)
+
+    def on_order_closed(self, order_id: str) -> None:
+        """Release the remaining open risk of a cancelled or completed order."""
+
+        order = self._open.pop(order_id, None)
+        if order is not None:
+            self._pending[order.symbol] -= order.notional
+            self.open_risk -= abs(order.notional)
+
+    def on_order_submitted(self, order_id: str) -> None:
+        """Move a working order accepted by the broker into the position.
+
+        Without execution reports the remaining quantity is treated as filled
+        at the reference price the order was checked at.
+        """
+
+        order = self._open.get(order_id)
+        if order is None:
+            return
+        if order.price == 0.0:
+            self.on_order_closed(order_id)
+            return
+        self.on_fill(
+            order.symbol,
+            quantity=order.notional / order.price,
+            price=order.price,
+            order_id=order_id,
+        )
+
+    def on_fill(
+        self,
+        symbol: str,
+        *,
+        quantity: float,
+        price: float,
+        order_id: str | None = None,
+    ) -> None:
+        """Apply a fill of signed ``quantity`` at ``price`` to the portfolio."""
+
+        self.cash -= quantity * price
+        self.quantities[symbol] = self.quantities.get(symbol, 0.0) + quantity
+        self.marks[symbol] = price
+        self._revalue(symbol)
+
+        order = self._open.get(order_id) if order_id is not None else None
+        if order is None:
+            return
+        filled = quantity * price
+        remaining = order.notional - filled
+        if remaining * order.notional <= 0.0:
+            self.on_order_closed(order_id)
+            return
+        self._pending[symbol] -= filled
+        self.open_risk -= abs(order.notional) - abs(remaining)
+        order.notional = remaining
+
+    def snapshot(self) -> RiskSnapshot:
+        """Return the current aggregates as an immutable ``RiskContext``."""
+
+        return RiskSnapshot(
+            portfolio_value=self.equity,
+            open_risk=self.open_risk,
+            drawdown=self.drawdown,
+            volatility=self.volatility,
+            gross_exposure=self.gross_exposure,
+            net_exposure=self.net_exposure,
+        )
+
+    @timed("goldshore_risk_check_seconds", "Pre-trade risk check")
+    def check(
+        self, symbol: str, *, quantity: float, price: float | None = None
+    ) -> RiskDecision:
+        """Evaluate every policy against a prospective order.
+
+        ``proposed_notional`` is the post-trade notional of ``symbol``
+        including its working orders. Without ``price`` the latest mark is
+        used; an order in a symbol with neither is rejected when any policy is
+        registered.
+        """
+
+        if not self.policies:
+            return RiskDecision(approved=True)
+        reference = price if price is not None else self.marks.get(symbol)
+        if reference is None:
+            return RiskDecision(approved=False, breaches=("NoReferencePrice",))
+        proposed = (
+            self.quantities.get(symbol, 0.0) * reference
+            + self._pending.get(symbol, 0.0)
+            + quantity * reference
+        )
+        context = self.snapshot()
+        breaches = tuple(
+            type(policy).__name__
+            for policy in self.policies
+            if not policy.assess(context, proposed_notional=proposed)
+        )
+        return RiskDecision(
+            approved=not breaches, breaches=breaches, proposed_notional=proposed
+        )
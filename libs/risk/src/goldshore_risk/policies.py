@@ -1,4 +1,4 @@
-"""Placeholder risk policy implementations used during orchestration."""
+"""Risk policy implementations evaluated before orders are executed."""
 
 from dataclasses import dataclass
 from typing import Protocol
@@ -13,6 +13,13 @@ class RiskContext(Protocol):
     volatility: float
 
 
+class Policy(Protocol):
+    """Interface shared by policies registered with a ``RiskEngine``."""
+
+    def assess(self, context: RiskContext, *, proposed_notional: float) -> bool:
+        """Return ``True`` when a trade leaving ``proposed_notional`` is allowed."""
+
+
 @dataclass
 class PositionLimitPolicy:
     """Enforces per-instrument exposure caps before execution is authorised."""
@@ -22,8 +29,13 @@ class PositionLimitPolicy:
     def evaluate(self, *, proposed_notional: float) -> bool:
         """Return ``True`` when the proposed notional is within the configured bound."""
 
-        _ = proposed_notional
-        return True
+        return abs(proposed_notional) <= self.max_notional
+
+    def assess(self, context: RiskContext, *, proposed_notional: float) -> bool:
+        """Evaluate the post-trade notional of the traded instrument."""
+
+        _ = context
+        return self.evaluate(proposed_notional=proposed_notional)
 
 
 @dataclass
@@ -35,8 +47,13 @@ class DrawdownPolicy:
     def evaluate(self, *, context: RiskContext) -> bool:
         """Return ``True`` when drawdown remains below the configured limit."""
 
-        _ = context
-        return True
+        return context.drawdown <= self.max_drawdown
+
+    def assess(self, context: RiskContext, *, proposed_notional: float) -> bool:
+        """Evaluate the portfolio drawdown; the trade size is not considered."""
+
+        _ = proposed_notional
+        return self.evaluate(context=context)
 
 
 @dataclass
@@ -48,5 +65,10 @@ class VolatilityPolicy:
     def evaluate(self, *, context: RiskContext) -> bool:
         """Return ``True`` when volatility is inside the acceptable corridor."""
 
-        _ = context
-        return True
+        return context.volatility <= self.max_volatility
+
+    def assess(self, context: RiskContext, *, proposed_notional: float) -> bool:
+        """Evaluate the current volatility; the trade size is not considered."""
+
+        _ = proposed_notional
+        return self.evaluate(context=context)
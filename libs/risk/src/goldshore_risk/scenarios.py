@@ -0,0 +1,285 @@
+"""Full-revaluation scenario engine for portfolio VaR and stress testing."""
+
+from __future__ import annotations
+
+import itertools
+from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from statistics import NormalDist
+
+import numpy as np
+import numpy.typing as npt
+from goldshore_options import price_and_greeks
+
+DEFAULT_CHUNK_CELLS = 1 << 18
+MIN_VOLATILITY = 1e-4
+
+FloatArray = npt.NDArray[np.float64]
+
+
+@dataclass(frozen=True)
+class PortfolioPositions:
+    """Columnar description of the positions to revalue.
+
+    Rows with ``is_option`` set are European options priced with
+    ``goldshore_options``; the remaining rows are linear holdings of the
+    underlying whose value is ``spot``. ``quantity`` is signed and scaled by
+    ``multiplier`` (100 for listed equity options).
+    """
+
+    quantity: FloatArray
+    spot: FloatArray
+    strike: FloatArray
+    time_to_expiry: FloatArray
+    volatility: FloatArray
+    is_call: npt.NDArray[np.bool_]
+    is_option: npt.NDArray[np.bool_]
+    multiplier: FloatArray
+    rate: FloatArray
+    dividend_yield: FloatArray
+
+    @classmethod
+    def from_columns(  # noqa: PLR0913
+        cls,
+        *,
+        quantity: Sequence[float] | FloatArray,
+        spot: Sequence[float] | FloatArray,
+        strike: Sequence[float] | FloatArray | None = None,
+        time_to_expiry: Sequence[float] | FloatArray | float = 0.0,
+        volatility: Sequence[float] | FloatArray | float = 0.0,
+        option_type: Sequence[str] | npt.NDArray[np.bool_] | str = "call",
+        is_option: Sequence[bool] | npt.NDArray[np.bool_] | bool | None = None,
+        multiplier: Sequence[float] | FloatArray | float = 1.0,
+        rate: Sequence[float] | FloatArray | float = 0.0,
+        dividend_yield: Sequence[float] | FloatArray | float = 0.0,
+    ) -> PortfolioPositions:
+        """Build positions from columns, broadcasting scalar inputs.
+
+        Without ``strike`` every row is a linear position; otherwise rows are
+        options unless ``is_option`` says otherwise.
+        """
+
+        quantities = np.asarray(quantity, dtype=np.float64)
+        size = quantities.size
+        types = np.asarray(option_type)
+        calls = types if types.dtype == np.bool_ else types == "call"
+        if is_option is None:
+            is_option = strike is not None
+
+        def column(values: object, dtype: type = np.float64) -> npt.NDArray:
+            return np.array(np.broadcast_to(np.asarray(values, dtype=dtype), (size,)))
+
+        return cls(
+            quantity=quantities,
+            spot=column(spot),
+            strike=column(np.nan if strike is None else strike),
+            time_to_expiry=column(time_to_expiry),
+            volatility=column(volatility),
+            is_call=column(calls, np.bool_),
+            is_option=column(is_option, np.bool_),
+            multiplier=column(multiplier),
+            rate=column(rate),
+            dividend_yield=column(dividend_yield),
+        )
+
+    def __len__(self) -> int:
+        return int(self.quantity.size)
+
+    def value(
+        self,
+        *,
+        spot: FloatArray,
+        volatility: FloatArray,
+        rate: FloatArray,
+        time_to_expiry: FloatArray,
+    ) -> FloatArray:
+        """Return per-position market values for broadcast market inputs."""
+
+        shape = np.broadcast_shapes(
+            spot.shape, volatility.shape, rate.shape, time_to_expiry.shape
+        )
+        prices = np.array(np.broadcast_to(spot, shape))
+        options = self.is_option
+        if options.any():
+            prices[..., options] = price_and_greeks(
+                option_type=self.is_call[options],
+                spot=prices[..., options],
+                strike=self.strike[options],
+                time_to_expiry=np.broadcast_to(time_to_expiry, shape)[..., options],
+                volatility=np.maximum(
+                    np.broadcast_to(volatility, shape)[..., options], MIN_VOLATILITY
+                ),
+                rate=np.broadcast_to(rate, shape)[..., options],
+                dividend_yield=self.dividend_yield[options],
+            ).price
+        return prices * (self.quantity * self.multiplier)
+
+
+@dataclass(frozen=True)
+class Scenarios:
+    """Market shocks applied to every position, one row per scenario.
+
+    ``spot`` holds relative moves of the underlying and has shape ``(n,)`` for
+    a single risk factor or ``(n, positions)`` when each position follows its
+    own underlying. ``volatility`` and ``rate`` are absolute shifts.
+    """
+
+    spot: FloatArray
+    volatility: FloatArray
+    rate: FloatArray
+
+    @classmethod
+    def grid(
+        cls,
+        *,
+        spot: Sequence[float] = (0.0,),
+        volatility: Sequence[float] = (0.0,),
+        rate: Sequence[float] = (0.0,),
+    ) -> Scenarios:
+        """Return the Cartesian product of spot, volatility and rate shocks."""
+
+        rows = np.array(list(itertools.product(spot, volatility, rate)), dtype=float)
+        return cls(spot=rows[:, 0], volatility=rows[:, 1], rate=rows[:, 2])
+
+    @classmethod
+    def historical(cls, returns: Sequence[float] | FloatArray) -> Scenarios:
+        """Return spot-only scenarios replaying historical underlying returns."""
+
+        moves = np.asarray(returns, dtype=np.float64)
+        zeros = np.zeros(moves.shape[0])
+        return cls(spot=moves, volatility=zeros, rate=zeros)
+
+    def __len__(self) -> int:
+        return int(self.volatility.size)
+
+    def rows(self, start: int, stop: int) -> Scenarios:
+        """Return scenarios ``start`` to ``stop`` as views."""
+
+        return Scenarios(
+            spot=self.spot[start:stop],
+            volatility=self.volatility[start:stop],
+            rate=self.rate[start:stop],
+        )
+
+
+@dataclass(frozen=True)
+class ScenarioResult:
+    """Portfolio P&L under each scenario relative to the unshocked value.
+
+    VaR and expected shortfall are reported as positive losses. The
+    historical figures use the empirical P&L distribution; the parametric
+    ones fit a normal distribution to it.
+    """
+
+    base_value: float
+    pnl: FloatArray
+
+    def var(self, confidence: float = 0.99) -> float:
+        """Return historical value-at-risk at ``confidence``."""
+
+        return float(-np.quantile(self.pnl, 1.0 - confidence))
+
+    def expected_shortfall(self, confidence: float = 0.99) -> float:
+        """Return the mean loss in the tail beyond historical VaR."""
+
+        threshold = np.quantile(self.pnl, 1.0 - confidence)
+        return float(-self.pnl[self.pnl <= threshold].mean())
+
+    def parametric_var(self, confidence: float = 0.99) -> float:
+        """Return normal value-at-risk using the P&L mean and deviation."""
+
+        z = NormalDist().inv_cdf(confidence)
+        return float(z * self.pnl.std() - self.pnl.mean())
+
+    def parametric_expected_shortfall(self, confidence: float = 0.99) -> float:
+        """Return normal expected shortfall using the P&L mean and deviation."""
+
+        normal = NormalDist()
+        tail = normal.pdf(normal.inv_cdf(confidence)) / (1.0 - confidence)
+        return float(tail * self.pnl.std() - self.pnl.mean())
+
+    @property
+    def volatility(self) -> float:
+        """Return the P&L standard deviation as a fraction of portfolio value.
+
+        Suitable for :meth:`RiskEngine.set_volatility` so that
+        ``VolatilityPolicy`` limits act on revalued portfolio risk.
+        """
+
+        if self.base_value == 0.0:
+            return 0.0
+        return float(self.pnl.std() / abs(self.base_value))
+
+    def stress_drawdown(self) -> float:
+        """Return the worst scenario loss as a fraction of portfolio value."""
+
+        if self.base_value == 0.0:
+            return 0.0
+        return float(max(0.0, -self.pnl.min()) / abs(self.base_value))
+
+
+def _revalue_chunk(
+    positions: PortfolioPositions, scenarios: Scenarios, horizon: float
+) -> FloatArray:
+    spot_moves = scenarios.spot.reshape(len(scenarios), -1)
+    values = positions.value(
+        spot=positions.spot * (1.0 + spot_moves),
+        volatility=positions.volatility + scenarios.volatility[:, None],
+        rate=positions.rate + scenarios.rate[:, None],
+        time_to_expiry=np.maximum(positions.time_to_expiry - horizon, 0.0),
+    )
+    return values.sum(axis=1)
+
+
+@dataclass
+class ScenarioEngine:
+    """Revalue a portfolio under many scenarios in bounded-memory chunks.
+
+    Each chunk prices ``scenarios x positions`` contracts in one batched call
+    and is sized so that it holds at most ``chunk_cells`` revaluations. With
+    ``workers`` above one the chunks are distributed over a process pool;
+    each worker receives the positions and its own scenario rows.
+    """
+
+    positions: PortfolioPositions
+    chunk_cells: int = DEFAULT_CHUNK_CELLS
+    workers: int = 1
+
+    def base_value(self) -> float:
+        """Return the current market value of the portfolio."""
+
+        return float(
+            self.positions.value(
+                spot=self.positions.spot,
+                volatility=self.positions.volatility,
+                rate=self.positions.rate,
+                time_to_expiry=self.positions.time_to_expiry,
+            ).sum()
+        )
+
+    def run(self, scenarios: Scenarios, *, horizon: float = 0.0) -> ScenarioResult:
+        """Return portfolio P&L for every scenario after ``horizon`` years."""
+
+        size = max(1, self.chunk_cells // max(1, len(self.positions)))
+        chunks = [
+            scenarios.rows(start, start + size)
+            for start in range(0, len(scenarios), size)
+        ]
+        if self.workers > 1 and len(chunks) > 1:
+            with ProcessPoolExecutor(max_workers=self.workers) as pool:
+                values = list(
+                    pool.map(
+                        _revalue_chunk,
+                        itertools.repeat(self.positions),
+                        chunks,
+                        itertools.repeat(horizon),
+                    )
+                )
+        else:
+            values = [
+                _revalue_chunk(self.positions, chunk, horizon) for chunk in chunks
+            ]
+        base = self.base_value()
+        pnl = np.concatenate(values) - base if values else np.empty(0)
+        return ScenarioResult(base_value=base, pnl=pnl)
@@ -1,5 +1,32 @@
-"""Signal regime detection stubs."""
+"""Signal regime detection and streaming statistics."""
 
+from .orderbook import OrderBookState
+from .panel import PanelFeatures, PanelSignals, evaluate_panel, rolling_features
 from .regimes import classify_volatility, detect_regime, score_liquidity
+from .streaming import (
+    EWMAVariance,
+    RingBuffer,
+    RollingExtremes,
+    RollingMoments,
+    SignalBook,
+    SignalState,
+    StreamingSignal,
+)
 
-__all__ = ["classify_volatility", "detect_regime", "score_liquidity"]
+__all__ = [
+    "EWMAVariance",
+    "OrderBookState",
+    "PanelFeatures",
+    "PanelSignals",
+    "RingBuffer",
+    "RollingExtremes",
+    "RollingMoments",
+    "SignalBook",
+    "SignalState",
+    "StreamingSignal",
+    "classify_volatility",
+    "detect_regime",
+    "evaluate_panel",
+    "rolling_features",
+    "score_liquidity",
+]
@@ -0,0 +1,194 @@
+"""Incrementally maintained L2 order book with liquidity aggregates."""
+
+from __future__ import annotations
+
+import bisect
+from array import array
+from collections.abc import Iterable
+
+import pandas as pd
+
+DEFAULT_BAND_BPS = 10.0
+BPS = 1e4
+
+Delta = tuple[str, float, float]
+
+
+class _Side:
+    """Price levels of one side held in parallel ascending arrays."""
+
+    def __init__(self) -> None:
+        self.prices = array("d")
+        self.sizes = array("d")
+
+    def __len__(self) -> int:
+        return len(self.prices)
+
+    def set(self, price: float, size: float) -> float:
+        """Set the size at ``price`` (zero deletes) and return the size change."""
+
+        index = bisect.bisect_left(self.prices, price)
+        exists = index < len(self.prices) and self.prices[index] == price
+        if size <= 0.0:
+            if not exists:
+                return 0.0
+            previous = self.sizes[index]
+            del self.prices[index]
+            del self.sizes[index]
+            return -previous
+        if exists:
+            previous = self.sizes[index]
+            self.sizes[index] = size
+            return size - previous
+        self.prices.insert(index, price)
+        self.sizes.insert(index, size)
+        return size
+
+    def notional(self, low: float, high: float) -> float:
+        """Return ``sum(price * size)`` for levels priced within ``[low, high]``."""
+
+        start = bisect.bisect_left(self.prices, low)
+        stop = bisect.bisect_right(self.prices, high)
+        return sum(
+            price * size
+            for price, size in zip(
+                self.prices[start:stop], self.sizes[start:stop], strict=True
+            )
+        )
+
+
+class OrderBookState:
+    """L2 book that keeps spread, banded depth and imbalance up to date.
+
+    Levels live in sorted ``array('d')`` price/size columns per side. An L2
+    delta is a binary search plus an in-place insert, update or delete. Depth
+    within ``band_bps`` of the mid is adjusted by the delta's notional when
+    the level lies inside the band, and is re-summed over the band only when
+    the top of book moves. Every aggregate, including :attr:`score`, is
+    therefore a cached read.
+    """
+
+    def __init__(self, *, band_bps: float = DEFAULT_BAND_BPS) -> None:
+        self.band_bps = band_bps
+        self.bids = _Side()
+        self.asks = _Side()
+        self.bid_depth = 0.0
+        self.ask_depth = 0.0
+        self._low = self._high = 0.0
+
+    @classmethod
+    def from_frame(
+        cls, order_book: pd.DataFrame, *, band_bps: float = DEFAULT_BAND_BPS
+    ) -> OrderBookState:
+        """Build a book from a frame with ``side``, ``price`` and ``size`` columns.
+
+        Rows are loaded in bulk; for duplicated levels the last row wins.
+        """
+
+        book = cls(band_bps=band_bps)
+        levels = order_book[order_book["size"] > 0].sort_values("price", kind="stable")
+        for side, name in ((book.bids, "bid"), (book.asks, "ask")):
+            rows = levels[levels["side"] == name].drop_duplicates("price", keep="last")
+            side.prices.extend(rows["price"].tolist())
+            side.sizes.extend(rows["size"].tolist())
+        book._rebalance()
+        return book
+
+    @property
+    def best_bid(self) -> float | None:
+        """Return the highest bid price."""
+
+        return self.bids.prices[-1] if self.bids else None
+
+    @property
+    def best_ask(self) -> float | None:
+        """Return the lowest ask price."""
+
+        return self.asks.prices[0] if self.asks else None
+
+    @property
+    def mid(self) -> float | None:
+        """Return the midpoint of the best bid and ask."""
+
+        if not self.bids or not self.asks:
+            return None
+        return 0.5 * (self.bids.prices[-1] + self.asks.prices[0])
+
+    @property
+    def spread(self) -> float | None:
+        """Return the best ask minus the best bid."""
+
+        if not self.bids or not self.asks:
+            return None
+        return self.asks.prices[0] - self.bids.prices[-1]
+
+    @property
+    def spread_bps(self) -> float | None:
+        """Return the spread in basis points of the mid."""
+
+        mid = self.mid
+        if mid is None or mid <= 0.0:
+            return None
+        return (self.asks.prices[0] - self.bids.prices[-1]) / mid * BPS
+
+    @property
+    def imbalance(self) -> float:
+        """Return ``(bid - ask) / (bid + ask)`` depth within the band."""
+
+        total = self.bid_depth + self.ask_depth
+        return (self.bid_depth - self.ask_depth) / total if total else 0.0
+
+    @property
+    def score(self) -> float:
+        """Return banded two-sided depth divided by ``1 + spread_bps``.
+
+        Deeper, tighter books score higher; one-sided or empty books score
+        ``0.0``.
+        """
+
+        spread_bps = self.spread_bps
+        if spread_bps is None:
+            return 0.0
+        return (self.bid_depth + self.ask_depth) / (1.0 + max(spread_bps, 0.0))
+
+    def apply(self, side: str, price: float, size: float) -> None:
+        """Apply an L2 delta setting ``side`` at ``price`` to ``size``.
+
+        A zero ``size`` deletes the level; any other size adds or replaces it.
+        """
+
+        if side == "bid":
+            before = self.best_bid
+            change = self.bids.set(price, size)
+            moved = self.best_bid != before
+        elif side == "ask":
+            before = self.best_ask
+            change = self.asks.set(price, size)
+            moved = self.best_ask != before
+        else:
+            raise ValueError(f"Unknown order book side {side!r}")
+
+        if moved:
+            self._rebalance()
+        elif self._low <= price <= self._high:
+            if side == "bid":
+                self.bid_depth += change * price
+            else:
+                self.ask_depth += change * price
+
+    def apply_many(self, deltas: Iterable[Delta]) -> None:
+        """Apply ``(side, price, size)`` deltas in order."""
+
+        for side, price, size in deltas:
+            self.apply(side, price, size)
+
+    def _rebalance(self) -> None:
+        mid = self.mid
+        if mid is None:
+            self.bid_depth = self.ask_depth = 0.0
+            self._low = self._high = 0.0
+            return
+        half_width = mid * self.band_bps / BPS
+        self._low, self._high = mid - half_width, mid + half_width
+        self.bid_depth = self.bids.notional(self._low, self._high)
+        self.ask_depth = self.asks.notional(self._low, self._high)
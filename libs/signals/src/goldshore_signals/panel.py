@@ -0,0 +1,255 @@
+"""Vectorized signal evaluation across a (time x symbols) price panel."""
+
+from __future__ import annotations
+
+import itertools
+from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+
+import numpy as np
+import numpy.typing as npt
+import pandas as pd
+
+from .streaming import (
+    DEFAULT_EWMA_DECAY,
+    DEFAULT_WINDOW,
+    HIGH_VOLATILITY,
+    LOW_VOLATILITY,
+    MIN_RETURNS,
+    PERIODS_PER_YEAR,
+    TREND_THRESHOLD,
+)
+
+FloatArray = npt.NDArray[np.float64]
+PriceBlock = npt.ArrayLike | pd.DataFrame
+PANEL_DIMENSIONS = 2
+
+
+@dataclass(frozen=True)
+class PanelSignals:
+    """Latest labels and statistics for every symbol in a panel.
+
+    For gap-free columns the values match what :class:`StreamingSignal`
+    reports after streaming the column. ``NaN`` prices are missing
+    observations; returns touching them are left out of the window.
+    """
+
+    symbols: list[str]
+    regime: npt.NDArray[np.str_]
+    volatility: npt.NDArray[np.str_]
+    realized_volatility: FloatArray
+    ewma_volatility: FloatArray
+    rolling_min: FloatArray
+    rolling_max: FloatArray
+    trend_t_stat: FloatArray
+
+    def to_frame(self) -> pd.DataFrame:
+        """Return the signals as a frame indexed by symbol."""
+
+        return pd.DataFrame(
+            {
+                "regime": self.regime,
+                "volatility": self.volatility,
+                "realized_volatility": self.realized_volatility,
+                "ewma_volatility": self.ewma_volatility,
+                "rolling_min": self.rolling_min,
+                "rolling_max": self.rolling_max,
+                "trend_t_stat": self.trend_t_stat,
+            },
+            index=pd.Index(self.symbols, name="symbol"),
+        )
+
+
+@dataclass(frozen=True)
+class PanelFeatures:
+    """Rolling features for every (time, symbol) cell of a panel.
+
+    Row ``i`` describes the window ending at price row ``i``; rows before a
+    full window of returns is available are ``NaN``.
+    """
+
+    returns: FloatArray
+    rolling_mean: FloatArray
+    rolling_std: FloatArray
+    realized_volatility: FloatArray
+    rolling_min: FloatArray
+    rolling_max: FloatArray
+
+
+def _as_matrix(
+    prices: PriceBlock, symbols: Sequence[str] | None
+) -> tuple[FloatArray, list[str]]:
+    if isinstance(prices, pd.DataFrame):
+        names = [str(column) for column in prices.columns]
+        matrix = prices.to_numpy(dtype=np.float64)
+    else:
+        matrix = np.asarray(prices, dtype=np.float64)
+        if matrix.ndim == 1:
+            matrix = matrix[:, None]
+        names = [str(index) for index in range(matrix.shape[1])]
+    if symbols is not None:
+        names = list(symbols)
+    if matrix.ndim != PANEL_DIMENSIONS or len(names) != matrix.shape[1]:
+        raise ValueError("prices must be a (time x symbols) matrix")
+    return matrix, names
+
+
+def _log_returns(matrix: FloatArray) -> FloatArray:
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.log(matrix[1:] / matrix[:-1])
+
+
+def _ewma_variance(returns: FloatArray, decay: float) -> FloatArray:
+    variance = np.full(returns.shape[1], np.nan)
+    for row in returns * returns:
+        seen = ~np.isnan(row)
+        variance = np.where(
+            seen & np.isnan(variance),
+            row,
+            np.where(seen, decay * variance + (1.0 - decay) * row, variance),
+        )
+    return variance
+
+
+def _evaluate_block(
+    matrix: FloatArray, window: int, periods_per_year: int, ewma_decay: float
+) -> tuple[FloatArray, ...]:
+    returns = _log_returns(matrix)
+    recent = returns[-window:]
+    valid = ~np.isnan(recent)
+    count = valid.sum(axis=0)
+    filled = np.where(valid, recent, 0.0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        mean = filled.sum(axis=0) / count
+        mean_square = (filled * filled).sum(axis=0) / count
+        deviation = np.where(valid, recent - mean, 0.0)
+        std = np.sqrt((deviation * deviation).sum(axis=0) / (count - 1))
+        t_stat = mean / (std / np.sqrt(count))
+    t_stat = np.where(count >= MIN_RETURNS, t_stat, np.nan)
+    tail = matrix[-(window + 1) :]
+    with np.errstate(invalid="ignore"):
+        rolling_min = np.nanmin(np.where(np.isnan(tail), np.inf, tail), axis=0)
+        rolling_max = np.nanmax(np.where(np.isnan(tail), -np.inf, tail), axis=0)
+    rolling_min[np.isinf(rolling_min)] = np.nan
+    rolling_max[np.isinf(rolling_max)] = np.nan
+    return (
+        count.astype(np.float64),
+        t_stat,
+        np.sqrt(mean_square * periods_per_year),
+        np.sqrt(_ewma_variance(returns, ewma_decay) * periods_per_year),
+        rolling_min,
+        rolling_max,
+    )
+
+
+def evaluate_panel(  # noqa: PLR0913
+    prices: PriceBlock,
+    *,
+    symbols: Sequence[str] | None = None,
+    window: int = DEFAULT_WINDOW,
+    periods_per_year: int = PERIODS_PER_YEAR,
+    ewma_decay: float = DEFAULT_EWMA_DECAY,
+    workers: int = 1,
+    chunk_symbols: int = 2048,
+) -> PanelSignals:
+    """Compute regime and volatility labels for every column of ``prices``.
+
+    ``prices`` is a (time x symbols) array or a frame whose columns are
+    symbols. All statistics are computed with whole-matrix NumPy operations;
+    the only loop is the EWMA recursion over time, which is vectorized across
+    symbols. With ``workers`` above one, column blocks of ``chunk_symbols``
+    are evaluated in a process pool.
+    """
+
+    matrix, names = _as_matrix(prices, symbols)
+    blocks = [
+        matrix[:, start : start + chunk_symbols]
+        for start in range(0, matrix.shape[1], chunk_symbols)
+    ]
+    arguments = (window, periods_per_year, ewma_decay)
+    if workers > 1 and len(blocks) > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            parts = list(
+                pool.map(
+                    _evaluate_block,
+                    blocks,
+                    *(itertools.repeat(value) for value in arguments),
+                )
+            )
+    else:
+        parts = [_evaluate_block(block, *arguments) for block in blocks]
+    if parts:
+        columns = [np.concatenate(column) for column in zip(*parts, strict=True)]
+    else:
+        columns = [np.empty(0) for _ in range(6)]
+    count, t_stat, realized, ewma, rolling_min, rolling_max = columns
+
+    regime = np.select(
+        [count < window, t_stat > TREND_THRESHOLD, t_stat < -TREND_THRESHOLD],
+        ["unknown", "trending_up", "trending_down"],
+        default="range_bound",
+    )
+    volatility = np.select(
+        [count < MIN_RETURNS, realized < LOW_VOLATILITY, realized > HIGH_VOLATILITY],
+        ["medium", "low", "high"],
+        default="medium",
+    )
+    return PanelSignals(
+        symbols=names,
+        regime=regime,
+        volatility=volatility,
+        realized_volatility=realized,
+        ewma_volatility=ewma,
+        rolling_min=rolling_min,
+        rolling_max=rolling_max,
+        trend_t_stat=t_stat,
+    )
+
+
+def rolling_features(
+    prices: PriceBlock,
+    *,
+    window: int = DEFAULT_WINDOW,
+    periods_per_year: int = PERIODS_PER_YEAR,
+) -> PanelFeatures:
+    """Return rolling return and range features for every panel cell.
+
+    Window sums come from cumulative sums, so cost is linear in the panel
+    size regardless of ``window``. Missing prices propagate ``NaN`` into the
+    windows that contain them.
+    """
+
+    matrix, _ = _as_matrix(prices, None)
+    steps, width = matrix.shape
+    returns = np.full((steps, width), np.nan)
+    returns[1:] = _log_returns(matrix)
+
+    def window_sum(values: FloatArray) -> FloatArray:
+        missing = np.isnan(values)
+        cumulative = np.cumsum(np.where(missing, 0.0, values), axis=0)
+        gaps = np.cumsum(missing, axis=0)
+        totals = np.full((steps, width), np.nan)
+        totals[window:] = cumulative[window:] - cumulative[:-window]
+        totals[window:][gaps[window:] - gaps[:-window] > 0] = np.nan
+        return totals
+
+    mean = window_sum(returns) / window
+    mean_square = window_sum(returns * returns) / window
+    variance = np.maximum(mean_square - mean * mean, 0.0) * window / (window - 1)
+
+    rolling_min = np.full((steps, width), np.nan)
+    rolling_max = np.full((steps, width), np.nan)
+    if steps > window:
+        windows = np.lib.stride_tricks.sliding_window_view(matrix, window + 1, axis=0)
+        rolling_min[window:] = windows.min(axis=-1)
+        rolling_max[window:] = windows.max(axis=-1)
+
+    return PanelFeatures(
+        returns=returns,
+        rolling_mean=mean,
+        rolling_std=np.sqrt(variance),
+        realized_volatility=np.sqrt(mean_square * periods_per_year),
+        rolling_min=rolling_min,
+        rolling_max=rolling_max,
+    )
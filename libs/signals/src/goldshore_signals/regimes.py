@@ -1,4 +1,4 @@
-"""Placeholder signal regime detection helpers."""
+"""Signal regime detection helpers."""
 
 from __future__ import annotations
 
@@ -6,28 +6,50 @@ from collections.abc import Sequence
 
 import pandas as pd
 
+from .orderbook import DEFAULT_BAND_BPS, OrderBookState
+from .streaming import DEFAULT_WINDOW, StreamingSignal
 
-def detect_regime(price_series: Sequence[float]) -> str:
-    """Return a placeholder label describing the detected market regime.
 
-    The production implementation will blend volatility clustering with
-    macro-fundamental overlays. During scaffolding we simply return
-    ``"unknown"`` to unblock downstream orchestration.
+def _stream(price_series: Sequence[float], window: int) -> StreamingSignal:
+    signal = StreamingSignal(window=window)
+    for price in list(price_series)[-(window + 1) :]:
+        signal.update(price)
+    return signal
+
+
+def detect_regime(
+    price_series: Sequence[float], *, window: int = DEFAULT_WINDOW
+) -> str:
+    """Return the market regime implied by the last ``window`` returns.
+
+    Thin wrapper over :class:`StreamingSignal`; callers receiving prices one
+    at a time should keep a ``StreamingSignal`` instead of rescanning history.
     """
 
-    _ = price_series
-    return "unknown"
+    return _stream(price_series, window).regime()
 
 
-def classify_volatility(price_series: Sequence[float]) -> str:
-    """Return ``"low"``, ``"medium"``, or ``"high"`` once statistics are wired."""
+def classify_volatility(
+    price_series: Sequence[float], *, window: int = DEFAULT_WINDOW
+) -> str:
+    """Return ``"low"``, ``"medium"``, or ``"high"`` realised volatility.
 
-    _ = price_series
-    return "medium"
+    Thin wrapper over :class:`StreamingSignal` using the last ``window``
+    returns.
+    """
 
+    return _stream(price_series, window).classify()
 
-def score_liquidity(order_book: pd.DataFrame) -> float:
-    """Return a floating score describing order-book depth and spread stability."""
 
-    _ = order_book
-    return 0.0
+def score_liquidity(
+    order_book: pd.DataFrame, *, band_bps: float = DEFAULT_BAND_BPS
+) -> float:
+    """Return a floating score describing order-book depth and spread stability.
+
+    ``order_book`` holds one row per level with ``side`` (``"bid"``/``"ask"``),
+    ``price`` and ``size`` columns. Kept for snapshot callers; streaming
+    consumers should apply deltas to an :class:`OrderBookState` and read its
+    ``score`` instead of building a frame per update.
+    """
+
+    return OrderBookState.from_frame(order_book, band_bps=band_bps).score
@@ -0,0 +1,302 @@
+"""Streaming rolling statistics with constant work per tick."""
+
+from __future__ import annotations
+
+import math
+from collections import deque
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+
+DEFAULT_WINDOW = 20
+DEFAULT_EWMA_DECAY = 0.94
+PERIODS_PER_YEAR = 252
+# Annualised volatility bands used by ``classify``.
+LOW_VOLATILITY = 0.15
+HIGH_VOLATILITY = 0.35
+# |t-statistic| of the mean log return above which a window is trending.
+TREND_THRESHOLD = 2.0
+# Returns needed before a volatility estimate is meaningful.
+MIN_RETURNS = 2
+
+
+class RingBuffer:
+    """Fixed-capacity FIFO of floats backed by a preallocated list."""
+
+    def __init__(self, capacity: int) -> None:
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        self.capacity = capacity
+        self._values = [0.0] * capacity
+        self._start = 0
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self) -> Iterator[float]:
+        for offset in range(self._size):
+            yield self._values[(self._start + offset) % self.capacity]
+
+    @property
+    def full(self) -> bool:
+        """Return ``True`` once ``capacity`` values are held."""
+
+        return self._size == self.capacity
+
+    def append(self, value: float) -> float | None:
+        """Append ``value`` and return the value it evicted, if any."""
+
+        if self._size < self.capacity:
+            self._values[(self._start + self._size) % self.capacity] = value
+            self._size += 1
+            return None
+        evicted = self._values[self._start]
+        self._values[self._start] = value
+        self._start = (self._start + 1) % self.capacity
+        return evicted
+
+
+@dataclass
+class RollingMoments:
+    """Mean and variance over the last ``window`` values via Welford updates."""
+
+    window: int
+    count: int = 0
+    mean: float = 0.0
+    m2: float = 0.0
+    sum_squares: float = 0.0
+    _buffer: RingBuffer = field(init=False)
+
+    def __post_init__(self) -> None:
+        self._buffer = RingBuffer(self.window)
+
+    def update(self, value: float) -> None:
+        """Add ``value``, dropping the value that leaves the window."""
+
+        evicted = self._buffer.append(value)
+        if evicted is not None:
+            self._remove(evicted)
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+        self.sum_squares += value * value
+
+    def _remove(self, value: float) -> None:
+        self.count -= 1
+        self.sum_squares -= value * value
+        if self.count == 0:
+            self.mean = self.m2 = self.sum_squares = 0.0
+            return
+        previous = self.mean
+        self.mean = previous - (value - previous) / self.count
+        self.m2 = max(0.0, self.m2 - (value - previous) * (value - self.mean))
+
+    @property
+    def variance(self) -> float:
+        """Return the sample variance, or ``NaN`` with fewer than two values."""
+
+        return self.m2 / (self.count - 1) if self.count > 1 else math.nan
+
+    @property
+    def std(self) -> float:
+        """Return the sample standard deviation."""
+
+        return math.sqrt(self.variance)
+
+    @property
+    def mean_square(self) -> float:
+        """Return the mean of squared values, or ``NaN`` when empty."""
+
+        return max(0.0, self.sum_squares) / self.count if self.count else math.nan
+
+
+@dataclass
+class RollingExtremes:
+    """Rolling minimum and maximum using monotonic deques."""
+
+    window: int
+    _index: int = 0
+    _min: deque[tuple[int, float]] = field(default_factory=deque)
+    _max: deque[tuple[int, float]] = field(default_factory=deque)
+
+    def update(self, value: float) -> None:
+        """Add ``value`` in amortised constant time."""
+
+        while self._min and self._min[-1][1] >= value:
+            self._min.pop()
+        while self._max and self._max[-1][1] <= value:
+            self._max.pop()
+        self._min.append((self._index, value))
+        self._max.append((self._index, value))
+        expired = self._index - self.window
+        if self._min[0][0] <= expired:
+            self._min.popleft()
+        if self._max[0][0] <= expired:
+            self._max.popleft()
+        self._index += 1
+
+    @property
+    def minimum(self) -> float:
+        """Return the smallest value in the window, or ``NaN`` when empty."""
+
+        return self._min[0][1] if self._min else math.nan
+
+    @property
+    def maximum(self) -> float:
+        """Return the largest value in the window, or ``NaN`` when empty."""
+
+        return self._max[0][1] if self._max else math.nan
+
+
+@dataclass
+class EWMAVariance:
+    """Exponentially weighted variance of zero-mean returns (RiskMetrics)."""
+
+    decay: float = DEFAULT_EWMA_DECAY
+    variance: float = math.nan
+
+    def update(self, value: float) -> None:
+        """Fold ``value`` into the running estimate."""
+
+        square = value * value
+        if math.isnan(self.variance):
+            self.variance = square
+        else:
+            self.variance = self.decay * self.variance + (1.0 - self.decay) * square
+
+    @property
+    def std(self) -> float:
+        """Return the EWMA standard deviation."""
+
+        return math.sqrt(self.variance)
+
+
+@dataclass(frozen=True)
+class SignalState:
+    """Labels and statistics emitted after each streamed price."""
+
+    regime: str
+    volatility: str
+    realized_volatility: float
+    ewma_volatility: float
+    rolling_min: float
+    rolling_max: float
+
+
+@dataclass
+class StreamingSignal:
+    """Regime and volatility classifier for one symbol, updated per tick.
+
+    Log returns over the last ``window`` ticks feed Welford moments, a
+    zero-mean realised-variance estimate and an EWMA variance; prices feed
+    rolling extremes. Every update is O(1), so per-tick cost does not depend
+    on the window or the length of the price history. Volatilities are
+    annualised with ``periods_per_year``.
+    """
+
+    window: int = DEFAULT_WINDOW
+    periods_per_year: int = PERIODS_PER_YEAR
+    ewma_decay: float = DEFAULT_EWMA_DECAY
+    last_price: float = math.nan
+    returns: RollingMoments = field(init=False)
+    extremes: RollingExtremes = field(init=False)
+    ewma: EWMAVariance = field(init=False)
+
+    def __post_init__(self) -> None:
+        self.returns = RollingMoments(self.window)
+        self.extremes = RollingExtremes(self.window + 1)
+        self.ewma = EWMAVariance(self.ewma_decay)
+
+    @property
+    def realized_volatility(self) -> float:
+        """Return annualised realised volatility over the window."""
+
+        return math.sqrt(self.returns.mean_square * self.periods_per_year)
+
+    @property
+    def ewma_volatility(self) -> float:
+        """Return annualised EWMA volatility."""
+
+        return self.ewma.std * math.sqrt(self.periods_per_year)
+
+    def regime(self) -> str:
+        """Return ``trending_up``, ``trending_down``, ``range_bound`` or ``unknown``.
+
+        A window is trending when the t-statistic of its mean log return
+        exceeds ``TREND_THRESHOLD``; ``unknown`` is returned until the window
+        is full.
+        """
+
+        moments = self.returns
+        if moments.count < self.window:
+            return "unknown"
+        if moments.m2 == 0.0:
+            if moments.mean == 0.0:
+                return "range_bound"
+            return "trending_up" if moments.mean > 0.0 else "trending_down"
+        t_stat = moments.mean / (moments.std / math.sqrt(moments.count))
+        if t_stat > TREND_THRESHOLD:
+            return "trending_up"
+        if t_stat < -TREND_THRESHOLD:
+            return "trending_down"
+        return "range_bound"
+
+    def classify(self) -> str:
+        """Return ``low``, ``medium`` or ``high`` from realised volatility.
+
+        ``medium`` is returned until at least two returns have been seen.
+        """
+
+        if self.returns.count < MIN_RETURNS:
+            return "medium"
+        volatility = self.realized_volatility
+        if volatility < LOW_VOLATILITY:
+            return "low"
+        if volatility > HIGH_VOLATILITY:
+            return "high"
+        return "medium"
+
+    def update(self, price: float) -> SignalState:
+        """Add the next ``price`` and return the refreshed labels."""
+
+        if price <= 0.0:
+            raise ValueError("Prices must be positive")
+        if not math.isnan(self.last_price):
+            log_return = math.log(price / self.last_price)
+            self.returns.update(log_return)
+            self.ewma.update(log_return)
+        self.last_price = price
+        self.extremes.update(price)
+        return self.state()
+
+    def state(self) -> SignalState:
+        """Return the current labels and statistics without updating."""
+
+        return SignalState(
+            regime=self.regime(),
+            volatility=self.classify(),
+            realized_volatility=self.realized_volatility,
+            ewma_volatility=self.ewma_volatility,
+            rolling_min=self.extremes.minimum,
+            rolling_max=self.extremes.maximum,
+        )
+
+
+@dataclass
+class SignalBook:
+    """Per-symbol ``StreamingSignal`` instances created on first tick."""
+
+    window: int = DEFAULT_WINDOW
+    periods_per_year: int = PERIODS_PER_YEAR
+    signals: dict[str, StreamingSignal] = field(default_factory=dict)
+
+    def update(self, symbol: str, price: float) -> SignalState:
+        """Stream ``price`` for ``symbol`` and return its labels."""
+
+        signal = self.signals.get(symbol)
+        if signal is None:
+            signal = self.signals[symbol] = StreamingSignal(
+                window=self.window, periods_per_year=self.periods_per_year
+            )
+        return signal.update(price)
@@ -0,0 +1,123 @@
+"""Compare response encoding throughput of stdlib JSON and goldshore_utils.
+
+Run with ``python libs/utils/benchmarks/serialization.py``. Each payload is
+encoded the way a default FastAPI route would (records built as dicts, then
+``json.dumps`` as done by ``JSONResponse``) and with
+:func:`goldshore_utils.serialization.encode` for every available format.
+"""
+
+from __future__ import annotations
+
+import json
+import timeit
+from collections.abc import Callable
+from dataclasses import dataclass, fields
+from datetime import date, timedelta
+from functools import partial
+from typing import Any
+
+from goldshore_utils.serialization import available_media_types, encode
+from pydantic import BaseModel
+
+ROWS = 20_000
+
+
+@dataclass(slots=True)
+class Order:
+    order_id: str
+    symbol: str
+    side: str
+    quantity: float
+    status: str
+    client_order_id: str | None
+    broker_order_id: str | None
+    detail: str | None
+
+
+_ORDER_FIELDS = tuple(field.name for field in fields(Order))
+
+
+def _as_dict(order: Order) -> dict[str, object]:
+    return {name: getattr(order, name) for name in _ORDER_FIELDS}
+
+
+class PlanResponse(BaseModel):
+    id: str
+    status: str
+    details: dict[str, object]
+
+
+def _chain() -> list[dict[str, object]]:
+    expiry = date(2025, 1, 17)
+    return [
+        {
+            "symbol": "SPY",
+            "expiry": (expiry + timedelta(days=7 * (index % 12))).isoformat(),
+            "strike": 300.0 + index % 400,
+            "option_type": "call" if index % 2 else "put",
+            "bid": 1.25 + index * 1e-4,
+            "ask": 1.35 + index * 1e-4,
+            "implied_volatility": 0.2 + (index % 50) * 1e-3,
+            "delta": 0.5 - (index % 100) * 1e-3,
+        }
+        for index in range(ROWS)
+    ]
+
+
+def _orders() -> list[Order]:
+    return [
+        Order(f"exec-{index:016x}", "AAPL", "buy", 10.0, "submitted", None, None, None)
+        for index in range(ROWS)
+    ]
+
+
+def _plans() -> list[PlanResponse]:
+    return [
+        PlanResponse(
+            id=f"plan-{index:012x}",
+            status="pending",
+            details={"name": "Plan", "target_symbol": "SPY", "notional": 1e3},
+        )
+        for index in range(ROWS // 40)
+    ]
+
+
+def _default_route(content: Any, to_builtin: Callable[[Any], object]) -> bytes:
+    return json.dumps(
+        to_builtin(content), ensure_ascii=False, allow_nan=False, separators=(",", ":")
+    ).encode()
+
+
+def _best(encoder: Callable[[], bytes], repeat: int) -> float:
+    return min(timeit.repeat(encoder, number=1, repeat=repeat))
+
+
+def main(repeat: int = 5) -> None:
+    """Print encoding time and throughput of each payload and format."""
+
+    payloads = {
+        "option chain": (_chain(), lambda rows: rows),
+        "orders": (_orders(), lambda rows: [_as_dict(row) for row in rows]),
+        "plans": (_plans(), lambda rows: [row.model_dump(mode="json") for row in rows]),
+    }
+    print(f"{'payload':<14}{'encoder':<38}{'ms':>9}{'rows/s':>13}{'speedup':>9}")
+    for name, (content, to_builtin) in payloads.items():
+        rows = len(content)
+        baseline = _best(partial(_default_route, content, to_builtin), repeat)
+        results = [("json.dumps (FastAPI default)", baseline)]
+        results.extend(
+            (
+                f"goldshore {media_type}",
+                _best(partial(encode, content, media_type), repeat),
+            )
+            for media_type in available_media_types()
+        )
+        for label, elapsed in results:
+            print(
+                f"{name:<14}{label:<38}{elapsed * 1e3:>9.2f}"
+                f"{rows / elapsed:>13,.0f}{baseline / elapsed:>9.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,32 @@
 """Shared helpers available to services and libraries."""
 
-from .clock import utc_now
-from .logging import build_structlog_config
+from .clock import (
+    SimulatedClock,
+    from_nanos,
+    reset_clock,
+    set_clock,
+    to_nanos,
+    use_clock,
+    utc_now,
+)
+from .events import EventBus, SocketBridge
+from .logging import build_structlog_config, configure_logging
+from .metrics import REGISTRY, Registry, export_from_env, timed
 
-__all__ = ["utc_now", "build_structlog_config"]
+__all__ = [
+    "REGISTRY",
+    "EventBus",
+    "Registry",
+    "SimulatedClock",
+    "SocketBridge",
+    "build_structlog_config",
+    "configure_logging",
+    "export_from_env",
+    "from_nanos",
+    "reset_clock",
+    "set_clock",
+    "timed",
+    "to_nanos",
+    "use_clock",
+    "utc_now",
+]
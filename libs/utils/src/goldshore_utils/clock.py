@@ -1,9 +1,97 @@
 """Time helpers for coordinating scheduler interactions."""
 
-from datetime import datetime, timezone
+from __future__ import annotations
+
+import contextlib
+from collections.abc import Callable, Iterator
+from datetime import datetime, timedelta, timezone
+
+Clock = Callable[[], datetime]
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)  # noqa: UP017 - datetime.UTC needs 3.11
+
+
+def system_now() -> datetime:
+    """Return the wall-clock UTC timestamp with timezone information."""
+
+    return datetime.now(timezone.utc)  # noqa: UP017 - datetime.UTC needs 3.11
+
+
+_source: Clock = system_now
 
 
 def utc_now() -> datetime:
-    """Return the current UTC timestamp with timezone information."""
+    """Return the current UTC timestamp from the active clock.
+
+    The active clock is the system clock unless replaced with
+    :func:`set_clock` or :func:`use_clock`, e.g. by a backtest replaying
+    history.
+    """
+
+    return _source()
+
+
+def set_clock(source: Clock) -> Clock:
+    """Install ``source`` as the process clock and return the previous one."""
+
+    global _source  # noqa: PLW0603
+    previous, _source = _source, source
+    return previous
+
+
+def reset_clock() -> None:
+    """Restore the system clock."""
+
+    set_clock(system_now)
+
+
+@contextlib.contextmanager
+def use_clock(source: Clock) -> Iterator[Clock]:
+    """Install ``source`` for the duration of the ``with`` block."""
+
+    previous = set_clock(source)
+    try:
+        yield source
+    finally:
+        set_clock(previous)
+
+
+class SimulatedClock:
+    """Manually advanced clock holding time as integer nanoseconds.
+
+    Setting the time is an integer store, so replay loops can advance it per
+    event cheaply; a ``datetime`` is only built when the clock is read.
+    """
+
+    def __init__(self, start: datetime | int = 0) -> None:
+        self.nanos = start if isinstance(start, int) else to_nanos(start)
+
+    def __call__(self) -> datetime:
+        return from_nanos(self.nanos)
+
+    def set(self, nanos: int) -> None:
+        """Move the clock to ``nanos`` since the Unix epoch."""
+
+        self.nanos = nanos
+
+    def advance(self, delta: timedelta) -> None:
+        """Move the clock forward by ``delta``."""
+
+        self.nanos += to_nanos(_EPOCH + delta)
+
+
+def to_nanos(timestamp: datetime) -> int:
+    """Return integer nanoseconds since the Unix epoch for an aware timestamp."""
+
+    if timestamp.tzinfo is None:
+        raise ValueError("Timestamps must be timezone-aware")
+    delta = timestamp - _EPOCH
+    return (delta.days * 86_400 + delta.seconds) * 1_000_000_000 + (
+        delta.microseconds * 1_000
+    )
+
+
+def from_nanos(nanos: int) -> datetime:
+    """Return the UTC timestamp ``nanos`` after the Unix epoch."""
 
-    return datetime.now(timezone.utc)
+    return _EPOCH + timedelta(microseconds=nanos // 1_000)
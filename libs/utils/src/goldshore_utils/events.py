@@ -0,0 +1,188 @@
+"""Typed publish/subscribe between components sharing a process or a host."""
+
+from __future__ import annotations
+
+import asyncio
+import inspect
+import logging
+import os
+import pickle
+import struct
+from collections.abc import Awaitable, Callable, Sequence
+from typing import TypeVar
+
+E = TypeVar("E")
+Handler = Callable[[E], "Awaitable[None] | None"]
+
+_FRAME_HEADER = struct.Struct("!I")
+
+logger = logging.getLogger(__name__)
+
+
+class EventBus:
+    """Deliver events to the handlers subscribed to their type.
+
+    Events are plain objects, usually frozen dataclasses, and are handed to
+    handlers by reference: publishing is a function call with no copying or
+    serialization. A handler subscribed to a type also receives events of
+    its subclasses. Synchronous handlers run inside :meth:`publish`;
+    coroutine handlers are scheduled as tasks on the running loop, which
+    :meth:`drain` awaits. A failing handler is logged and does not affect
+    the publisher or other handlers.
+    """
+
+    def __init__(self) -> None:
+        self._handlers: dict[type, list[Handler]] = {}
+        self._routes: dict[type, tuple[Handler, ...]] = {}
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    def subscribe(
+        self, event_type: type[E], handler: Callable[[E], Awaitable[None] | None]
+    ) -> Callable[[], None]:
+        """Call ``handler`` for every ``event_type`` event; return an unsubscriber."""
+
+        self._handlers.setdefault(event_type, []).append(handler)
+        self._routes.clear()
+
+        def unsubscribe() -> None:
+            handlers = self._handlers.get(event_type, [])
+            if handler in handlers:
+                handlers.remove(handler)
+                self._routes.clear()
+
+        return unsubscribe
+
+    def publish(self, event: object) -> None:
+        """Hand ``event`` to every handler subscribed to its type or a base."""
+
+        for handler in self._route(type(event)):
+            try:
+                result = handler(event)
+            except Exception:
+                logger.exception("Event handler failed for %r", event)
+                continue
+            if inspect.isawaitable(result):
+                task = asyncio.ensure_future(self._await(result, event))
+                self._tasks.add(task)
+                task.add_done_callback(self._tasks.discard)
+
+    async def drain(self) -> None:
+        """Wait for scheduled coroutine handlers, including ones they schedule."""
+
+        while self._tasks:
+            await asyncio.gather(*self._tasks)
+
+    def _route(self, event_type: type) -> tuple[Handler, ...]:
+        route = self._routes.get(event_type)
+        if route is None:
+            route = tuple(
+                handler
+                for base in event_type.__mro__
+                for handler in self._handlers.get(base, ())
+            )
+            self._routes[event_type] = route
+        return route
+
+    @staticmethod
+    async def _await(result: Awaitable[None], event: object) -> None:
+        try:
+            await result
+        except Exception:
+            logger.exception("Event handler failed for %r", event)
+
+
+class SocketBridge:
+    """Relay events of ``event_types`` between buses over a Unix socket.
+
+    One process calls :meth:`serve` and the others :meth:`connect` to the
+    same ``path``. Every event of a relayed type published on the local bus
+    is written to all peers. Events read from a peer are published on the
+    local bus and relayed to the other peers, but not echoed back. Frames
+    are length-prefixed pickles, so the socket must only be reachable by
+    trusted processes on the host; the server creates it with owner-only
+    permissions.
+    """
+
+    def __init__(
+        self, bus: EventBus, path: str | os.PathLike[str], event_types: Sequence[type]
+    ) -> None:
+        self.bus = bus
+        self.path = os.fspath(path)
+        self._writers: set[asyncio.StreamWriter] = set()
+        self._readers: set[asyncio.Task[None]] = set()
+        self._server: asyncio.AbstractServer | None = None
+        # The event being republished from a peer, and that peer's writer.
+        self._relaying: tuple[object, asyncio.StreamWriter] | None = None
+        self._unsubscribe = [
+            bus.subscribe(event_type, self._forward) for event_type in event_types
+        ]
+
+    async def serve(self) -> None:
+        """Listen on ``path`` for peers."""
+
+        if os.path.exists(self.path):
+            os.unlink(self.path)
+        self._server = await asyncio.start_unix_server(self._attach, path=self.path)
+        os.chmod(self.path, 0o600)
+
+    async def connect(self) -> None:
+        """Connect to the peer serving ``path``."""
+
+        reader, writer = await asyncio.open_unix_connection(self.path)
+        await self._attach(reader, writer)
+
+    async def close(self) -> None:
+        """Stop relaying and close every connection."""
+
+        for unsubscribe in self._unsubscribe:
+            unsubscribe()
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        for task in self._readers:
+            task.cancel()
+        await asyncio.gather(*self._readers, return_exceptions=True)
+        for writer in self._writers:
+            writer.close()
+        self._writers.clear()
+
+    async def _attach(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        self._writers.add(writer)
+        task = asyncio.create_task(self._read(reader, writer))
+        self._readers.add(task)
+        task.add_done_callback(self._readers.discard)
+
+    async def _read(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        try:
+            while True:
+                (size,) = _FRAME_HEADER.unpack(
+                    await reader.readexactly(_FRAME_HEADER.size)
+                )
+                event = pickle.loads(await reader.readexactly(size))
+                self._relaying = (event, writer)
+                try:
+                    self.bus.publish(event)
+                finally:
+                    self._relaying = None
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            self._writers.discard(writer)
+            writer.close()
+
+    def _forward(self, event: object) -> None:
+        source = None
+        if self._relaying is not None and self._relaying[0] is event:
+            source = self._relaying[1]
+        targets = [writer for writer in self._writers if writer is not source]
+        if not targets:
+            return
+        payload = pickle.dumps(event, protocol=pickle.HIGHEST_PROTOCOL)
+        frame = _FRAME_HEADER.pack(len(payload)) + payload
+        for writer in targets:
+            writer.write(frame)
@@ -1,6 +1,24 @@
 """Logging configuration helpers."""
 
-from typing import Any
+from __future__ import annotations
+
+import atexit
+import logging
+import logging.handlers
+import queue
+from datetime import datetime, timezone
+from typing import IO, Any
+
+import orjson
+
+from .metrics import REGISTRY
+
+DEFAULT_QUEUE_SIZE = 10_000
+
+_RECORD_FIELDS = frozenset(logging.LogRecord("", 0, "", 0, "", None, None).__dict__) | {
+    "message",
+    "asctime",
+}
 
 
 def build_structlog_config(service_name: str) -> dict[str, Any]:
@@ -11,3 +29,96 @@ def build_structlog_config(service_name: str) -> dict[str, Any]:
         "level": "INFO",
         "processors": ["add_timestamp", "add_log_level", "format_exc_info"],
     }
+
+
+class JSONFormatter(logging.Formatter):
+    """Render records as one JSON object per line.
+
+    Fields follow :func:`build_structlog_config`: ``timestamp``, ``level``,
+    ``service``, ``logger`` and ``event``, plus ``exception`` when an
+    exception is attached and any ``extra`` fields.
+    """
+
+    def __init__(self, service_name: str) -> None:
+        super().__init__()
+        self.service_name = service_name
+
+    def format(self, record: logging.LogRecord) -> str:
+        document: dict[str, Any] = {
+            "timestamp": datetime.fromtimestamp(
+                record.created,
+                timezone.utc,  # noqa: UP017 - datetime.UTC needs 3.11
+            ).isoformat(),
+            "level": record.levelname.lower(),
+            "service": self.service_name,
+            "logger": record.name,
+            "event": record.getMessage(),
+        }
+        if record.exc_info:
+            document["exception"] = self.formatException(record.exc_info)
+        for key, value in record.__dict__.items():
+            if key not in _RECORD_FIELDS and not key.startswith("_"):
+                document[key] = value
+        return orjson.dumps(document, default=repr).decode()
+
+
+class _NonBlockingHandler(logging.handlers.QueueHandler):
+    """Queue records without formatting them or waiting for space.
+
+    Formatting is left to the listener thread. When the queue is full the
+    record is dropped and counted in ``goldshore_log_records_dropped_total``
+    instead of stalling the caller.
+    """
+
+    def __init__(self, log_queue: queue.Queue[logging.LogRecord]) -> None:
+        super().__init__(log_queue)
+        self.dropped = REGISTRY.counter(
+            "goldshore_log_records_dropped_total",
+            "Log records dropped because the log queue was full",
+        )
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped.inc()
+
+
+_listener: logging.handlers.QueueListener | None = None
+
+
+def configure_logging(
+    service_name: str,
+    *,
+    stream: IO[str] | None = None,
+    queue_size: int = DEFAULT_QUEUE_SIZE,
+) -> logging.handlers.QueueListener:
+    """Route the root logger through a bounded queue to a JSON-lines writer.
+
+    Logging calls only append the record to the queue; a background thread
+    formats records with :class:`JSONFormatter` and writes them to
+    ``stream`` (standard error by default). The level comes from
+    :func:`build_structlog_config`. The first call installs the handler and
+    starts the thread, which is stopped and drained at interpreter exit;
+    later calls return the running listener.
+    """
+
+    global _listener  # noqa: PLW0603
+    if _listener is not None:
+        return _listener
+    config = build_structlog_config(service_name)
+    log_queue: queue.Queue[logging.LogRecord] = queue.Queue(maxsize=queue_size)
+    writer = logging.StreamHandler(stream)
+    writer.setFormatter(JSONFormatter(service_name))
+    _listener = logging.handlers.QueueListener(
+        log_queue, writer, respect_handler_level=True
+    )
+    root = logging.getLogger()
+    root.addHandler(_NonBlockingHandler(log_queue))
+    root.setLevel(config["level"])
+    _listener.start()
+    atexit.register(_listener.stop)
+    return _listener
@@ -0,0 +1,540 @@
+"""Low-overhead counters and latency histograms with Prometheus and OTLP export."""
+
+from __future__ import annotations
+
+import functools
+import inspect
+import logging
+import os
+import threading
+import time
+import urllib.parse
+import urllib.request
+from collections.abc import Callable, Sequence
+from typing import Any, TypeVar
+
+import orjson
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+# Histogram buckets follow the HDR layout: values below ``2 * _SUB_BUCKETS``
+# get a bucket each and every further power of two is split into
+# ``_SUB_BUCKETS`` equal buckets, bounding the relative error at 1/16.
+_SUB_BITS = 4
+_SUB_BUCKETS = 1 << _SUB_BITS
+_MAX_BITS = 42  # about 73 minutes in nanoseconds
+_BUCKETS = (_MAX_BITS - _SUB_BITS + 1) * _SUB_BUCKETS
+_MAX_VALUE = (1 << _MAX_BITS) - 1
+
+DEFAULT_BOUNDS = (
+    1e-6,
+    2.5e-6,
+    5e-6,
+    1e-5,
+    2.5e-5,
+    5e-5,
+    1e-4,
+    2.5e-4,
+    5e-4,
+    1e-3,
+    2.5e-3,
+    5e-3,
+    1e-2,
+    2.5e-2,
+    5e-2,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+OTLP_ENDPOINT_ENV = "OTEL_EXPORTER_OTLP_ENDPOINT"
+OTLP_HEADERS_ENV = "OTEL_EXPORTER_OTLP_HEADERS"
+OTLP_INTERVAL_ENV = "OTEL_METRIC_EXPORT_INTERVAL"
+DEFAULT_EXPORT_INTERVAL_MS = 60_000
+
+logger = logging.getLogger(__name__)
+
+
+def bucket_index(value: int) -> int:
+    """Return the histogram bucket holding the non-negative integer ``value``."""
+
+    shift = value.bit_length() - _SUB_BITS - 1
+    if shift <= 0:
+        return value
+    return (shift << _SUB_BITS) + (value >> shift)
+
+
+def bucket_upper_bound(index: int) -> int:
+    """Return the smallest value above bucket ``index``."""
+
+    if index < 2 * _SUB_BUCKETS:
+        return index + 1
+    shift, offset = divmod(index, _SUB_BUCKETS)
+    shift -= 1
+    return (_SUB_BUCKETS + offset + 1) << shift
+
+
+class _Sharded:
+    """Metric whose cells are per-thread, so writers never contend or lock.
+
+    Each thread increments its own list, registered on first use; readers
+    sum the lists of every thread that has written.
+    """
+
+    __slots__ = ("_local", "_lock", "_shards", "_size", "labels", "name")
+
+    def __init__(
+        self, name: str, labels: tuple[tuple[str, str], ...], size: int
+    ) -> None:
+        self.name = name
+        self.labels = labels
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._shards: list[list[int]] = []
+        self._size = size
+
+    def _register(self) -> list[int]:
+        cells = [0] * self._size
+        with self._lock:
+            self._shards.append(cells)
+        self._local.cells = cells
+        return cells
+
+    def _totals(self) -> list[int]:
+        with self._lock:
+            shards = list(self._shards)
+        if not shards:
+            return [0] * self._size
+        return [sum(column) for column in zip(*shards, strict=True)]
+
+
+class Counter(_Sharded):
+    """Monotonic integer counter."""
+
+    __slots__ = ()
+
+    def __init__(self, name: str, labels: tuple[tuple[str, str], ...] = ()) -> None:
+        super().__init__(name, labels, 1)
+
+    def inc(self, amount: int = 1) -> None:
+        """Add ``amount`` to the counter."""
+
+        try:
+            cells = self._local.cells
+        except AttributeError:
+            cells = self._register()
+        cells[0] += amount
+
+    @property
+    def value(self) -> int:
+        """Return the current total."""
+
+        return self._totals()[0]
+
+
+class Histogram(_Sharded):
+    """HDR-style histogram of non-negative integers, usually nanoseconds.
+
+    Recording computes the bucket with integer bit operations and bumps the
+    calling thread's own bucket array, so the hot path takes no lock.
+    ``scale`` converts recorded units to the exported unit, seconds for
+    latencies.
+    """
+
+    __slots__ = ("scale",)
+
+    def __init__(
+        self,
+        name: str,
+        labels: tuple[tuple[str, str], ...] = (),
+        *,
+        scale: float = 1e-9,
+    ) -> None:
+        # Buckets, then the running sum of recorded values.
+        super().__init__(name, labels, _BUCKETS + 1)
+        self.scale = scale
+
+    def record(self, value: int) -> None:
+        """Add one observation of ``value``."""
+
+        try:
+            cells = self._local.cells
+        except AttributeError:
+            cells = self._register()
+        if not 0 <= value <= _MAX_VALUE:
+            value = 0 if value < 0 else _MAX_VALUE
+        shift = value.bit_length() - _SUB_BITS - 1
+        cells[value if shift <= 0 else (shift << _SUB_BITS) + (value >> shift)] += 1
+        cells[-1] += value
+
+    def snapshot(self) -> tuple[list[int], int]:
+        """Return the bucket counts and the sum of recorded values."""
+
+        totals = self._totals()
+        return totals[:_BUCKETS], totals[_BUCKETS]
+
+    @property
+    def count(self) -> int:
+        """Return the number of observations."""
+
+        return sum(self.snapshot()[0])
+
+    def quantile(self, q: float) -> float:
+        """Return the ``q`` quantile in exported units, as a bucket upper bound."""
+
+        buckets, _ = self.snapshot()
+        target = q * sum(buckets)
+        seen = 0
+        for index, count in enumerate(buckets):
+            seen += count
+            if count and seen >= target:
+                return bucket_upper_bound(index) * self.scale
+        return 0.0
+
+    def cumulative(self, bounds: Sequence[float] = DEFAULT_BOUNDS) -> list[int]:
+        """Return observation counts at or below each bound, in exported units.
+
+        A bucket is counted under the first bound at or above its upper
+        edge, so counts are exact at bucket boundaries and otherwise lag by
+        at most one bucket width.
+        """
+
+        buckets, _ = self.snapshot()
+        limits = [bound / self.scale for bound in bounds]
+        counts = [0] * len(limits)
+        position = 0
+        running = 0
+        for index, count in enumerate(buckets):
+            if not count:
+                continue
+            upper = bucket_upper_bound(index) - 1
+            while position < len(limits) and limits[position] < upper:
+                counts[position] = running
+                position += 1
+            running += count
+        for remaining in range(position, len(limits)):
+            counts[remaining] = running
+        return counts
+
+
+class Registry:
+    """Named metric families keyed by their label values."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._help: dict[str, str] = {}
+        self._counters: dict[tuple[str, tuple[tuple[str, str], ...]], Counter] = {}
+        self._histograms: dict[tuple[str, tuple[tuple[str, str], ...]], Histogram] = {}
+
+    def counter(self, name: str, description: str = "", **labels: str) -> Counter:
+        """Return the counter ``name`` with ``labels``, creating it once."""
+
+        key = (name, tuple(sorted(labels.items())))
+        counter = self._counters.get(key)
+        if counter is None:
+            with self._lock:
+                counter = self._counters.setdefault(key, Counter(name, key[1]))
+                self._help.setdefault(name, description)
+        return counter
+
+    def histogram(self, name: str, description: str = "", **labels: str) -> Histogram:
+        """Return the latency histogram ``name`` with ``labels``, creating it once."""
+
+        key = (name, tuple(sorted(labels.items())))
+        histogram = self._histograms.get(key)
+        if histogram is None:
+            with self._lock:
+                histogram = self._histograms.setdefault(key, Histogram(name, key[1]))
+                self._help.setdefault(name, description)
+        return histogram
+
+    def counters(self) -> list[Counter]:
+        """Return every counter, grouped by name."""
+
+        with self._lock:
+            return sorted(self._counters.values(), key=lambda metric: metric.name)
+
+    def histograms(self) -> list[Histogram]:
+        """Return every histogram, grouped by name."""
+
+        with self._lock:
+            return sorted(self._histograms.values(), key=lambda metric: metric.name)
+
+    def help(self, name: str) -> str:
+        """Return the description registered for ``name``."""
+
+        return self._help.get(name, "")
+
+
+REGISTRY = Registry()
+
+
+def timed(
+    name: str,
+    description: str = "",
+    *,
+    registry: Registry | None = None,
+    **labels: str,
+) -> Callable[[F], F]:
+    """Record the wall time of every call of the decorated function.
+
+    Works for plain and coroutine functions; the histogram is resolved once
+    at decoration time, so each call only pays for two clock reads and
+    :meth:`Histogram.record`.
+    """
+
+    def decorate(func: F) -> F:
+        record = (registry or REGISTRY).histogram(name, description, **labels).record
+        clock = time.perf_counter_ns
+
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def timed_coroutine(*args: Any, **kwargs: Any) -> Any:
+                start = clock()
+                try:
+                    return await func(*args, **kwargs)
+                finally:
+                    record(clock() - start)
+
+            return timed_coroutine  # type: ignore[return-value]
+
+        @functools.wraps(func)
+        def timed_function(*args: Any, **kwargs: Any) -> Any:
+            start = clock()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                record(clock() - start)
+
+        return timed_function  # type: ignore[return-value]
+
+    return decorate
+
+
+def _format_labels(labels: Sequence[tuple[str, str]]) -> str:
+    if not labels:
+        return ""
+    escaped = (
+        (name, value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"'))
+        for name, value in labels
+    )
+    return "{" + ",".join(f'{name}="{value}"' for name, value in escaped) + "}"
+
+
+def render_prometheus(
+    registry: Registry = REGISTRY, *, bounds: Sequence[float] = DEFAULT_BOUNDS
+) -> str:
+    """Return every metric in the Prometheus text exposition format."""
+
+    lines: list[str] = []
+    seen: set[str] = set()
+    for counter in registry.counters():
+        if counter.name not in seen:
+            seen.add(counter.name)
+            lines.append(f"# HELP {counter.name} {registry.help(counter.name)}")
+            lines.append(f"# TYPE {counter.name} counter")
+        lines.append(f"{counter.name}{_format_labels(counter.labels)} {counter.value}")
+    for histogram in registry.histograms():
+        name = histogram.name
+        if name not in seen:
+            seen.add(name)
+            lines.append(f"# HELP {name} {registry.help(name)}")
+            lines.append(f"# TYPE {name} histogram")
+        buckets, total = histogram.snapshot()
+        count = sum(buckets)
+        for bound, cumulative in zip(bounds, histogram.cumulative(bounds), strict=True):
+            labels = _format_labels((*histogram.labels, ("le", repr(bound))))
+            lines.append(f"{name}_bucket{labels} {cumulative}")
+        labels = _format_labels((*histogram.labels, ("le", "+Inf")))
+        lines.append(f"{name}_bucket{labels} {count}")
+        labels = _format_labels(histogram.labels)
+        lines.append(f"{name}_sum{labels} {total * histogram.scale!r}")
+        lines.append(f"{name}_count{labels} {count}")
+    return "\n".join(lines) + "\n"
+
+
+def _attributes(labels: Sequence[tuple[str, str]]) -> list[dict[str, object]]:
+    return [{"key": key, "value": {"stringValue": value}} for key, value in labels]
+
+
+def otlp_payload(
+    registry: Registry,
+    *,
+    service_name: str,
+    start_ns: int,
+    bounds: Sequence[float] = DEFAULT_BOUNDS,
+) -> dict[str, object]:
+    """Return the registry as an OTLP/HTTP JSON ``ExportMetricsServiceRequest``."""
+
+    now = str(time.time_ns())
+    start = str(start_ns)
+    metrics: dict[str, dict[str, Any]] = {}
+    for counter in registry.counters():
+        metric = metrics.setdefault(
+            counter.name,
+            {
+                "name": counter.name,
+                "description": registry.help(counter.name),
+                "sum": {
+                    "dataPoints": [],
+                    "aggregationTemporality": 2,
+                    "isMonotonic": True,
+                },
+            },
+        )
+        metric["sum"]["dataPoints"].append(
+            {
+                "attributes": _attributes(counter.labels),
+                "startTimeUnixNano": start,
+                "timeUnixNano": now,
+                "asInt": str(counter.value),
+            }
+        )
+    for histogram in registry.histograms():
+        metric = metrics.setdefault(
+            histogram.name,
+            {
+                "name": histogram.name,
+                "description": registry.help(histogram.name),
+                "unit": "s",
+                "histogram": {"dataPoints": [], "aggregationTemporality": 2},
+            },
+        )
+        buckets, total = histogram.snapshot()
+        cumulative = histogram.cumulative(bounds)
+        count = sum(buckets)
+        metric["histogram"]["dataPoints"].append(
+            {
+                "attributes": _attributes(histogram.labels),
+                "startTimeUnixNano": start,
+                "timeUnixNano": now,
+                "count": str(count),
+                "sum": total * histogram.scale,
+                "explicitBounds": list(bounds),
+                "bucketCounts": [
+                    str(value - previous)
+                    for value, previous in zip(
+                        [*cumulative, count], [0, *cumulative], strict=True
+                    )
+                ],
+            }
+        )
+    return {
+        "resourceMetrics": [
+            {
+                "resource": {
+                    "attributes": _attributes((("service.name", service_name),))
+                },
+                "scopeMetrics": [
+                    {
+                        "scope": {"name": "goldshore_utils.metrics"},
+                        "metrics": list(metrics.values()),
+                    }
+                ],
+            }
+        ]
+    }
+
+
+def _parse_headers(value: str) -> dict[str, str]:
+    headers = {}
+    for item in value.split(","):
+        key, sep, header = item.partition("=")
+        if sep:
+            headers[urllib.parse.unquote(key.strip())] = urllib.parse.unquote(
+                header.strip()
+            )
+    return headers
+
+
+class OTLPExporter:
+    """Push the registry to an OTLP/HTTP collector from a daemon thread."""
+
+    def __init__(
+        self,
+        endpoint: str,
+        *,
+        service_name: str,
+        headers: dict[str, str] | None = None,
+        interval: float = DEFAULT_EXPORT_INTERVAL_MS / 1000,
+        registry: Registry = REGISTRY,
+    ) -> None:
+        self.url = endpoint.rstrip("/") + "/v1/metrics"
+        self.service_name = service_name
+        self.headers = {"Content-Type": "application/json", **(headers or {})}
+        self.interval = interval
+        self.registry = registry
+        self._start_ns = time.time_ns()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, name="otlp-metrics", daemon=True
+        )
+
+    def start(self) -> None:
+        """Begin exporting every ``interval`` seconds."""
+
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Export once more and stop the thread."""
+
+        self._stop.set()
+        if self._thread.is_alive():
+            self._thread.join()
+
+    def export(self) -> None:
+        """Send the current metrics, logging rather than raising on failure."""
+
+        body = orjson.dumps(
+            otlp_payload(
+                self.registry, service_name=self.service_name, start_ns=self._start_ns
+            )
+        )
+        request = urllib.request.Request(
+            self.url, data=body, headers=self.headers, method="POST"
+        )
+        try:
+            with urllib.request.urlopen(request, timeout=10):
+                pass
+        except OSError as exc:
+            logger.warning("OTLP metrics export to %s failed: %s", self.url, exc)
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.export()
+        self.export()
+
+
+_exporter: OTLPExporter | None = None
+_exporter_lock = threading.Lock()
+
+
+def export_from_env(service_name: str) -> OTLPExporter | None:
+    """Start the process's OTLP exporter when ``OTEL_EXPORTER_OTLP_ENDPOINT`` is set.
+
+    Uses the standard ``OTEL_EXPORTER_OTLP_HEADERS`` and
+    ``OTEL_METRIC_EXPORT_INTERVAL`` (milliseconds) variables. Repeated calls
+    return the exporter already running.
+    """
+
+    global _exporter  # noqa: PLW0603
+    endpoint = os.environ.get(OTLP_ENDPOINT_ENV)
+    if not endpoint:
+        return None
+    with _exporter_lock:
+        if _exporter is None:
+            _exporter = OTLPExporter(
+                endpoint,
+                service_name=service_name,
+                headers=_parse_headers(os.environ.get(OTLP_HEADERS_ENV, "")),
+                interval=float(
+                    os.environ.get(OTLP_INTERVAL_ENV, str(DEFAULT_EXPORT_INTERVAL_MS))
+                )
+                / 1000,
+            )
+            _exporter.start()
+        return _exporter
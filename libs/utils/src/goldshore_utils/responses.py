@@ -0,0 +1,111 @@
+"""Starlette integration: negotiated responses, request timing and ``/metrics``."""
+
+from __future__ import annotations
+
+import contextvars
+import time
+from collections.abc import Mapping
+from typing import Any
+
+from starlette.requests import Request
+from starlette.responses import Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from .metrics import REGISTRY, Histogram, Registry, render_prometheus
+from .serialization import JSON_MEDIA_TYPE, encode, negotiate
+
+PROMETHEUS_MEDIA_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+HTTP_REQUEST_METRIC = "goldshore_http_request_seconds"
+
+_accept: contextvars.ContextVar[str] = contextvars.ContextVar(
+    "goldshore_accept", default=""
+)
+
+
+class NegotiatedResponse(Response):
+    """Response encoded in the format the request's ``Accept`` header prefers.
+
+    The header is read from the context set by :class:`NegotiationMiddleware`;
+    without the middleware every response is JSON.
+    """
+
+    media_type = JSON_MEDIA_TYPE
+
+    def render(self, content: Any) -> bytes:
+        self.media_type = negotiate(_accept.get(), content)
+        return encode(content, self.media_type)
+
+    def init_headers(self, headers: Mapping[str, str] | None = None) -> None:
+        super().init_headers(headers)
+        self.headers.append("Vary", "Accept")
+
+
+class NegotiationMiddleware:
+    """Expose each HTTP request's ``Accept`` header to :class:`NegotiatedResponse`."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        accept = ""
+        for name, value in scope["headers"]:
+            if name == b"accept":
+                accept = value.decode("latin-1")
+                break
+        token = _accept.set(accept)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            _accept.reset(token)
+
+
+class MetricsMiddleware:
+    """Time every HTTP request into ``goldshore_http_request_seconds``.
+
+    Series are labelled by method, route template and status code, so
+    requests for different identifiers on one route share a series and
+    unmatched paths collapse into ``route="unmatched"``.
+    """
+
+    def __init__(self, app: ASGIApp, registry: Registry = REGISTRY) -> None:
+        self.app = app
+        self.registry = registry
+        self._histograms: dict[tuple[str, str, int], Histogram] = {}
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        start = time.perf_counter_ns()
+        status = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            route = getattr(scope.get("route"), "path", "unmatched")
+            key = (scope["method"], route, status)
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = self.registry.histogram(
+                    HTTP_REQUEST_METRIC,
+                    "HTTP request latency by route",
+                    method=scope["method"],
+                    route=route,
+                    status=str(status),
+                )
+            histogram.record(time.perf_counter_ns() - start)
+
+
+async def metrics_endpoint(request: Request) -> Response:
+    """Return the process's metrics in the Prometheus text format."""
+
+    return Response(render_prometheus(), media_type=PROMETHEUS_MEDIA_TYPE)
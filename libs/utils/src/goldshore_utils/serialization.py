@@ -0,0 +1,133 @@
+"""Fast JSON encoding and ``Accept``-negotiated binary formats."""
+
+from __future__ import annotations
+
+from collections.abc import Mapping, Sequence
+from typing import Any
+
+import orjson
+
+try:
+    import msgpack
+except ImportError:  # optional: pip install goldshore-utils[msgpack]
+    msgpack = None
+
+try:
+    import pyarrow
+    import pyarrow.ipc
+except ImportError:  # optional: pip install goldshore-utils[arrow]
+    pyarrow = None
+
+JSON_MEDIA_TYPE = "application/json"
+MSGPACK_MEDIA_TYPE = "application/msgpack"
+ARROW_MEDIA_TYPE = "application/vnd.apache.arrow.stream"
+
+_OPTIONS = orjson.OPT_SERIALIZE_NUMPY
+_MSGPACK_ALIASES = frozenset({MSGPACK_MEDIA_TYPE, "application/x-msgpack"})
+
+
+def _default(value: Any) -> Any:
+    serializer = getattr(type(value), "__pydantic_serializer__", None)
+    if serializer is not None:
+        return serializer.to_python(value, mode="json")
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
+def dumps(content: Any) -> bytes:
+    """Encode ``content`` as compact UTF-8 JSON.
+
+    Dataclasses, datetimes and NumPy arrays and scalars are encoded natively
+    by orjson. A Pydantic model at the top level is written straight to bytes
+    by its compiled serializer; nested models go through their JSON-mode
+    Python form. Non-finite floats become ``null``.
+    """
+
+    serializer = getattr(type(content), "__pydantic_serializer__", None)
+    if serializer is not None:
+        return serializer.to_json(content)
+    return orjson.dumps(content, default=_default, option=_OPTIONS)
+
+
+def loads(data: bytes | str) -> Any:
+    """Decode JSON produced by :func:`dumps`."""
+
+    return orjson.loads(data)
+
+
+def available_media_types() -> tuple[str, ...]:
+    """Return the response formats supported by the installed packages."""
+
+    media_types = [JSON_MEDIA_TYPE]
+    if msgpack is not None:
+        media_types.append(MSGPACK_MEDIA_TYPE)
+    if pyarrow is not None:
+        media_types.append(ARROW_MEDIA_TYPE)
+    return tuple(media_types)
+
+
+def negotiate(accept: str | None, content: Any = None) -> str:
+    """Return the media type to encode ``content`` with for an ``Accept`` header.
+
+    Media ranges are taken in descending ``q`` order. MessagePack is chosen
+    when requested and installed, and Arrow only for a non-empty list of
+    records; everything else, including wildcards, falls back to JSON.
+    """
+
+    if not accept:
+        return JSON_MEDIA_TYPE
+    ranges: list[tuple[float, int, str]] = []
+    for index, part in enumerate(accept.split(",")):
+        media_type, *params = (item.strip() for item in part.split(";"))
+        quality = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        if quality > 0.0:
+            ranges.append((-quality, index, media_type.lower()))
+    for _, _, media_type in sorted(ranges):
+        if media_type in _MSGPACK_ALIASES and msgpack is not None:
+            return MSGPACK_MEDIA_TYPE
+        if (
+            media_type == ARROW_MEDIA_TYPE
+            and pyarrow is not None
+            and _is_records(content)
+        ):
+            return ARROW_MEDIA_TYPE
+        if media_type in (JSON_MEDIA_TYPE, "application/*", "*/*"):
+            return JSON_MEDIA_TYPE
+    return JSON_MEDIA_TYPE
+
+
+def encode(content: Any, media_type: str) -> bytes:
+    """Encode ``content`` in a media type returned by :func:`negotiate`."""
+
+    if media_type == MSGPACK_MEDIA_TYPE and msgpack is not None:
+        return msgpack.packb(content, default=_plain)
+    if media_type == ARROW_MEDIA_TYPE and pyarrow is not None:
+        table = pyarrow.Table.from_pylist(list(content))
+        sink = pyarrow.BufferOutputStream()
+        with pyarrow.ipc.new_stream(sink, table.schema) as writer:
+            writer.write_table(table)
+        return sink.getvalue().to_pybytes()
+    return dumps(content)
+
+
+def _is_records(content: Any) -> bool:
+    return (
+        isinstance(content, Sequence)
+        and not isinstance(content, (str, bytes))
+        and bool(content)
+        and all(isinstance(row, Mapping) for row in content)
+    )
+
+
+def _plain(value: Any) -> Any:
+    # MessagePack only knows plain containers and scalars; richer values
+    # (models, dataclasses, datetimes, arrays) go through the JSON encoder.
+    return loads(dumps(value))
@@ -0,0 +1,273 @@
+"""Vectorized P&L and execution-quality analytics over executed fills."""
+
+from __future__ import annotations
+
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass
+from datetime import datetime
+
+import numpy as np
+import numpy.typing as npt
+import pandas as pd
+
+FloatArray = npt.NDArray[np.float64]
+ANALYTICS_VERSION = "1"
+BPS = 1e4
+SECONDS_PER_YEAR = 365.0 * 24.0 * 60.0 * 60.0
+GREEKS = ("delta", "gamma", "vega", "theta")
+
+
+def _column(
+    fills: Sequence[Mapping[str, object]], key: str, default: float = np.nan
+) -> FloatArray:
+    values = [fill.get(key) for fill in fills]
+    return np.array(
+        [default if value is None else value for value in values], dtype=np.float64
+    )
+
+
+@dataclass(frozen=True)
+class FillArrays:
+    """Executed fills held as parallel arrays sorted by execution time.
+
+    ``quantity`` is signed: positive for buys and negative for sells.
+    ``codes`` index into ``symbols``. Optional per-fill fields that are
+    absent are ``NaN`` (``arrival_price``, ``underlying_price``,
+    ``implied_volatility``) or zero (per-unit greeks).
+    """
+
+    timestamps: npt.NDArray[np.int64]
+    codes: npt.NDArray[np.int64]
+    symbols: tuple[str, ...]
+    quantity: FloatArray
+    price: FloatArray
+    commission: FloatArray
+    arrival_price: FloatArray
+    underlying_price: FloatArray
+    implied_volatility: FloatArray
+    greeks: Mapping[str, FloatArray]
+
+    @classmethod
+    def from_records(cls, fills: Sequence[Mapping[str, object]]) -> FillArrays:
+        """Build arrays from fill dictionaries.
+
+        Each fill needs ``symbol``, ``quantity`` and ``price``. ``side`` is
+        ``"buy"`` or ``"sell"``; without it the sign of ``quantity`` is used.
+        ``timestamp`` (ISO 8601 or ``datetime``) orders the fills; when any
+        fill lacks one, input order is kept. ``commission``,
+        ``arrival_price``, ``underlying_price``, ``implied_volatility`` and
+        per-unit ``delta``, ``gamma``, ``vega`` and ``theta`` are optional.
+        """
+
+        quantity = np.abs(_column(fills, "quantity"))
+        sells = np.array([fill.get("side") == "sell" for fill in fills], dtype=bool)
+        unsided = np.array([fill.get("side") is None for fill in fills], dtype=bool)
+        signed = np.where(sells, -quantity, quantity)
+        signed = np.where(unsided, _column(fills, "quantity"), signed)
+
+        raw_stamps = [fill.get("timestamp") for fill in fills]
+        if fills and all(stamp is not None for stamp in raw_stamps):
+            stamps = (
+                pd.to_datetime(pd.Series(raw_stamps), utc=True, format="ISO8601")
+                .to_numpy(dtype="datetime64[ns]")
+                .astype(np.int64)
+            )
+        else:
+            stamps = np.zeros(len(fills), dtype=np.int64)
+        order = np.argsort(stamps, kind="stable")
+
+        names, codes = np.unique(
+            np.array([str(fill["symbol"]) for fill in fills], dtype=str),
+            return_inverse=True,
+        )
+        return cls(
+            timestamps=stamps[order],
+            codes=codes.astype(np.int64)[order],
+            symbols=tuple(names.tolist()),
+            quantity=signed[order],
+            price=_column(fills, "price")[order],
+            commission=_column(fills, "commission", 0.0)[order],
+            arrival_price=_column(fills, "arrival_price")[order],
+            underlying_price=_column(fills, "underlying_price")[order],
+            implied_volatility=_column(fills, "implied_volatility")[order],
+            greeks={name: _column(fills, name, 0.0)[order] for name in GREEKS},
+        )
+
+    def __len__(self) -> int:
+        return int(self.price.size)
+
+    def per_symbol(self, values: FloatArray) -> FloatArray:
+        """Return ``values`` summed per symbol."""
+
+        return np.bincount(self.codes, weights=values, minlength=len(self.symbols))
+
+    def lookup(self, mapping: Mapping[str, float] | None) -> FloatArray:
+        """Return ``mapping`` as a per-symbol array, ``NaN`` where missing."""
+
+        mapping = mapping or {}
+        return np.array(
+            [mapping.get(symbol, np.nan) for symbol in self.symbols], dtype=np.float64
+        )
+
+
+@dataclass(frozen=True)
+class FillAnalytics:
+    """Per-symbol P&L, execution quality and greek attribution.
+
+    Realized and unrealized P&L use period average cost: the quantity
+    matched between buys and sells realizes the gap between their average
+    prices, and the net remainder is marked against the average price of
+    its side. The two always sum to mark-to-market P&L before commission.
+    Execution costs are signed so that a positive value is a cost.
+    """
+
+    symbols: tuple[str, ...]
+    position: FloatArray
+    realized_pnl: FloatArray
+    unrealized_pnl: FloatArray
+    commission: FloatArray
+    notional: FloatArray
+    arrival_cost: FloatArray
+    arrival_notional: FloatArray
+    vwap_cost: FloatArray
+    greeks: Mapping[str, FloatArray]
+    attribution: Mapping[str, FloatArray]
+    fills: int
+
+    @property
+    def pnl(self) -> FloatArray:
+        """Return per-symbol P&L net of commission."""
+
+        return self.realized_pnl + self.unrealized_pnl - self.commission
+
+    def metrics(self) -> dict[str, float]:
+        """Return portfolio totals for the evaluation report."""
+
+        notional = float(self.notional.sum())
+        arrival_notional = float(self.arrival_notional.sum())
+        arrival_cost = float(self.arrival_cost.sum())
+        shortfall = arrival_cost + float(self.commission.sum())
+        attributed = sum(float(values.sum()) for values in self.attribution.values())
+        pnl = float(self.pnl.sum())
+        metrics = {
+            "pnl": pnl,
+            "realized_pnl": float(self.realized_pnl.sum()),
+            "unrealized_pnl": float(self.unrealized_pnl.sum()),
+            "commission": float(self.commission.sum()),
+            "notional": notional,
+            "fills": float(self.fills),
+            "arrival_slippage_bps": (
+                arrival_cost / arrival_notional * BPS if arrival_notional else 0.0
+            ),
+            "vwap_slippage_bps": (
+                float(self.vwap_cost.sum()) / notional * BPS if notional else 0.0
+            ),
+            "implementation_shortfall": shortfall,
+            "implementation_shortfall_bps": (
+                shortfall / arrival_notional * BPS if arrival_notional else 0.0
+            ),
+        }
+        metrics.update(
+            {name: float(values.sum()) for name, values in self.greeks.items()}
+        )
+        metrics.update(
+            {
+                f"{name}_pnl": float(values.sum())
+                for name, values in self.attribution.items()
+            }
+        )
+        metrics["residual_pnl"] = pnl - attributed
+        return metrics
+
+
+def analyze_fills(  # noqa: PLR0913
+    fills: FillArrays | Sequence[Mapping[str, object]],
+    *,
+    marks: Mapping[str, float] | None = None,
+    benchmarks: Mapping[str, float] | None = None,
+    underlying_marks: Mapping[str, float] | None = None,
+    volatility_marks: Mapping[str, float] | None = None,
+    as_of: datetime | None = None,
+) -> FillAnalytics:
+    """Compute P&L, slippage and greek attribution for ``fills``.
+
+    Every statistic is a whole-array expression or a per-symbol
+    ``np.bincount`` reduction, so cost is linear in the number of fills.
+
+    ``marks`` value open positions and default to each symbol's last fill
+    price. Arrival slippage compares each fill with its ``arrival_price``,
+    falling back to the symbol's first fill price; implementation shortfall
+    adds commission to that cost. ``benchmarks`` are market VWAPs per
+    symbol and default to the VWAP of the fills themselves. Greek
+    attribution explains P&L since each fill from moves to
+    ``underlying_marks`` (delta, gamma), ``volatility_marks`` (vega) and
+    the time elapsed until ``as_of`` (theta, per year), which defaults to
+    the last fill. Whatever the greeks do not explain is ``residual_pnl``.
+    """
+
+    arrays = fills if isinstance(fills, FillArrays) else FillArrays.from_records(fills)
+    codes, quantity, price = arrays.codes, arrays.quantity, arrays.price
+    buys = np.where(quantity > 0.0, quantity, 0.0)
+    sells = np.where(quantity < 0.0, -quantity, 0.0)
+
+    bought = arrays.per_symbol(buys)
+    sold = arrays.per_symbol(sells)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        buy_price = np.nan_to_num(arrays.per_symbol(buys * price) / bought)
+        sell_price = np.nan_to_num(arrays.per_symbol(sells * price) / sold)
+    position = bought - sold
+    matched = np.minimum(bought, sold)
+    open_price = np.where(position > 0.0, buy_price, sell_price)
+
+    _, first = np.unique(codes, return_index=True)
+    _, last = np.unique(codes[::-1], return_index=True)
+    mark = arrays.lookup(marks)
+    mark = np.where(np.isnan(mark), price[::-1][last], mark)
+    arrival = arrays.arrival_price
+    arrival = np.where(np.isnan(arrival), price[first][codes], arrival)
+
+    absolute = np.abs(quantity)
+    notional = arrays.per_symbol(absolute * price)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        own_vwap = notional / arrays.per_symbol(absolute)
+    benchmark = arrays.lookup(benchmarks)
+    benchmark = np.where(np.isnan(benchmark), own_vwap, benchmark)
+
+    greeks = {
+        name: arrays.per_symbol(quantity * values)
+        for name, values in arrays.greeks.items()
+    }
+    move = arrays.lookup(underlying_marks)[codes] - arrays.underlying_price
+    move = np.nan_to_num(move)
+    volatility_move = np.nan_to_num(
+        arrays.lookup(volatility_marks)[codes] - arrays.implied_volatility
+    )
+    end = (
+        int(pd.Timestamp(as_of).value)
+        if as_of is not None
+        else int(arrays.timestamps.max(initial=0))
+    )
+    elapsed = (end - arrays.timestamps) / 1e9 / SECONDS_PER_YEAR
+    attribution = {
+        "delta": arrays.per_symbol(quantity * arrays.greeks["delta"] * move),
+        "gamma": arrays.per_symbol(
+            0.5 * quantity * arrays.greeks["gamma"] * move * move
+        ),
+        "vega": arrays.per_symbol(quantity * arrays.greeks["vega"] * volatility_move),
+        "theta": arrays.per_symbol(quantity * arrays.greeks["theta"] * elapsed),
+    }
+
+    return FillAnalytics(
+        symbols=arrays.symbols,
+        position=position,
+        realized_pnl=matched * (sell_price - buy_price),
+        unrealized_pnl=position * (mark - open_price),
+        commission=arrays.per_symbol(arrays.commission),
+        notional=notional,
+        arrival_cost=arrays.per_symbol(quantity * (price - arrival)),
+        arrival_notional=arrays.per_symbol(absolute * arrival),
+        vwap_cost=arrays.per_symbol(quantity * (price - benchmark[codes])),
+        greeks=greeks,
+        attribution=attribution,
+        fills=len(arrays),
+    )
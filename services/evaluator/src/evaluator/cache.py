@@ -0,0 +1,169 @@
+"""Two-tier, content-addressed cache of evaluation results."""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import json
+import os
+from collections import OrderedDict
+from collections.abc import Mapping, Sequence
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any
+
+DEFAULT_MEMORY_ENTRIES = 1024
+DEFAULT_DISK_BYTES = 256 * 1024 * 1024
+KEY_HEX_DIGITS = 32
+
+CachedResult = dict[str, Any]
+
+
+def evaluation_key(
+    plan_id: str,
+    fills: Sequence[Mapping[str, object]],
+    options: Mapping[str, object],
+    *,
+    version: str,
+) -> str:
+    """Return a content hash of an evaluation request.
+
+    The hash covers ``plan_id``, the fills, the valuation ``options`` and the
+    analytics ``version``, serialized as canonical JSON so that key order in
+    the fill dictionaries does not matter.
+    """
+
+    digest = hashlib.blake2b(digest_size=KEY_HEX_DIGITS // 2)
+    header = {"plan_id": plan_id, "options": options, "version": version}
+    digest.update(json.dumps(header, sort_keys=True, default=str).encode())
+    encoder = json.JSONEncoder(sort_keys=True, separators=(",", ":"), default=str)
+    for fill in fills:
+        digest.update(encoder.encode(fill).encode())
+        digest.update(b"\n")
+    return digest.hexdigest()
+
+
+@dataclass
+class CacheStats:
+    """Counters used to size the cache tiers."""
+
+    memory_hits: int = 0
+    disk_hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    disk_evictions: int = 0
+    memory_entries: int = 0
+    disk_entries: int = 0
+    disk_bytes: int = 0
+
+    def as_dict(self) -> dict[str, int]:
+        """Return the counters as a plain dictionary."""
+
+        return asdict(self)
+
+
+class ResultCache:
+    """LRU cache of evaluation results with an optional on-disk tier.
+
+    The memory tier holds up to ``memory_entries`` results. When
+    ``directory`` is set every result is also written there as
+    ``<key>.json`` and the least recently used files are deleted once their
+    total size exceeds ``max_bytes``. Disk hits are promoted back into
+    memory, and the disk tier survives restarts.
+    """
+
+    def __init__(
+        self,
+        directory: str | os.PathLike[str] | None = None,
+        *,
+        memory_entries: int = DEFAULT_MEMORY_ENTRIES,
+        max_bytes: int = DEFAULT_DISK_BYTES,
+    ) -> None:
+        self.memory_entries = memory_entries
+        self.max_bytes = max_bytes
+        self.stats = CacheStats()
+        self._memory: OrderedDict[str, CachedResult] = OrderedDict()
+        self._files: OrderedDict[str, int] = OrderedDict()
+        self._directory = Path(directory) if directory is not None else None
+        if self._directory is not None:
+            self._directory.mkdir(parents=True, exist_ok=True)
+            paths = sorted(
+                self._directory.glob("*.json"), key=lambda path: path.stat().st_mtime
+            )
+            for path in paths:
+                self._files[path.stem] = path.stat().st_size
+            self.stats.disk_bytes = sum(self._files.values())
+            self._evict_files()
+        self._update_sizes()
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._memory or key in self._files
+
+    def get(self, key: str) -> CachedResult | None:
+        """Return the cached result for ``key`` and refresh its recency."""
+
+        result = self._memory.get(key)
+        if result is not None:
+            self._memory.move_to_end(key)
+            self.stats.memory_hits += 1
+            return result
+        result = self._read(key)
+        if result is None:
+            self.stats.misses += 1
+            return None
+        self.stats.disk_hits += 1
+        self._remember(key, result)
+        return result
+
+    def put(self, key: str, result: CachedResult) -> None:
+        """Store ``result`` under ``key`` in both tiers."""
+
+        self._remember(key, result)
+        if self._directory is not None and key not in self._files:
+            path = self._directory / f"{key}.json"
+            tmp = path.with_suffix(".tmp")
+            data = json.dumps(result, separators=(",", ":")).encode()
+            tmp.write_bytes(data)
+            os.replace(tmp, path)
+            self._files[key] = len(data)
+            self.stats.disk_bytes += len(data)
+            self._evict_files()
+        self._update_sizes()
+
+    def _remember(self, key: str, result: CachedResult) -> None:
+        self._memory[key] = result
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_entries:
+            self._memory.popitem(last=False)
+            self.stats.evictions += 1
+        self._update_sizes()
+
+    def _read(self, key: str) -> CachedResult | None:
+        if self._directory is None or key not in self._files:
+            return None
+        path = self._directory / f"{key}.json"
+        try:
+            result = json.loads(path.read_bytes())
+            os.utime(path)
+        except (OSError, ValueError):
+            self._forget(key)
+            return None
+        self._files.move_to_end(key)
+        return result
+
+    def _evict_files(self) -> None:
+        while self.stats.disk_bytes > self.max_bytes and self._files:
+            key = next(iter(self._files))
+            self._forget(key)
+            self.stats.disk_evictions += 1
+
+    def _forget(self, key: str) -> None:
+        self.stats.disk_bytes -= self._files.pop(key)
+        if self._directory is not None:
+            with contextlib.suppress(FileNotFoundError):
+                (self._directory / f"{key}.json").unlink()
+        self._update_sizes()
+
+    def _update_sizes(self) -> None:
+        self.stats.memory_entries = len(self._memory)
+        self.stats.disk_entries = len(self._files)
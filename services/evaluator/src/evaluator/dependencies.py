@@ -0,0 +1,18 @@
+"""Request-scoped accessors for evaluator service state."""
+
+from __future__ import annotations
+
+from typing import Annotated
+
+from fastapi import Depends, Request
+
+from .evaluations import EvaluationJobs
+
+
+def get_jobs(request: Request) -> EvaluationJobs:
+    """Return the evaluation jobs attached to the running application."""
+
+    return request.app.state.jobs
+
+
+Jobs = Annotated[EvaluationJobs, Depends(get_jobs)]
@@ -0,0 +1,138 @@
+"""Background evaluation jobs addressed by the content of their request."""
+
+from __future__ import annotations
+
+import asyncio
+import math
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass, field
+from typing import Any
+
+from .analytics import ANALYTICS_VERSION, analyze_fills
+from .cache import ResultCache, evaluation_key
+
+DEFAULT_ASYNC_THRESHOLD = 10_000
+ID_PREFIX = "eval-"
+
+
+@dataclass
+class Evaluation:
+    """State of one evaluation: ``pending``, ``completed`` or ``failed``."""
+
+    evaluation_id: str
+    plan_id: str
+    status: str = "pending"
+    metrics: dict[str, float] = field(default_factory=dict)
+    detail: str | None = None
+
+
+@dataclass
+class EvaluationJobs:
+    """Run evaluations inline when small and on a worker thread when large.
+
+    An evaluation's identifier is the content hash of its plan, fills,
+    options and the analytics version, so resubmitting an identical request
+    returns the cached result, or joins the run already in progress, instead
+    of recomputing. Completed results live in ``cache``; only pending and
+    failed evaluations are held in ``evaluations``.
+
+    Evaluations of at most ``async_threshold`` fills are computed before
+    :meth:`submit` returns. Larger ones are recorded as ``pending`` and run
+    in a background task that offloads hashing and the NumPy work to a
+    thread, so the event loop keeps serving other requests while callers
+    poll :meth:`get`.
+    """
+
+    async_threshold: int = DEFAULT_ASYNC_THRESHOLD
+    cache: ResultCache = field(default_factory=ResultCache)
+    evaluations: dict[str, Evaluation] = field(default_factory=dict)
+    _tasks: set[asyncio.Task[None]] = field(default_factory=set, repr=False)
+
+    def get(self, evaluation_id: str) -> Evaluation | None:
+        """Return the evaluation with ``evaluation_id`` if known."""
+
+        evaluation = self.evaluations.get(evaluation_id)
+        if evaluation is not None:
+            return evaluation
+        cached = self.cache.get(evaluation_id.removeprefix(ID_PREFIX))
+        if cached is None:
+            return None
+        return Evaluation(
+            evaluation_id=evaluation_id,
+            plan_id=cached["plan_id"],
+            status="completed",
+            metrics=cached["metrics"],
+        )
+
+    async def submit(
+        self,
+        plan_id: str,
+        fills: Sequence[Mapping[str, object]],
+        **options: Any,
+    ) -> Evaluation:
+        """Start evaluating ``fills``; ``options`` go to :func:`analyze_fills`."""
+
+        large = len(fills) > self.async_threshold
+        if large:
+            key = await asyncio.to_thread(
+                evaluation_key, plan_id, fills, options, version=ANALYTICS_VERSION
+            )
+        else:
+            key = evaluation_key(plan_id, fills, options, version=ANALYTICS_VERSION)
+        existing = self.get(ID_PREFIX + key)
+        if existing is not None and existing.status != "failed":
+            return existing
+
+        evaluation = Evaluation(evaluation_id=ID_PREFIX + key, plan_id=plan_id)
+        self.evaluations[evaluation.evaluation_id] = evaluation
+        if not large:
+            self._finish(key, evaluation, self._evaluate(evaluation, fills, options))
+            return evaluation
+        task = asyncio.create_task(self._run(key, evaluation, fills, options))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return evaluation
+
+    async def close(self) -> None:
+        """Cancel evaluations still running."""
+
+        for task in list(self._tasks):
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    async def _run(
+        self,
+        key: str,
+        evaluation: Evaluation,
+        fills: Sequence[Mapping[str, object]],
+        options: Mapping[str, Any],
+    ) -> None:
+        completed = await asyncio.to_thread(self._evaluate, evaluation, fills, options)
+        self._finish(key, evaluation, completed)
+
+    def _finish(self, key: str, evaluation: Evaluation, completed: bool) -> None:
+        if completed:
+            self.cache.put(
+                key, {"plan_id": evaluation.plan_id, "metrics": evaluation.metrics}
+            )
+            del self.evaluations[evaluation.evaluation_id]
+
+    @staticmethod
+    def _evaluate(
+        evaluation: Evaluation,
+        fills: Sequence[Mapping[str, object]],
+        options: Mapping[str, Any],
+    ) -> bool:
+        try:
+            metrics = analyze_fills(fills, **options).metrics()
+        except (KeyError, TypeError, ValueError) as exc:
+            evaluation.status = "failed"
+            evaluation.detail = f"Invalid fills: {exc}"
+            return False
+        if not all(math.isfinite(value) for value in metrics.values()):
+            evaluation.status = "failed"
+            evaluation.detail = "Invalid fills: missing quantity or price"
+            return False
+        evaluation.metrics = metrics
+        evaluation.status = "completed"
+        return True
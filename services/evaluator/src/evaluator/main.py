@@ -2,15 +2,73 @@
 
 from __future__ import annotations
 
+import contextlib
+import os
+from collections.abc import AsyncIterator
+
 from fastapi import FastAPI
+from goldshore_utils import configure_logging, export_from_env
+from goldshore_utils.responses import (
+    MetricsMiddleware,
+    NegotiatedResponse,
+    NegotiationMiddleware,
+    metrics_endpoint,
+)
 
+from .cache import DEFAULT_DISK_BYTES, DEFAULT_MEMORY_ENTRIES, ResultCache
+from .evaluations import DEFAULT_ASYNC_THRESHOLD, EvaluationJobs
 from .routers import router
 
+ASYNC_THRESHOLD_ENV = "EVALUATOR_ASYNC_THRESHOLD"
+CACHE_DIR_ENV = "EVALUATOR_CACHE_DIR"
+CACHE_ENTRIES_ENV = "EVALUATOR_CACHE_ENTRIES"
+CACHE_BYTES_ENV = "EVALUATOR_CACHE_BYTES"
+
+
+def _build_cache() -> ResultCache:
+    return ResultCache(
+        os.environ.get(CACHE_DIR_ENV),
+        memory_entries=int(os.environ.get(CACHE_ENTRIES_ENV, DEFAULT_MEMORY_ENTRIES)),
+        max_bytes=int(os.environ.get(CACHE_BYTES_ENV, DEFAULT_DISK_BYTES)),
+    )
+
+
+@contextlib.asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Cancel background evaluations when the service stops."""
+
+    configure_logging("evaluator")
+    export_from_env("evaluator")
+    try:
+        yield
+    finally:
+        await app.state.jobs.close()
+
 
 def create_app() -> FastAPI:
-    """Return a FastAPI application with evaluator routes registered."""
+    """Return a FastAPI application with evaluator routes registered.
+
+    Evaluations with more than ``EVALUATOR_ASYNC_THRESHOLD`` fills run in the
+    background and are polled by identifier. Results are cached in memory
+    (``EVALUATOR_CACHE_ENTRIES``) and, when ``EVALUATOR_CACHE_DIR`` is set,
+    on disk up to ``EVALUATOR_CACHE_BYTES``.
+    """
 
-    app = FastAPI(title="Gold Shore Evaluator", version="0.1.0")
+    app = FastAPI(
+        title="Gold Shore Evaluator",
+        version="0.1.0",
+        lifespan=lifespan,
+        default_response_class=NegotiatedResponse,
+    )
+    app.add_middleware(NegotiationMiddleware)
+    app.add_middleware(MetricsMiddleware)
+    app.add_route("/metrics", metrics_endpoint, include_in_schema=False)
+    app.state.jobs = EvaluationJobs(
+        async_threshold=int(
+            os.environ.get(ASYNC_THRESHOLD_ENV, DEFAULT_ASYNC_THRESHOLD)
+        ),
+        cache=_build_cache(),
+    )
     app.include_router(router)
     return app
 
@@ -1,18 +1,33 @@
-"""Route stubs for the evaluator service."""
+"""HTTP routes for the evaluator service."""
 
 from __future__ import annotations
 
-from fastapi import APIRouter, HTTPException
+from datetime import datetime
+
+from fastapi import APIRouter, HTTPException, Response, status
 from pydantic import BaseModel
 
+from .dependencies import Jobs
+from .evaluations import Evaluation
+
 router = APIRouter(prefix="/evaluator", tags=["evaluator"])
 
 
 class EvaluationRequest(BaseModel):
-    """Payload describing an execution to evaluate."""
+    """Payload describing an execution to evaluate.
+
+    ``marks``, ``benchmarks``, ``underlying_marks`` and ``volatility_marks``
+    map symbols to closing prices, market VWAPs, underlying prices and
+    implied volatilities; ``as_of`` is the valuation time for theta.
+    """
 
     plan_id: str
     fills: list[dict[str, object]]
+    marks: dict[str, float] | None = None
+    benchmarks: dict[str, float] | None = None
+    underlying_marks: dict[str, float] | None = None
+    volatility_marks: dict[str, float] | None = None
+    as_of: datetime | None = None
 
 
 class EvaluationResponse(BaseModel):
@@ -22,6 +37,17 @@ class EvaluationResponse(BaseModel):
     plan_id: str
     status: str
     metrics: dict[str, float]
+    detail: str | None = None
+
+
+def _response(evaluation: Evaluation) -> EvaluationResponse:
+    return EvaluationResponse(
+        id=evaluation.evaluation_id,
+        plan_id=evaluation.plan_id,
+        status=evaluation.status,
+        metrics=evaluation.metrics,
+        detail=evaluation.detail,
+    )
 
 
 @router.get("/health", summary="Service health probe")
@@ -31,20 +57,39 @@ def healthcheck() -> dict[str, str]:
     return {"status": "ok"}
 
 
+@router.get("/cache", summary="Evaluation cache counters")
+def cache_stats(jobs: Jobs) -> dict[str, int]:
+    """Return hit, miss, eviction and size counters of the result cache."""
+
+    return jobs.cache.stats.as_dict()
+
+
 @router.post(
     "/evaluations",
     response_model=EvaluationResponse,
     summary="Evaluate an execution",
 )
-def evaluate(request: EvaluationRequest) -> EvaluationResponse:
-    """Generate a placeholder evaluation report for ``plan_id``."""
-
-    return EvaluationResponse(
-        id="eval-001",
-        plan_id=request.plan_id,
-        status="completed",
-        metrics={"pnl": 0.0, "delta": 0.0},
+async def evaluate(
+    request: EvaluationRequest, response: Response, jobs: Jobs
+) -> EvaluationResponse:
+    """Evaluate the fills of ``plan_id``.
+
+    Large evaluations return ``202 Accepted`` with a ``pending`` status;
+    poll ``GET /evaluations/{id}`` for the metrics.
+    """
+
+    evaluation = await jobs.submit(
+        request.plan_id,
+        request.fills,
+        marks=request.marks,
+        benchmarks=request.benchmarks,
+        underlying_marks=request.underlying_marks,
+        volatility_marks=request.volatility_marks,
+        as_of=request.as_of,
     )
+    if evaluation.status == "pending":
+        response.status_code = status.HTTP_202_ACCEPTED
+    return _response(evaluation)
 
 
 @router.get(
@@ -52,14 +97,10 @@ def evaluate(request: EvaluationRequest) -> EvaluationResponse:
     response_model=EvaluationResponse,
     summary="Fetch an evaluation",
 )
-def get_evaluation(evaluation_id: str) -> EvaluationResponse:
-    """Return a placeholder evaluation record or raise when not found."""
+def get_evaluation(evaluation_id: str, jobs: Jobs) -> EvaluationResponse:
+    """Return the evaluation record or raise when not found."""
 
-    if evaluation_id != "eval-001":
+    evaluation = jobs.get(evaluation_id)
+    if evaluation is None:
         raise HTTPException(status_code=404, detail="Evaluation not found")
-    return EvaluationResponse(
-        id=evaluation_id,
-        plan_id="plan-000",
-        status="completed",
-        metrics={"pnl": 0.0, "delta": 0.0},
-    )
+    return _response(evaluation)
@@ -0,0 +1,18 @@
+"""Request-scoped accessors for executor service state."""
+
+from __future__ import annotations
+
+from typing import Annotated
+
+from fastapi import Depends, Request
+
+from .pipeline import OrderPipeline
+
+
+def get_pipeline(request: Request) -> OrderPipeline:
+    """Return the order pipeline attached to the running application."""
+
+    return request.app.state.pipeline
+
+
+Pipeline = Annotated[OrderPipeline, Depends(get_pipeline)]
@@ -2,15 +2,113 @@
 
 from __future__ import annotations
 
+import contextlib
+import os
+from collections.abc import AsyncIterator
+
 from fastapi import FastAPI
+from goldshore_brokers import AlpacaPaperEquitiesClient, AsyncAlpacaPaperEquitiesClient
+from goldshore_risk import (
+    DrawdownPolicy,
+    PositionLimitPolicy,
+    RiskEngine,
+    VolatilityPolicy,
+)
+from goldshore_utils import EventBus, configure_logging, export_from_env
+from goldshore_utils.responses import (
+    MetricsMiddleware,
+    NegotiatedResponse,
+    NegotiationMiddleware,
+    metrics_endpoint,
+)
 
+from .orders import OrderStore
+from .pipeline import DEFAULT_WINDOW_SECONDS, BrokerClient, OrderPipeline
 from .routers import router
 
+NETTING_WINDOW_ENV = "EXECUTOR_NETTING_WINDOW"
+ORDER_DIR_ENV = "EXECUTOR_ORDER_DIR"
+MAX_NOTIONAL_ENV = "EXECUTOR_MAX_NOTIONAL"
+MAX_DRAWDOWN_ENV = "EXECUTOR_MAX_DRAWDOWN"
+MAX_VOLATILITY_ENV = "EXECUTOR_MAX_VOLATILITY"
+ALPACA_KEY_ENV = "ALPACA_API_KEY"
+ALPACA_SECRET_ENV = "ALPACA_API_SECRET"
+
+
+def _build_broker() -> BrokerClient:
+    api_key = os.environ.get(ALPACA_KEY_ENV)
+    secret = os.environ.get(ALPACA_SECRET_ENV, "")
+    if api_key:
+        return AsyncAlpacaPaperEquitiesClient(api_key=api_key, api_secret=secret)
+    return AlpacaPaperEquitiesClient(api_key="", api_secret="")
+
+
+def _build_risk_engine() -> RiskEngine:
+    engine = RiskEngine()
+    if MAX_NOTIONAL_ENV in os.environ:
+        engine.add_policy(
+            PositionLimitPolicy(max_notional=float(os.environ[MAX_NOTIONAL_ENV]))
+        )
+    if MAX_DRAWDOWN_ENV in os.environ:
+        engine.add_policy(
+            DrawdownPolicy(max_drawdown=float(os.environ[MAX_DRAWDOWN_ENV]))
+        )
+    if MAX_VOLATILITY_ENV in os.environ:
+        engine.add_policy(
+            VolatilityPolicy(max_volatility=float(os.environ[MAX_VOLATILITY_ENV]))
+        )
+    return engine
+
+
+@contextlib.asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Run the order pipeline worker while the service is up."""
+
+    configure_logging("executor")
+    export_from_env("executor")
+    pipeline: OrderPipeline = app.state.pipeline
+    await pipeline.start()
+    try:
+        yield
+    finally:
+        await pipeline.stop()
+        aclose = getattr(pipeline.broker, "aclose", None)
+        if aclose is not None:
+            await aclose()
+        pipeline.store.close()
+
+
+def create_app(
+    *, broker: BrokerClient | None = None, events: EventBus | None = None
+) -> FastAPI:
+    """Return a FastAPI application with executor routes registered.
 
-def create_app() -> FastAPI:
-    """Return a FastAPI application with executor routes registered."""
+    Orders are netted over ``EXECUTOR_NETTING_WINDOW`` seconds before being
+    sent to ``broker``. Without an explicit broker the async Alpaca client is
+    used when ``ALPACA_API_KEY`` is set, and the paper placeholder otherwise.
+    When ``EXECUTOR_ORDER_DIR`` is set the order book is journaled there and
+    recovered on start. ``EXECUTOR_MAX_NOTIONAL``, ``EXECUTOR_MAX_DRAWDOWN``
+    and ``EXECUTOR_MAX_VOLATILITY`` register the matching pre-trade policies.
+    Order outcomes are published on ``events`` when given.
+    """
 
-    app = FastAPI(title="Gold Shore Executor", version="0.1.0")
+    app = FastAPI(
+        title="Gold Shore Executor",
+        version="0.1.0",
+        lifespan=lifespan,
+        default_response_class=NegotiatedResponse,
+    )
+    app.add_middleware(NegotiationMiddleware)
+    app.add_middleware(MetricsMiddleware)
+    app.add_route("/metrics", metrics_endpoint, include_in_schema=False)
+    order_dir = os.environ.get(ORDER_DIR_ENV)
+    app.state.pipeline = OrderPipeline(
+        broker=broker or _build_broker(),
+        store=OrderStore(order_dir) if order_dir else OrderStore(),
+        risk=_build_risk_engine(),
+        window=float(os.environ.get(NETTING_WINDOW_ENV, DEFAULT_WINDOW_SECONDS)),
+        events=events,
+    )
     app.include_router(router)
     return app
 
@@ -0,0 +1,233 @@
+"""Indexed order book of record with an append-only journal."""
+
+from __future__ import annotations
+
+import json
+import os
+import uuid
+from collections.abc import Iterator
+from dataclasses import dataclass, fields
+from pathlib import Path
+from typing import IO, Literal
+
+Side = Literal["buy", "sell"]
+
+JOURNAL_FILE = "orders.journal"
+CHECKPOINT_FILE = "orders.checkpoint"
+DEFAULT_CHECKPOINT_INTERVAL = 10_000
+
+
+def new_order_id(prefix: str = "exec") -> str:
+    """Return a fresh identifier for an order handle."""
+
+    return f"{prefix}-{uuid.uuid4().hex[:16]}"
+
+
+@dataclass(slots=True)
+class Order:
+    """Executor-side state of one order."""
+
+    order_id: str
+    symbol: str
+    side: Side
+    quantity: float
+    status: str = "queued"
+    client_order_id: str | None = None
+    broker_order_id: str | None = None
+    detail: str | None = None
+
+    @property
+    def signed_quantity(self) -> float:
+        """Return the quantity signed positive for buys and negative for sells."""
+
+        return self.quantity if self.side == "buy" else -self.quantity
+
+    def as_dict(self) -> dict[str, object]:
+        """Return the order as a JSON-ready document."""
+
+        return {name: getattr(self, name) for name in _FIELDS}
+
+
+_FIELDS = tuple(field.name for field in fields(Order))
+
+
+class OrderStore:
+    """In-memory order index backed by a journal and periodic checkpoints.
+
+    Orders are indexed by order id, client order id, symbol and status, so
+    lookups and status transitions are dictionary operations regardless of
+    history size. When ``directory`` is given every change is appended to
+    ``orders.journal`` as the full order record tagged with a sequence number.
+    Every ``checkpoint_interval`` events the whole book is written atomically
+    to ``orders.checkpoint`` and the journal restarts, so recovery reads one
+    checkpoint plus the journal tail. Journal lines at or below the
+    checkpoint sequence, left behind by a crash mid-rotation, are skipped.
+    """
+
+    def __init__(
+        self,
+        directory: str | os.PathLike[str] | None = None,
+        *,
+        checkpoint_interval: int = DEFAULT_CHECKPOINT_INTERVAL,
+    ) -> None:
+        self.directory = Path(directory) if directory is not None else None
+        self.checkpoint_interval = checkpoint_interval
+        self.seq = 0
+        self._orders: dict[str, Order] = {}
+        self._by_client_id: dict[str, Order] = {}
+        # Dicts double as insertion-ordered sets of order ids.
+        self._by_symbol: dict[str, dict[str, Order]] = {}
+        self._by_status: dict[str, dict[str, Order]] = {}
+        self._since_checkpoint = 0
+        self._journal: IO[str] | None = None
+        if self.directory is not None:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            self._recover()
+            self._journal = open(self.directory / JOURNAL_FILE, "a", encoding="utf-8")
+
+    def __len__(self) -> int:
+        return len(self._orders)
+
+    def __iter__(self) -> Iterator[Order]:
+        return iter(self._orders.values())
+
+    def __enter__(self) -> OrderStore:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the journal file."""
+
+        if self._journal is not None:
+            self._journal.close()
+            self._journal = None
+
+    def get(self, order_id: str) -> Order | None:
+        """Return the order with ``order_id``."""
+
+        return self._orders.get(order_id)
+
+    def get_by_client_order_id(self, client_order_id: str) -> Order | None:
+        """Return the order submitted with ``client_order_id``."""
+
+        return self._by_client_id.get(client_order_id)
+
+    def for_symbol(self, symbol: str) -> list[Order]:
+        """Return every order for ``symbol`` in submission order."""
+
+        return list(self._by_symbol.get(symbol, {}).values())
+
+    def with_status(self, status: str) -> list[Order]:
+        """Return every order currently in ``status`` in submission order."""
+
+        return list(self._by_status.get(status, {}).values())
+
+    def add(self, order: Order) -> Order:
+        """Index and journal a new order."""
+
+        if order.order_id in self._orders:
+            raise ValueError(f"Order {order.order_id} already exists")
+        if order.client_order_id and order.client_order_id in self._by_client_id:
+            raise ValueError(f"Client order id {order.client_order_id} already used")
+        self._index(order)
+        self._record(order)
+        return order
+
+    def update(self, order_id: str, **changes: object) -> Order:
+        """Apply ``changes`` to an order, reindexing and journaling it."""
+
+        order = self._orders[order_id]
+        self._assign(order, changes)
+        self._record(order)
+        return order
+
+    def checkpoint(self) -> None:
+        """Write the full book atomically and restart the journal."""
+
+        if self.directory is None:
+            return
+        target = self.directory / CHECKPOINT_FILE
+        staging = target.with_suffix(".tmp")
+        with open(staging, "w", encoding="utf-8") as handle:
+            json.dump(
+                {
+                    "seq": self.seq,
+                    "orders": [order.as_dict() for order in self._orders.values()],
+                },
+                handle,
+            )
+            handle.flush()
+            os.fsync(handle.fileno())
+        os.replace(staging, target)
+        if self._journal is not None:
+            self._journal.seek(0)
+            self._journal.truncate()
+        self._since_checkpoint = 0
+
+    def _index(self, order: Order) -> None:
+        self._orders[order.order_id] = order
+        if order.client_order_id:
+            self._by_client_id[order.client_order_id] = order
+        self._by_symbol.setdefault(order.symbol, {})[order.order_id] = order
+        self._by_status.setdefault(order.status, {})[order.order_id] = order
+
+    def _apply(self, document: dict[str, object]) -> None:
+        existing = self._orders.get(str(document["order_id"]))
+        if existing is None:
+            self._index(Order(**document))  # type: ignore[arg-type]
+            return
+        self._assign(existing, document)
+
+    def _assign(self, order: Order, changes: dict[str, object]) -> None:
+        previous = order.status
+        for name, value in changes.items():
+            setattr(order, name, value)
+        if order.status != previous:
+            del self._by_status[previous][order.order_id]
+            self._by_status.setdefault(order.status, {})[order.order_id] = order
+
+    def _record(self, order: Order) -> None:
+        self.seq += 1
+        if self._journal is None:
+            return
+        self._journal.write(
+            json.dumps({"seq": self.seq, "order": order.as_dict()}) + "\n"
+        )
+        self._journal.flush()
+        self._since_checkpoint += 1
+        if self._since_checkpoint >= self.checkpoint_interval:
+            self.checkpoint()
+
+    def _recover(self) -> None:
+        assert self.directory is not None
+        checkpoint = self.directory / CHECKPOINT_FILE
+        if checkpoint.exists():
+            with open(checkpoint, encoding="utf-8") as handle:
+                state = json.load(handle)
+            self.seq = int(state["seq"])
+            for document in state["orders"]:
+                self._apply(document)
+
+        journal = self.directory / JOURNAL_FILE
+        if not journal.exists():
+            return
+        valid = 0
+        with open(journal, "rb") as handle:
+            for line in handle:
+                if not line.endswith(b"\n"):
+                    break  # torn final write
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    break
+                valid += len(line)
+                if entry["seq"] <= self.seq:
+                    continue
+                self.seq = int(entry["seq"])
+                self._apply(entry["order"])
+                self._since_checkpoint += 1
+        if valid != journal.stat().st_size:
+            with open(journal, "rb+") as handle:
+                handle.truncate(valid)
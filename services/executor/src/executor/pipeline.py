@@ -0,0 +1,277 @@
+"""Asynchronous order pipeline that nets and batches broker submissions."""
+
+from __future__ import annotations
+
+import asyncio
+import inspect
+import logging
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from typing import Protocol
+
+from goldshore_risk import RiskEngine
+from goldshore_utils import EventBus
+from goldshore_utils.metrics import timed
+
+from .orders import Order, OrderStore, Side, new_order_id
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_WINDOW_SECONDS = 0.05
+DEFAULT_MAX_BATCH = 500
+# Finest share increment the broker accepts; nets are rounded to it so float
+# residue such as 0.1 + 0.2 - 0.3 neither survives netting nor reaches it.
+QUANTITY_DECIMALS = 9
+
+
+@dataclass(frozen=True, slots=True)
+class OrderUpdated:
+    """Event published when an order leaves ``queued``."""
+
+    order_id: str
+    symbol: str
+    status: str
+    client_order_id: str | None = None
+    broker_order_id: str | None = None
+    detail: str | None = None
+
+
+class BrokerClient(Protocol):
+    """Subset of the broker adapter interface used by the pipeline."""
+
+    def submit_order(self, payload: dict[str, object]) -> object:
+        """Submit one order; may be a coroutine function on async adapters."""
+
+
+@dataclass
+class OrderPipeline:
+    """In-process queue that coalesces orders before they reach the broker.
+
+    :meth:`submit` returns a handle immediately. A background worker collects
+    orders for ``window`` seconds (or until ``max_batch`` arrive), nets buys
+    against sells per symbol, and sends one child order per symbol with a
+    non-zero net to the broker, concurrently on async adapters. Orders whose
+    symbol nets to zero are marked ``netted`` without touching the broker. A
+    child the broker refuses rejects only its own parent orders.
+
+    When ``risk`` is set each order is checked against the engine's cached
+    aggregates before it is queued and tracked as open risk until it is
+    netted, cancelled or rejected, or moved into the engine's positions once
+    the broker accepts it.
+
+    When ``events`` is set an :class:`OrderUpdated` is published on it
+    every time an order is rejected, netted, cancelled or submitted.
+    """
+
+    broker: BrokerClient
+    window: float = DEFAULT_WINDOW_SECONDS
+    max_batch: int = DEFAULT_MAX_BATCH
+    store: OrderStore = field(default_factory=OrderStore)
+    risk: RiskEngine | None = None
+    events: EventBus | None = None
+    # ``None`` on the queue asks the worker to flush its batch and exit.
+    _queue: asyncio.Queue[Order | None] | None = field(default=None, init=False)
+    _worker: asyncio.Task[None] | None = field(default=None, init=False)
+
+    async def start(self) -> None:
+        """Start the background worker, requeueing orders recovered as queued."""
+
+        if self._worker is None:
+            self._queue = asyncio.Queue()
+            for order in self.store.with_status("queued"):
+                self._queue.put_nowait(order)
+            self._worker = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Flush queued orders, including a partly collected batch, and stop."""
+
+        if self._worker is None or self._queue is None:
+            return
+        self._queue.put_nowait(None)
+        await self._worker
+        self._worker = None
+
+    @timed(
+        "goldshore_executor_submit_seconds", "Order validation, risk check and queueing"
+    )
+    def submit(
+        self,
+        *,
+        symbol: str,
+        side: Side,
+        quantity: float,
+        client_order_id: str | None = None,
+        price: float | None = None,
+    ) -> Order:
+        """Enqueue an order and return its handle without waiting for the broker.
+
+        Resubmitting a known ``client_order_id`` returns the existing order.
+        ``price`` is the reference price for the pre-trade risk check and
+        defaults to the engine's latest mark; orders failing the check are
+        recorded as ``rejected`` and never queued.
+        """
+
+        if self._queue is None:
+            raise RuntimeError("Order pipeline has not been started")
+        if client_order_id is not None:
+            existing = self.store.get_by_client_order_id(client_order_id)
+            if existing is not None:
+                return existing
+        order = Order(
+            order_id=new_order_id(),
+            symbol=symbol,
+            side=side,
+            quantity=quantity,
+            client_order_id=client_order_id,
+        )
+        if self.risk is not None:
+            decision = self.risk.check(
+                symbol, quantity=order.signed_quantity, price=price
+            )
+            if not decision.approved:
+                order.status = "rejected"
+                order.detail = "Risk check failed: " + ", ".join(decision.breaches)
+                self.store.add(order)
+                self._publish(order)
+                return order
+            self.risk.on_order(
+                order.order_id,
+                symbol=symbol,
+                quantity=order.signed_quantity,
+                price=price if price is not None else self.risk.marks.get(symbol, 0.0),
+            )
+        self.store.add(order)
+        self._queue.put_nowait(order)
+        return order
+
+    def _close(self, order: Order, **changes: object) -> None:
+        self.store.update(order.order_id, **changes)
+        if self.risk is not None:
+            self.risk.on_order_closed(order.order_id)
+        self._publish(order)
+
+    def _publish(self, order: Order) -> None:
+        if self.events is not None:
+            self.events.publish(
+                OrderUpdated(
+                    order_id=order.order_id,
+                    symbol=order.symbol,
+                    status=order.status,
+                    client_order_id=order.client_order_id,
+                    broker_order_id=order.broker_order_id,
+                    detail=order.detail,
+                )
+            )
+
+    def get(self, order_id: str) -> Order | None:
+        """Return the order for ``order_id`` if it exists."""
+
+        return self.store.get(order_id)
+
+    def cancel(self, order_id: str) -> Order | None:
+        """Cancel a still-queued order; submitted orders are returned unchanged."""
+
+        order = self.store.get(order_id)
+        if order is not None and order.status == "queued":
+            self._close(order, status="cancelled")
+        return order
+
+    async def _run(self) -> None:
+        assert self._queue is not None
+        loop = asyncio.get_running_loop()
+        stopping = False
+        while not stopping:
+            first = await self._queue.get()
+            if first is None:
+                return
+            batch = [first]
+            deadline = loop.time() + self.window
+            while len(batch) < self.max_batch:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    order = await asyncio.wait_for(self._queue.get(), remaining)
+                except asyncio.TimeoutError:  # noqa: UP041 - distinct on 3.10
+                    break
+                if order is None:
+                    stopping = True
+                    break
+                batch.append(order)
+            try:
+                await self._flush(batch)
+            except Exception:
+                # Keep the worker alive; the batch's orders stay queued.
+                logger.exception("Failed to flush a batch of %d orders", len(batch))
+
+    async def _flush(self, batch: Sequence[Order]) -> None:
+        by_symbol: dict[str, list[Order]] = {}
+        for order in batch:
+            if order.status == "queued":
+                by_symbol.setdefault(order.symbol, []).append(order)
+
+        children: list[tuple[list[Order], dict[str, object]]] = []
+        for symbol, parents in by_symbol.items():
+            net = round(
+                sum(order.signed_quantity for order in parents), QUANTITY_DECIMALS
+            )
+            if net == 0:
+                for order in parents:
+                    self._close(order, status="netted")
+                continue
+            children.append(
+                (
+                    parents,
+                    {
+                        "symbol": symbol,
+                        "qty": abs(net),
+                        "side": "buy" if net > 0 else "sell",
+                        "type": "market",
+                        "time_in_force": "day",
+                        "client_order_id": new_order_id("child"),
+                    },
+                )
+            )
+        if not children:
+            return
+
+        results = await self._submit([payload for _, payload in children])
+        for (parents, payload), result in zip(children, results, strict=True):
+            if isinstance(result, BaseException):
+                # Only this child failed; the broker may have accepted others.
+                for order in parents:
+                    self._close(order, status="rejected", detail=str(result))
+                continue
+            broker_id = str(result.get("id", payload["client_order_id"]))
+            for order in parents:
+                self.store.update(
+                    order.order_id, status="submitted", broker_order_id=broker_id
+                )
+                if self.risk is not None:
+                    self.risk.on_order_submitted(order.order_id)
+                self._publish(order)
+
+    async def _submit(
+        self, payloads: list[dict[str, object]]
+    ) -> list[dict[str, object] | BaseException]:
+        """Send every child and return its response or the error it raised."""
+
+        if inspect.iscoroutinefunction(self.broker.submit_order):
+            return list(
+                await asyncio.gather(
+                    *(self.broker.submit_order(payload) for payload in payloads),
+                    return_exceptions=True,
+                )
+            )
+        return await asyncio.to_thread(self._submit_each, payloads)
+
+    def _submit_each(
+        self, payloads: list[dict[str, object]]
+    ) -> list[dict[str, object] | BaseException]:
+        results: list[dict[str, object] | BaseException] = []
+        for payload in payloads:
+            try:
+                results.append(self.broker.submit_order(payload))
+            except Exception as exc:
+                results.append(exc)
+        return results
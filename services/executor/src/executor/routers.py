@@ -1,9 +1,13 @@
-"""Route stubs for the executor service."""
+"""HTTP routes for the executor service."""
 
 from __future__ import annotations
 
-from fastapi import APIRouter, HTTPException
-from pydantic import BaseModel
+from fastapi import APIRouter, HTTPException, Response
+from goldshore_utils.responses import NegotiatedResponse
+from pydantic import BaseModel, Field
+
+from .dependencies import Pipeline
+from .pipeline import Side
 
 router = APIRouter(prefix="/executor", tags=["executor"])
 
@@ -12,8 +16,16 @@ class OrderRequest(BaseModel):
     """Minimal payload describing an order to execute."""
 
     symbol: str
-    side: str
-    quantity: float
+    side: Side
+    quantity: float = Field(gt=0)
+    client_order_id: str | None = None
+    price: float | None = Field(default=None, gt=0)
+
+
+class OrderBatchRequest(BaseModel):
+    """Orders submitted together, for example one compiled plan batch."""
+
+    orders: list[OrderRequest]
 
 
 class CancelRequest(BaseModel):
@@ -30,29 +42,100 @@ def healthcheck() -> dict[str, str]:
 
 
 @router.post("/orders/submit", summary="Submit an order for execution")
-def submit_order(request: OrderRequest) -> dict[str, object]:
-    """Forward an order to the configured broker adapter."""
-
+async def submit_order(request: OrderRequest, pipeline: Pipeline) -> dict[str, object]:
+    """Queue an order for netting and batched submission to the broker.
+
+    Returns immediately with the order handle; poll ``/orders/{order_id}``
+    for the broker outcome.
+    """
+
+    order = pipeline.submit(
+        symbol=request.symbol,
+        side=request.side,
+        quantity=request.quantity,
+        client_order_id=request.client_order_id,
+        price=request.price,
+    )
     return {
-        "order_id": "exec-001",
-        "status": "accepted",
+        "order_id": order.order_id,
+        "status": order.status,
+        "detail": order.detail,
         "payload": request.model_dump(),
     }
 
 
+@router.post("/orders/batch", summary="Submit several orders in one call")
+async def submit_orders(
+    request: OrderBatchRequest, pipeline: Pipeline
+) -> list[dict[str, object]]:
+    """Queue every order of the batch and return their handles in order.
+
+    Orders in the batch share the netting window like individually
+    submitted orders; ``client_order_id`` keeps resubmission idempotent.
+    """
+
+    handles = []
+    for item in request.orders:
+        order = pipeline.submit(
+            symbol=item.symbol,
+            side=item.side,
+            quantity=item.quantity,
+            client_order_id=item.client_order_id,
+            price=item.price,
+        )
+        handles.append(
+            {
+                "order_id": order.order_id,
+                "client_order_id": order.client_order_id,
+                "status": order.status,
+                "detail": order.detail,
+            }
+        )
+    return handles
+
+
 @router.post("/orders/cancel", summary="Cancel a previously submitted order")
-def cancel_order(request: CancelRequest) -> dict[str, object]:
-    """Attempt to cancel an existing order."""
+async def cancel_order(request: CancelRequest, pipeline: Pipeline) -> dict[str, object]:
+    """Cancel an order that has not yet left the pipeline."""
 
-    if request.order_id != "exec-001":
+    order = pipeline.cancel(request.order_id)
+    if order is None:
         raise HTTPException(status_code=404, detail="Order not found")
-    return {"order_id": request.order_id, "status": "cancelled"}
+    if order.status != "cancelled":
+        raise HTTPException(status_code=409, detail=f"Order is already {order.status}")
+    return {"order_id": order.order_id, "status": order.status}
+
+
+@router.get(
+    "/orders",
+    response_model=list[dict[str, object]],
+    summary="List orders by symbol or status",
+)
+async def list_orders(
+    pipeline: Pipeline, symbol: str | None = None, status: str | None = None
+) -> Response:
+    """Return orders matching the optional ``symbol`` and ``status`` filters.
+
+    Order records are encoded directly, without intermediate dictionaries.
+    """
+
+    store = pipeline.store
+    if symbol is not None:
+        orders = store.for_symbol(symbol)
+        if status is not None:
+            orders = [order for order in orders if order.status == status]
+    elif status is not None:
+        orders = store.with_status(status)
+    else:
+        orders = list(store)
+    return NegotiatedResponse(orders)
 
 
 @router.get("/orders/{order_id}", summary="Fetch order status")
-def get_order_status(order_id: str) -> dict[str, object]:
-    """Return a placeholder status record."""
+async def get_order_status(order_id: str, pipeline: Pipeline) -> dict[str, object]:
+    """Return the current pipeline status of an order."""
 
-    if order_id != "exec-001":
+    order = pipeline.get(order_id)
+    if order is None:
         raise HTTPException(status_code=404, detail="Order not found")
-    return {"order_id": order_id, "status": "filled", "filled_quantity": 0.0}
+    return order.as_dict()
@@ -0,0 +1,5 @@
+"""Combined FastAPI application hosting every service in one process."""
+
+from .main import app, create_app
+
+__all__ = ["app", "create_app"]
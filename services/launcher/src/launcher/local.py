@@ -0,0 +1,56 @@
+"""In-process clients that let co-located services call each other directly."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass
+from typing import Any
+
+from executor.pipeline import OrderPipeline
+from goldshore_market import SimulatedOptionsClient
+from marketdata.batch import batch_quotes
+
+
+@dataclass
+class LocalMarketDataClient:
+    """Serve planner quote requests from the market data client in memory."""
+
+    client: SimulatedOptionsClient
+
+    async def quotes(self, symbols: Sequence[str]) -> dict[str, dict[str, float]]:
+        """Return the latest quote of every symbol."""
+
+        rows = await asyncio.to_thread(batch_quotes, self.client, symbols)
+        return {row.pop("symbol"): row for row in rows}
+
+
+@dataclass
+class LocalExecutorClient:
+    """Submit planner order batches straight to the executor pipeline."""
+
+    pipeline: OrderPipeline
+
+    async def submit_orders(
+        self, orders: Sequence[Mapping[str, Any]]
+    ) -> list[dict[str, object]]:
+        """Queue ``orders`` and return their handles in order."""
+
+        handles = []
+        for payload in orders:
+            order = self.pipeline.submit(
+                symbol=payload["symbol"],
+                side=payload["side"],
+                quantity=payload["quantity"],
+                client_order_id=payload.get("client_order_id"),
+                price=payload.get("price"),
+            )
+            handles.append(
+                {
+                    "order_id": order.order_id,
+                    "client_order_id": order.client_order_id,
+                    "status": order.status,
+                    "detail": order.detail,
+                }
+            )
+        return handles
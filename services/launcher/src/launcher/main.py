@@ -0,0 +1,136 @@
+"""Application factory hosting every service in one process."""
+
+from __future__ import annotations
+
+import contextlib
+import os
+from collections.abc import AsyncIterator, Callable
+
+from evaluator.main import create_app as create_evaluator_app
+from evaluator.routers import router as evaluator_router
+from executor.main import create_app as create_executor_app
+from executor.pipeline import BrokerClient, OrderUpdated
+from executor.routers import router as executor_router
+from fastapi import FastAPI
+from goldshore_utils import (
+    EventBus,
+    SocketBridge,
+    configure_logging,
+    export_from_env,
+)
+from goldshore_utils.responses import (
+    MetricsMiddleware,
+    NegotiatedResponse,
+    NegotiationMiddleware,
+    metrics_endpoint,
+)
+from marketdata.main import create_app as create_marketdata_app
+from marketdata.routers import router as marketdata_router
+from notifier.delivery import DeliveryQueue, Transport
+from notifier.main import create_app as create_notifier_app
+from notifier.routers import router as notifier_router
+from planner.main import create_app as create_planner_app
+from planner.routers import router as planner_router
+
+from .local import LocalExecutorClient, LocalMarketDataClient
+
+ALERT_CHANNEL_ENV = "LAUNCHER_ALERT_CHANNEL"
+EVENTS_SOCKET_ENV = "LAUNCHER_EVENTS_SOCKET"
+DEFAULT_ALERT_CHANNEL = "orders"
+
+
+def _alert_on_rejection(
+    delivery: DeliveryQueue, channel: str
+) -> Callable[[OrderUpdated], None]:
+    def handle(event: OrderUpdated) -> None:
+        if event.status == "rejected":
+            delivery.submit(
+                channel,
+                subject=f"Order rejected: {event.symbol}",
+                body=f"{event.order_id}: {event.detail or 'no detail'}",
+            )
+
+    return handle
+
+
+@contextlib.asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Run every service's lifespan, stopping them in reverse order."""
+
+    configure_logging("launcher")
+    export_from_env("launcher")
+    async with contextlib.AsyncExitStack() as stack:
+        for service in app.state.services:
+            await stack.enter_async_context(service.router.lifespan_context(service))
+        socket_path = os.environ.get(EVENTS_SOCKET_ENV)
+        if socket_path:
+            bridge = SocketBridge(app.state.events, socket_path, [OrderUpdated])
+            await bridge.serve()
+            stack.push_async_callback(bridge.close)
+        yield
+
+
+def create_app(
+    *,
+    broker: BrokerClient | None = None,
+    notifier_transport: Transport | None = None,
+) -> FastAPI:
+    """Return one application serving the routes of all five services.
+
+    Each service is configured from its usual environment variables. The
+    planner compiles plans against the market data client and executor
+    pipeline in memory rather than over HTTP, and order outcomes travel on
+    a shared :class:`~goldshore_utils.EventBus`: rejected orders raise a
+    notifier alert on ``LAUNCHER_ALERT_CHANNEL``. When
+    ``LAUNCHER_EVENTS_SOCKET`` is set, order events are also relayed to
+    other processes over a Unix socket at that path.
+    """
+
+    events = EventBus()
+    marketdata = create_marketdata_app()
+    executor = create_executor_app(broker=broker, events=events)
+    planner = create_planner_app(
+        marketdata=LocalMarketDataClient(marketdata.state.options_client),
+        executor=LocalExecutorClient(executor.state.pipeline),
+    )
+    notifier = create_notifier_app(transport=notifier_transport)
+    evaluator = create_evaluator_app()
+    events.subscribe(
+        OrderUpdated,
+        _alert_on_rejection(
+            notifier.state.delivery,
+            os.environ.get(ALERT_CHANNEL_ENV, DEFAULT_ALERT_CHANNEL),
+        ),
+    )
+
+    app = FastAPI(
+        title="Gold Shore",
+        version="0.1.0",
+        lifespan=lifespan,
+        default_response_class=NegotiatedResponse,
+    )
+    app.add_middleware(NegotiationMiddleware)
+    app.add_middleware(MetricsMiddleware)
+    app.add_route("/metrics", metrics_endpoint, include_in_schema=False)
+    app.state.events = events
+    # Started in this order and stopped in reverse, so the planner stops
+    # before the executor flushes, and alerts raised by that flush are still
+    # delivered before the notifier stops.
+    app.state.services = (marketdata, notifier, evaluator, executor, planner)
+    for service in app.state.services:
+        # Routes resolve their state through ``request.app``, which is now
+        # this application, so adopt every service's state.
+        for name, value in service.state._state.items():
+            setattr(app.state, name, value)
+    for router in (
+        planner_router,
+        executor_router,
+        marketdata_router,
+        notifier_router,
+        evaluator_router,
+    ):
+        app.include_router(router)
+    return app
+
+
+app = create_app()
@@ -0,0 +1,88 @@
+"""Portfolio-sized greeks and quote lookups streamed as NDJSON."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from datetime import date
+
+import numpy as np
+from goldshore_market import SimulatedOptionsClient
+from goldshore_options import OptionType
+from goldshore_utils.serialization import dumps
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+ROWS_PER_CHUNK = 1000
+GREEK_NAMES = ("delta", "gamma", "theta", "vega", "rho")
+
+
+def batch_greeks(
+    client: SimulatedOptionsClient,
+    *,
+    symbols: Sequence[str],
+    strikes: Sequence[float],
+    expiries: Sequence[date],
+    option_types: Sequence[OptionType],
+) -> list[dict[str, object]]:
+    """Return one greeks row per contract, in input order.
+
+    Contracts are grouped by underlying so each symbol is priced with a
+    single vectorized call against its volatility surface.
+    """
+
+    names, codes = np.unique(np.asarray(symbols, dtype=str), return_inverse=True)
+    strike = np.asarray(strikes, dtype=np.float64)
+    expiry = np.asarray(expiries, dtype="datetime64[D]")
+    option_type = np.asarray(option_types, dtype=str)
+    columns = {name: np.zeros(strike.size) for name in GREEK_NAMES}
+
+    order = np.argsort(codes, kind="stable")
+    bounds = np.concatenate(([0], np.cumsum(np.bincount(codes, minlength=names.size))))
+    for index, symbol in enumerate(names.tolist()):
+        rows = order[bounds[index] : bounds[index + 1]]
+        greeks = client.get_greeks_batch(
+            symbol,
+            strike=strike[rows],
+            expiry=expiry[rows],
+            option_type=option_type[rows],
+        )
+        for name in GREEK_NAMES:
+            columns[name][rows] = greeks[name]
+
+    values = [columns[name].tolist() for name in GREEK_NAMES]
+    return [
+        {
+            "symbol": symbol,
+            "strike": contract_strike,
+            "expiry": contract_expiry.isoformat(),
+            "option_type": contract_type,
+            **dict(zip(GREEK_NAMES, row, strict=True)),
+        }
+        for symbol, contract_strike, contract_expiry, contract_type, *row in zip(
+            symbols, strikes, expiries, option_types, *values, strict=True
+        )
+    ]
+
+
+def batch_quotes(
+    client: SimulatedOptionsClient, symbols: Iterable[str]
+) -> list[dict[str, object]]:
+    """Return the latest quote row for each symbol, in input order."""
+
+    return [{"symbol": symbol, **client.get_quote(symbol)} for symbol in symbols]
+
+
+def ndjson_chunks(
+    rows: Iterable[Mapping[str, object]], *, rows_per_chunk: int = ROWS_PER_CHUNK
+) -> Iterator[bytes]:
+    """Encode ``rows`` as newline-delimited JSON, ``rows_per_chunk`` per write."""
+
+    chunk: list[bytes] = []
+    for row in rows:
+        chunk.append(dumps(row))
+        if len(chunk) == rows_per_chunk:
+            chunk.append(b"")
+            yield b"\n".join(chunk)
+            chunk.clear()
+    if chunk:
+        chunk.append(b"")
+        yield b"\n".join(chunk)
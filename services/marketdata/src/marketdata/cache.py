@@ -0,0 +1,133 @@
+"""Bounded TTL caches with single-flight coalescing of upstream fetches."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Hashable
+from dataclasses import asdict, dataclass, field
+from typing import Generic, TypeVar
+
+V = TypeVar("V")
+
+DEFAULT_QUOTE_TTL = 0.25
+DEFAULT_CHAIN_TTL = 5.0
+DEFAULT_MAX_ENTRIES = 4096
+
+
+@dataclass
+class CacheStats:
+    """Counters describing how requests were served."""
+
+    hits: int = 0
+    misses: int = 0
+    coalesced: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    entries: int = 0
+
+    def as_dict(self) -> dict[str, int]:
+        """Return the counters as a plain dictionary."""
+
+        return asdict(self)
+
+
+class TTLCache(Generic[V]):
+    """LRU cache whose entries expire ``ttl`` seconds after they are fetched.
+
+    :meth:`get` serves fresh entries directly. On a miss it starts one fetch
+    per key; concurrent callers for the same key await that fetch instead
+    of starting their own, so a burst of identical requests costs a single
+    upstream call. The fetch runs as its own task, so a caller that goes
+    away does not cancel it for the others. Failed fetches are not cached.
+    At most ``max_entries`` values are kept, least recently used first out.
+    """
+
+    def __init__(
+        self,
+        *,
+        ttl: float,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.stats = CacheStats()
+        self._clock = clock
+        self._entries: OrderedDict[Hashable, tuple[float, V]] = OrderedDict()
+        self._inflight: dict[Hashable, asyncio.Task[V]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def get(self, key: Hashable, fetch: Callable[[], Awaitable[V]]) -> V:
+        """Return the cached value for ``key``, calling ``fetch`` on a miss."""
+
+        entry = self._entries.get(key)
+        if entry is not None:
+            expires, value = entry
+            if expires > self._clock():
+                self._entries.move_to_end(key)
+                self.stats.hits += 1
+                return value
+            del self._entries[key]
+            self.stats.expirations += 1
+
+        task = self._inflight.get(key)
+        if task is None:
+            self.stats.misses += 1
+            task = asyncio.ensure_future(self._load(key, fetch))
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._settle(key, done))
+        else:
+            self.stats.coalesced += 1
+        return await asyncio.shield(task)
+
+    def invalidate(self, key: Hashable) -> None:
+        """Drop the cached value for ``key`` if present."""
+
+        self._entries.pop(key, None)
+        self.stats.entries = len(self._entries)
+
+    def clear(self) -> None:
+        """Drop every cached value."""
+
+        self._entries.clear()
+        self.stats.entries = 0
+
+    async def _load(self, key: Hashable, fetch: Callable[[], Awaitable[V]]) -> V:
+        value = await fetch()
+        self._entries[key] = (self._clock() + self.ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.stats.evictions += 1
+        self.stats.entries = len(self._entries)
+        return value
+
+    def _settle(self, key: Hashable, task: asyncio.Task[V]) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled():
+            task.exception()
+
+
+@dataclass
+class MarketDataCache:
+    """Per-endpoint caches shared by every market data route."""
+
+    quotes: TTLCache[dict[str, float]] = field(
+        default_factory=lambda: TTLCache(ttl=DEFAULT_QUOTE_TTL)
+    )
+    chains: TTLCache[list[dict[str, object]]] = field(
+        default_factory=lambda: TTLCache(ttl=DEFAULT_CHAIN_TTL)
+    )
+
+    def stats(self) -> dict[str, dict[str, int]]:
+        """Return the counters of each endpoint cache."""
+
+        return {
+            "quotes": self.quotes.stats.as_dict(),
+            "chains": self.chains.stats.as_dict(),
+        }
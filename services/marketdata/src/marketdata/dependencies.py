@@ -0,0 +1,38 @@
+"""Request-scoped accessors for market data service state."""
+
+from __future__ import annotations
+
+from typing import Annotated
+
+from fastapi import Depends, Request
+from goldshore_market import SimulatedOptionsClient
+
+from .cache import MarketDataCache
+from .streaming import QuoteHub
+
+
+def get_options_client(request: Request) -> SimulatedOptionsClient:
+    """Return the options client attached to the running application."""
+
+    return request.app.state.options_client
+
+
+OptionsClient = Annotated[SimulatedOptionsClient, Depends(get_options_client)]
+
+
+def get_cache(request: Request) -> MarketDataCache:
+    """Return the endpoint caches attached to the running application."""
+
+    return request.app.state.cache
+
+
+Cache = Annotated[MarketDataCache, Depends(get_cache)]
+
+
+def get_hub(request: Request) -> QuoteHub:
+    """Return the quote fan-out hub attached to the running application."""
+
+    return request.app.state.hub
+
+
+Hub = Annotated[QuoteHub, Depends(get_hub)]
@@ -2,15 +2,178 @@
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
+import logging
+import os
+from collections.abc import AsyncIterator, Sequence
+
 from fastapi import FastAPI
+from goldshore_market import SimulatedOptionsClient, SnapshotStore
+from goldshore_utils import configure_logging, export_from_env
+from goldshore_utils.responses import (
+    MetricsMiddleware,
+    NegotiatedResponse,
+    NegotiationMiddleware,
+    metrics_endpoint,
+)
 
+from .batch import GREEK_NAMES, batch_greeks
+from .cache import (
+    DEFAULT_CHAIN_TTL,
+    DEFAULT_MAX_ENTRIES,
+    DEFAULT_QUOTE_TTL,
+    MarketDataCache,
+    TTLCache,
+)
 from .routers import router
+from .streaming import QuoteHub, StreamedContract
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_DIR_ENV = "MARKETDATA_SNAPSHOT_DIR"
+SNAPSHOT_INTERVAL_ENV = "MARKETDATA_SNAPSHOT_INTERVAL"
+QUOTE_TTL_MS_ENV = "MARKETDATA_QUOTE_TTL_MS"
+CHAIN_TTL_ENV = "MARKETDATA_CHAIN_TTL"
+CACHE_ENTRIES_ENV = "MARKETDATA_CACHE_ENTRIES"
+STREAM_INTERVAL_MS_ENV = "MARKETDATA_STREAM_INTERVAL_MS"
+DEFAULT_SNAPSHOT_INTERVAL = 60.0
+DEFAULT_STREAM_INTERVAL_MS = 100.0
+
+
+def _build_cache() -> MarketDataCache:
+    max_entries = int(os.environ.get(CACHE_ENTRIES_ENV, DEFAULT_MAX_ENTRIES))
+    quote_ttl_ms = float(os.environ.get(QUOTE_TTL_MS_ENV, DEFAULT_QUOTE_TTL * 1000))
+    chain_ttl = float(os.environ.get(CHAIN_TTL_ENV, DEFAULT_CHAIN_TTL))
+    return MarketDataCache(
+        quotes=TTLCache(ttl=quote_ttl_ms / 1000, max_entries=max_entries),
+        chains=TTLCache(ttl=chain_ttl, max_entries=max_entries),
+    )
+
+
+async def _snapshot_periodically(
+    client: SimulatedOptionsClient,
+    store: SnapshotStore,
+    interval: float,
+) -> None:
+    while True:
+        await asyncio.sleep(interval)
+        client.snapshot(store)
+
+
+def _price_contracts(
+    client: SimulatedOptionsClient, contracts: Sequence[StreamedContract]
+) -> dict[str, dict[str, object]]:
+    """Return greeks per contract key, one vectorized call per underlying."""
+
+    by_symbol: dict[str, list[StreamedContract]] = {}
+    for contract in contracts:
+        by_symbol.setdefault(contract.symbol, []).append(contract)
+    greeks: dict[str, dict[str, object]] = {}
+    for symbol, group in by_symbol.items():
+        try:
+            rows = batch_greeks(
+                client,
+                symbols=[symbol] * len(group),
+                strikes=[contract.strike for contract in group],
+                expiries=[contract.expiry for contract in group],
+                option_types=[contract.option_type for contract in group],
+            )
+        except ValueError:
+            # An expired contract fails its underlying's batch; skip this tick.
+            logger.warning("Could not price streamed contracts on %s", symbol)
+            continue
+        for contract, row in zip(group, rows, strict=True):
+            greeks[contract.key] = {name: row[name] for name in GREEK_NAMES}
+    return greeks
+
+
+async def _publish_quotes(
+    client: SimulatedOptionsClient,
+    hub: QuoteHub,
+    interval: float,
+) -> None:
+    while True:
+        for symbol in hub.symbols():
+            hub.publish(symbol, client.get_quote(symbol))
+        contracts = hub.contracts()
+        if contracts:
+            greeks = await asyncio.to_thread(_price_contracts, client, contracts)
+            for key, fields in greeks.items():
+                hub.publish(key, fields)
+        await asyncio.sleep(interval)
+
+
+@contextlib.asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Publish streamed quotes and greeks and write periodic chain snapshots."""
+
+    configure_logging("marketdata")
+    export_from_env("marketdata")
+    store: SnapshotStore | None = app.state.snapshot_store
+    hub: QuoteHub = app.state.hub
+    stream_interval = float(
+        os.environ.get(STREAM_INTERVAL_MS_ENV, DEFAULT_STREAM_INTERVAL_MS)
+    )
+    tasks = [
+        asyncio.create_task(
+            _publish_quotes(app.state.options_client, hub, stream_interval / 1000)
+        )
+    ]
+    if store is not None:
+        interval = float(
+            os.environ.get(SNAPSHOT_INTERVAL_ENV, DEFAULT_SNAPSHOT_INTERVAL)
+        )
+        tasks.append(
+            asyncio.create_task(
+                _snapshot_periodically(app.state.options_client, store, interval)
+            )
+        )
+    try:
+        yield
+    finally:
+        hub.close()
+        for task in tasks:
+            task.cancel()
+        for task in tasks:
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+        if store is not None:
+            app.state.options_client.snapshot(store)
 
 
 def create_app() -> FastAPI:
-    """Return a FastAPI application with market data routes registered."""
+    """Return a FastAPI application with market data routes registered.
+
+    When ``MARKETDATA_SNAPSHOT_DIR`` is set the latest stored chains are
+    restored before the first request and snapshots are appended every
+    ``MARKETDATA_SNAPSHOT_INTERVAL`` seconds and on shutdown.
+
+    Quotes are cached for ``MARKETDATA_QUOTE_TTL_MS`` milliseconds and chains
+    for ``MARKETDATA_CHAIN_TTL`` seconds, each cache holding at most
+    ``MARKETDATA_CACHE_ENTRIES`` keys. Every
+    ``MARKETDATA_STREAM_INTERVAL_MS`` milliseconds the quotes of streamed
+    symbols are polled and the greeks of streamed contracts are repriced off
+    their surfaces, and both are fanned out to subscribers.
+    """
 
-    app = FastAPI(title="Gold Shore Market Data", version="0.1.0")
+    app = FastAPI(
+        title="Gold Shore Market Data",
+        version="0.1.0",
+        lifespan=lifespan,
+        default_response_class=NegotiatedResponse,
+    )
+    app.add_middleware(NegotiationMiddleware)
+    app.add_middleware(MetricsMiddleware)
+    app.add_route("/metrics", metrics_endpoint, include_in_schema=False)
+    app.state.options_client = SimulatedOptionsClient()
+    app.state.cache = _build_cache()
+    app.state.hub = QuoteHub()
+    app.state.snapshot_store = None
+    snapshot_dir = os.environ.get(SNAPSHOT_DIR_ENV)
+    if snapshot_dir:
+        app.state.snapshot_store = SnapshotStore(snapshot_dir)
+        app.state.options_client.restore(app.state.snapshot_store)
     app.include_router(router)
     return app
 
@@ -1,50 +1,179 @@
-"""Route stubs for the market data service."""
+"""HTTP routes for the market data service."""
 
 from __future__ import annotations
 
+import asyncio
 from datetime import date
 
-from fastapi import APIRouter
+from fastapi import APIRouter, HTTPException, Response
+from fastapi.responses import StreamingResponse
+from goldshore_options import OptionType
+from goldshore_utils.responses import NegotiatedResponse
+from pydantic import BaseModel
 
-OptionsChain = list[dict[str, object]]
+from .batch import NDJSON_MEDIA_TYPE, batch_greeks, batch_quotes, ndjson_chunks
+from .dependencies import Cache, Hub, OptionsClient
+from .streaming import StreamedContract
 
 router = APIRouter(prefix="/marketdata", tags=["marketdata"])
 
 
-@router.get("/health", summary="Service health probe")
-def healthcheck() -> dict[str, str]:
-    """Return readiness information for monitoring."""
+class Contract(BaseModel):
+    """Option contract identified by underlying, strike, expiry and type."""
 
-    return {"status": "ok"}
+    symbol: str
+    strike: float
+    expiry: date
+    option_type: OptionType = "call"
 
 
-@router.get("/quotes/{symbol}", summary="Fetch the latest quote")
-def get_quote(symbol: str) -> dict[str, float]:
-    """Return a placeholder quote snapshot for ``symbol``."""
+class GreeksBatchRequest(BaseModel):
+    """Contracts to revalue in one request."""
 
-    return {"symbol": symbol, "bid": 0.0, "ask": 0.0, "last": 0.0}
+    contracts: list[Contract]
 
 
-@router.get("/options/{symbol}", summary="Fetch option chain")
-def get_option_chain(symbol: str, expiry: date | None = None) -> OptionsChain:
-    """Return a placeholder option chain for ``symbol`` and optional ``expiry``."""
+class QuotesBatchRequest(BaseModel):
+    """Symbols whose latest quotes are requested."""
 
-    _ = expiry
-    return [
-        {"symbol": symbol, "strike": 0.0, "type": "call"}
-    ]
+    symbols: list[str]
 
 
-@router.get("/greeks/{symbol}", summary="Fetch placeholder greek sensitivities")
-def get_greeks(symbol: str, strike: float, expiry: date) -> dict[str, float]:
-    """Return placeholder greeks for the specified contract."""
+@router.get("/health", summary="Service health probe")
+def healthcheck() -> dict[str, str]:
+    """Return readiness information for monitoring."""
 
-    _ = (strike, expiry)
-    return {
-        "symbol": symbol,
-        "delta": 0.0,
-        "gamma": 0.0,
-        "theta": 0.0,
-        "vega": 0.0,
-        "rho": 0.0,
-    }
+    return {"status": "ok"}
+
+
+@router.get("/cache", summary="Quote and chain cache counters")
+def cache_stats(cache: Cache) -> dict[str, dict[str, int]]:
+    """Return hit, miss, coalescing and eviction counters per endpoint."""
+
+    return cache.stats()
+
+
+@router.get("/quotes/{symbol}", summary="Fetch the latest quote")
+async def get_quote(
+    symbol: str, client: OptionsClient, cache: Cache
+) -> dict[str, object]:
+    """Return the latest quote snapshot for ``symbol``.
+
+    Quotes are served from a short-lived cache; concurrent misses for the
+    same symbol share one upstream fetch.
+    """
+
+    quote = await cache.quotes.get(
+        symbol, lambda: asyncio.to_thread(client.get_quote, symbol)
+    )
+    return {"symbol": symbol, **quote}
+
+
+@router.get("/stream", summary="Stream quote and greeks updates")
+async def stream_quotes(
+    hub: Hub, symbols: str = "", contracts: str = ""
+) -> StreamingResponse:
+    """Stream updates for comma-separated ``symbols`` and ``contracts`` as SSE.
+
+    ``symbols`` stream quotes. ``contracts`` are written
+    ``SYMBOL:EXPIRY:STRIKE:TYPE`` and stream greeks repriced off the
+    symbol's volatility surface on every tick. Each stream starts with a
+    ``snapshot`` event of all fields, followed by ``delta`` events carrying
+    only changed fields. A slow client skips intermediate ticks and receives
+    a fresh ``snapshot`` instead.
+    """
+
+    names = [symbol.strip() for symbol in symbols.split(",") if symbol.strip()]
+    try:
+        keys = [
+            StreamedContract.parse(contract).key
+            for contract in contracts.split(",")
+            if contract.strip()
+        ]
+    except ValueError as exc:
+        raise HTTPException(status_code=422, detail=str(exc)) from exc
+    if not names and not keys:
+        raise HTTPException(status_code=422, detail="No symbols or contracts requested")
+    subscription = hub.subscribe([*names, *keys])
+    return StreamingResponse(
+        subscription.frames(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache"},
+    )
+
+
+@router.get(
+    "/options/{symbol}",
+    response_model=list[dict[str, object]],
+    summary="Fetch option chain",
+)
+async def get_option_chain(
+    symbol: str,
+    client: OptionsClient,
+    cache: Cache,
+    expiry: date | None = None,
+) -> Response:
+    """Return the option chain for ``symbol`` and optional ``expiry``.
+
+    The columnar chain is only converted to JSON records here, at the edge,
+    and the records are cached per ``(symbol, expiry)``.
+    """
+
+    def fetch() -> list[dict[str, object]]:
+        return client.get_chain(symbol, expiry=expiry).to_records()
+
+    records = await cache.chains.get((symbol, expiry), lambda: asyncio.to_thread(fetch))
+    return NegotiatedResponse(records)
+
+
+@router.get("/greeks/{symbol}", summary="Fetch greek sensitivities")
+def get_greeks(
+    symbol: str,
+    strike: float,
+    expiry: date,
+    client: OptionsClient,
+    option_type: OptionType = "call",
+) -> dict[str, object]:
+    """Return greeks for the specified contract priced off the symbol's surface."""
+
+    try:
+        greeks = client.get_greeks(
+            symbol, strike=strike, expiry=expiry, option_type=option_type
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=422, detail=str(exc)) from exc
+    return {"symbol": symbol, **greeks}
+
+
+@router.post("/greeks/batch", summary="Fetch greeks for many contracts")
+async def get_greeks_batch(
+    request: GreeksBatchRequest, client: OptionsClient
+) -> StreamingResponse:
+    """Stream one NDJSON greeks row per contract, in request order.
+
+    Contracts are priced with one vectorized call per underlying.
+    """
+
+    contracts = request.contracts
+    try:
+        rows = await asyncio.to_thread(
+            batch_greeks,
+            client,
+            symbols=[contract.symbol for contract in contracts],
+            strikes=[contract.strike for contract in contracts],
+            expiries=[contract.expiry for contract in contracts],
+            option_types=[contract.option_type for contract in contracts],
+        )
+    except (LookupError, ValueError) as exc:
+        raise HTTPException(status_code=422, detail=str(exc)) from exc
+    return StreamingResponse(ndjson_chunks(rows), media_type=NDJSON_MEDIA_TYPE)
+
+
+@router.post("/quotes/batch", summary="Fetch quotes for many symbols")
+async def get_quotes_batch(
+    request: QuotesBatchRequest, client: OptionsClient
+) -> StreamingResponse:
+    """Stream one NDJSON quote row per symbol, in request order."""
+
+    rows = await asyncio.to_thread(batch_quotes, client, request.symbols)
+    return StreamingResponse(ndjson_chunks(rows), media_type=NDJSON_MEDIA_TYPE)
@@ -0,0 +1,232 @@
+"""Server-sent event fan-out of delta-encoded quote and greeks updates."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from collections.abc import AsyncIterator, Iterable, Mapping
+from dataclasses import dataclass
+from datetime import date
+
+DEFAULT_HEARTBEAT = 15.0
+KEEPALIVE = b": keepalive\n\n"
+CONTRACT_SEPARATOR = ":"
+_OPTION_TYPES = ("call", "put")
+
+
+@dataclass(frozen=True)
+class StreamedContract:
+    """Option contract whose greeks are streamed under :attr:`key`.
+
+    Contracts are written ``SYMBOL:EXPIRY:STRIKE:TYPE``, for example
+    ``SPY:2026-07-02:100:call``; :attr:`key` is the canonical spelling used
+    as the stream key and in every event's ``symbol`` field.
+    """
+
+    symbol: str
+    expiry: date
+    strike: float
+    option_type: str
+
+    @classmethod
+    def parse(cls, text: str) -> StreamedContract:
+        """Parse ``SYMBOL:EXPIRY:STRIKE:TYPE``, raising ``ValueError`` if malformed."""
+
+        try:
+            symbol, expiry, strike, option_type = text.strip().split(CONTRACT_SEPARATOR)
+        except ValueError:
+            raise ValueError(f"Invalid contract {text!r}") from None
+        if not symbol or option_type not in _OPTION_TYPES:
+            raise ValueError(f"Invalid contract {text!r}")
+        return cls(
+            symbol=symbol,
+            expiry=date.fromisoformat(expiry),
+            strike=float(strike),
+            option_type=option_type,
+        )
+
+    @property
+    def key(self) -> str:
+        """Return the canonical stream key of the contract."""
+
+        return CONTRACT_SEPARATOR.join(
+            (self.symbol, self.expiry.isoformat(), f"{self.strike:g}", self.option_type)
+        )
+
+
+def _frame(event: str, payload: Mapping[str, object]) -> bytes:
+    data = json.dumps(payload, separators=(",", ":"))
+    return f"event: {event}\ndata: {data}\n\n".encode()
+
+
+@dataclass(frozen=True)
+class Tick:
+    """One published update, encoded once for every subscriber.
+
+    ``full`` is a ``snapshot`` event carrying every field of the symbol;
+    ``delta`` is a ``delta`` event carrying only the fields that changed.
+    Both carry the symbol's sequence number.
+    """
+
+    symbol: str
+    seq: int
+    full: bytes
+    delta: bytes
+
+
+class Subscription:
+    """A subscriber's pending updates, at most one per symbol.
+
+    When a new tick arrives for a symbol whose previous tick has not been
+    sent yet, the old one is replaced and the symbol is marked stale, so
+    the subscriber receives the full snapshot rather than a delta it could
+    not apply. A slow consumer therefore holds at most one frame per
+    subscribed symbol and always converges on the latest state.
+    """
+
+    def __init__(
+        self,
+        hub: QuoteHub,
+        symbols: Iterable[str],
+        *,
+        heartbeat: float = DEFAULT_HEARTBEAT,
+    ) -> None:
+        self.symbols = frozenset(symbols)
+        self.heartbeat = heartbeat
+        self.conflated = 0
+        self.closed = False
+        self._hub = hub
+        self._pending: dict[str, Tick] = {}
+        self._stale: set[str] = set()
+        self._wakeup = asyncio.Event()
+
+    def offer(self, tick: Tick, *, full: bool = False) -> None:
+        """Queue ``tick``, conflating it with an unsent tick for its symbol."""
+
+        if tick.symbol in self._pending:
+            self.conflated += 1
+            full = True
+        if full:
+            self._stale.add(tick.symbol)
+        self._pending[tick.symbol] = tick
+        self._wakeup.set()
+
+    def close(self) -> None:
+        """End the stream once pending frames have been sent."""
+
+        self.closed = True
+        self._wakeup.set()
+
+    async def frames(self) -> AsyncIterator[bytes]:
+        """Yield encoded frames, batching everything pending per write.
+
+        A keep-alive comment is sent after ``heartbeat`` idle seconds.
+        """
+
+        try:
+            while True:
+                if not self._pending:
+                    if self.closed:
+                        return
+                    self._wakeup.clear()
+                    try:
+                        await asyncio.wait_for(self._wakeup.wait(), self.heartbeat)
+                    except asyncio.TimeoutError:  # noqa: UP041 - distinct on 3.10
+                        yield KEEPALIVE
+                    continue
+                pending, self._pending = self._pending, {}
+                stale, self._stale = self._stale, set()
+                yield b"".join(
+                    tick.full if symbol in stale else tick.delta
+                    for symbol, tick in pending.items()
+                )
+        finally:
+            self._hub.unsubscribe(self)
+
+
+class QuoteHub:
+    """Single producer fan-out of quote and greeks updates to many subscribers.
+
+    Streams are keyed by symbol for quotes and by
+    :attr:`StreamedContract.key` for greeks.
+
+    :meth:`publish` diffs the new fields against the symbol's last state,
+    serializes the snapshot and delta frames once, and hands the same bytes
+    to every subscriber of the symbol. Unchanged quotes publish nothing.
+    """
+
+    def __init__(self, *, heartbeat: float = DEFAULT_HEARTBEAT) -> None:
+        self.heartbeat = heartbeat
+        self.closed = False
+        self._state: dict[str, dict[str, float]] = {}
+        self._latest: dict[str, Tick] = {}
+        self._subscribers: dict[str, set[Subscription]] = {}
+
+    def symbols(self) -> list[str]:
+        """Return the quote symbols with at least one subscriber."""
+
+        return [key for key in self._subscribers if CONTRACT_SEPARATOR not in key]
+
+    def contracts(self) -> list[StreamedContract]:
+        """Return the subscribed contracts, parsed from their stream keys."""
+
+        return [
+            StreamedContract.parse(key)
+            for key in self._subscribers
+            if CONTRACT_SEPARATOR in key
+        ]
+
+    def subscribe(self, symbols: Iterable[str]) -> Subscription:
+        """Register a subscription, seeded with each symbol's latest snapshot."""
+
+        subscription = Subscription(self, symbols, heartbeat=self.heartbeat)
+        for symbol in subscription.symbols:
+            self._subscribers.setdefault(symbol, set()).add(subscription)
+            latest = self._latest.get(symbol)
+            if latest is not None:
+                subscription.offer(latest, full=True)
+        if self.closed:
+            subscription.close()
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        """Stop delivering updates to ``subscription``."""
+
+        for symbol in subscription.symbols:
+            subscribers = self._subscribers.get(symbol)
+            if subscribers is None:
+                continue
+            subscribers.discard(subscription)
+            if not subscribers:
+                del self._subscribers[symbol]
+
+    def publish(self, symbol: str, fields: Mapping[str, float]) -> Tick | None:
+        """Publish new ``fields`` for ``symbol``; return the tick if any changed."""
+
+        state = self._state.setdefault(symbol, {})
+        changed = {
+            key: value for key, value in fields.items() if state.get(key) != value
+        }
+        if not changed:
+            return None
+        state.update(changed)
+        previous = self._latest.get(symbol)
+        seq = previous.seq + 1 if previous is not None else 1
+        tick = Tick(
+            symbol=symbol,
+            seq=seq,
+            full=_frame("snapshot", {"symbol": symbol, "seq": seq, **state}),
+            delta=_frame("delta", {"symbol": symbol, "seq": seq, **changed}),
+        )
+        self._latest[symbol] = tick
+        for subscription in self._subscribers.get(symbol, ()):
+            subscription.offer(tick, full=previous is None)
+        return tick
+
+    def close(self) -> None:
+        """End every open subscription and any opened later."""
+
+        self.closed = True
+        for subscribers in list(self._subscribers.values()):
+            for subscription in list(subscribers):
+                subscription.close()
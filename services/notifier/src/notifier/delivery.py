@@ -0,0 +1,321 @@
+"""Per-channel alert delivery with deduplication and digest coalescing."""
+
+from __future__ import annotations
+
+import asyncio
+import random
+import time
+import uuid
+from collections import OrderedDict, deque
+from collections.abc import Callable
+from dataclasses import asdict, dataclass, field
+from typing import Protocol
+
+import httpx
+
+DEFAULT_QUEUE_SIZE = 1000
+DEFAULT_WORKERS = 2
+DEFAULT_DEDUP_WINDOW = 60.0
+DEFAULT_DIGEST_INTERVAL = 5.0
+DEFAULT_DIGEST_SUBJECTS = 20
+DEFAULT_HISTORY = 10_000
+
+
+def new_alert_id() -> str:
+    """Return a fresh alert identifier."""
+
+    return f"alert-{uuid.uuid4().hex[:12]}"
+
+
+@dataclass(slots=True)
+class Alert:
+    """An alert and its delivery state.
+
+    ``status`` is ``queued``, ``delivered``, ``failed``, ``deduplicated``
+    (suppressed as a repeat of ``duplicate_of``) or ``digested`` (folded
+    into a channel digest while the channel was flooded).
+    """
+
+    alert_id: str
+    channel: str
+    subject: str
+    body: str
+    status: str = "queued"
+    duplicate_of: str | None = None
+    detail: str | None = None
+
+    def as_dict(self) -> dict[str, object]:
+        """Return the alert as a JSON-serializable dictionary."""
+
+        return asdict(self)
+
+
+class Transport(Protocol):
+    """Outbound delivery mechanism for one message on one channel."""
+
+    async def send(self, channel: str, *, subject: str, body: str) -> None:
+        """Deliver a message, raising on failure."""
+
+
+@dataclass
+class MemoryTransport:
+    """Transport that keeps the most recent messages in memory.
+
+    Used when no outbound endpoint is configured and as a local stub.
+    """
+
+    limit: int = 1000
+    sent: deque[tuple[str, str, str]] = field(init=False)
+
+    def __post_init__(self) -> None:
+        self.sent = deque(maxlen=self.limit)
+
+    async def send(self, channel: str, *, subject: str, body: str) -> None:
+        """Record the message."""
+
+        self.sent.append((channel, subject, body))
+
+
+@dataclass
+class WebhookTransport:
+    """POST each message to ``{base_url}/{channel}`` over pooled connections.
+
+    One ``httpx.AsyncClient`` is shared by every channel worker, so
+    connection setup is paid once per pooled socket. Pass ``transport`` to
+    route requests to a local stub server or mock in tests.
+    """
+
+    base_url: str
+    timeout: float = 10.0
+    max_connections: int = 20
+    transport: httpx.AsyncBaseTransport | None = None
+    _http: httpx.AsyncClient | None = field(default=None, init=False, repr=False)
+
+    def _client(self) -> httpx.AsyncClient:
+        if self._http is None:
+            self._http = httpx.AsyncClient(
+                base_url=self.base_url,
+                timeout=self.timeout,
+                limits=httpx.Limits(max_connections=self.max_connections),
+                transport=self.transport,
+            )
+        return self._http
+
+    async def send(self, channel: str, *, subject: str, body: str) -> None:
+        """Deliver the message and raise for non-2xx responses."""
+
+        response = await self._client().post(
+            f"/{channel}", json={"subject": subject, "body": body}
+        )
+        response.raise_for_status()
+
+    async def aclose(self) -> None:
+        """Close the pooled connections."""
+
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
+
+
+@dataclass
+class ChannelStats:
+    """Delivery counters for one channel."""
+
+    queued: int = 0
+    delivered: int = 0
+    failed: int = 0
+    deduplicated: int = 0
+    digested: int = 0
+    digests: int = 0
+
+
+@dataclass
+class _Channel:
+    queue: asyncio.Queue[Alert]
+    workers: list[asyncio.Task[None]] = field(default_factory=list)
+    digest: list[Alert] = field(default_factory=list)
+    last_digest: float = 0.0
+    digest_lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+    stats: ChannelStats = field(default_factory=ChannelStats)
+
+
+@dataclass
+class DeliveryQueue:
+    """Bounded per-channel queues drained by a pool of delivery workers.
+
+    :meth:`submit` never waits on delivery. An alert repeating the
+    ``(channel, subject)`` of one accepted within ``dedup_window`` seconds
+    is marked ``deduplicated`` and not sent again. When a channel's queue
+    of ``queue_size`` alerts is full the channel is flooded: further alerts
+    are folded into a digest, sent as one message listing up to
+    ``digest_subjects`` subjects at most every ``digest_interval`` seconds
+    once the backlog has drained. Each channel gets ``workers`` tasks
+    sending through the shared ``transport``; failed sends are retried
+    ``max_retries`` times with jittered exponential backoff.
+    """
+
+    transport: Transport = field(default_factory=MemoryTransport)
+    queue_size: int = DEFAULT_QUEUE_SIZE
+    workers: int = DEFAULT_WORKERS
+    dedup_window: float = DEFAULT_DEDUP_WINDOW
+    digest_interval: float = DEFAULT_DIGEST_INTERVAL
+    digest_subjects: int = DEFAULT_DIGEST_SUBJECTS
+    max_retries: int = 3
+    backoff: float = 0.1
+    history: int = DEFAULT_HISTORY
+    clock: Callable[[], float] = time.monotonic
+    _channels: dict[str, _Channel] = field(default_factory=dict, init=False)
+    _recent: OrderedDict[tuple[str, str], tuple[float, str]] = field(
+        default_factory=OrderedDict, init=False
+    )
+    _alerts: OrderedDict[str, Alert] = field(default_factory=OrderedDict, init=False)
+    _running: bool = field(default=False, init=False)
+
+    async def start(self) -> None:
+        """Allow channel workers to be started."""
+
+        self._running = True
+
+    async def stop(self) -> None:
+        """Deliver queued alerts and pending digests, then stop the workers."""
+
+        self._running = False
+        for channel in self._channels.values():
+            await channel.queue.join()
+        for name, channel in self._channels.items():
+            for worker in channel.workers:
+                worker.cancel()
+            await asyncio.gather(*channel.workers, return_exceptions=True)
+            channel.workers.clear()
+            await self._send_digest(name, channel)
+
+    def get(self, alert_id: str) -> Alert | None:
+        """Return a recent alert by identifier."""
+
+        return self._alerts.get(alert_id)
+
+    def stats(self) -> dict[str, dict[str, int]]:
+        """Return delivery counters and queue depth per channel."""
+
+        return {
+            name: {**asdict(channel.stats), "depth": channel.queue.qsize()}
+            for name, channel in self._channels.items()
+        }
+
+    def submit(self, channel_name: str, *, subject: str, body: str) -> Alert:
+        """Accept an alert for delivery and return its record immediately."""
+
+        if not self._running:
+            raise RuntimeError("Delivery queue has not been started")
+        alert = Alert(
+            alert_id=new_alert_id(), channel=channel_name, subject=subject, body=body
+        )
+        channel = self._channel(channel_name)
+        now = self.clock()
+        key = (channel_name, subject)
+        self._expire(now)
+        seen = self._recent.get(key)
+        if seen is not None:
+            alert.status = "deduplicated"
+            alert.duplicate_of = seen[1]
+            channel.stats.deduplicated += 1
+        else:
+            self._recent[key] = (now, alert.alert_id)
+            try:
+                channel.queue.put_nowait(alert)
+            except asyncio.QueueFull:
+                alert.status = "digested"
+                channel.digest.append(alert)
+                channel.stats.digested += 1
+            else:
+                channel.stats.queued += 1
+        return self._remember(alert)
+
+    def _channel(self, name: str) -> _Channel:
+        channel = self._channels.get(name)
+        if channel is None:
+            channel = _Channel(queue=asyncio.Queue(maxsize=self.queue_size))
+            channel.last_digest = self.clock()
+            channel.workers = [
+                asyncio.create_task(self._work(name, channel))
+                for _ in range(self.workers)
+            ]
+            self._channels[name] = channel
+        return channel
+
+    def _expire(self, now: float) -> None:
+        while self._recent:
+            key, (seen_at, _) = next(iter(self._recent.items()))
+            if now - seen_at < self.dedup_window:
+                break
+            del self._recent[key]
+
+    def _remember(self, alert: Alert) -> Alert:
+        self._alerts[alert.alert_id] = alert
+        while len(self._alerts) > self.history:
+            self._alerts.popitem(last=False)
+        return alert
+
+    async def _work(self, name: str, channel: _Channel) -> None:
+        while True:
+            try:
+                alert = await asyncio.wait_for(
+                    channel.queue.get(), self.digest_interval
+                )
+            except asyncio.TimeoutError:  # noqa: UP041 - distinct on 3.10
+                await self._send_digest(name, channel)
+                continue
+            try:
+                await self._deliver(name, alert.subject, alert.body)
+            except Exception as exc:
+                # Transport errors are recorded on the alert; the worker lives on.
+                alert.status = "failed"
+                alert.detail = str(exc)
+                channel.stats.failed += 1
+            else:
+                alert.status = "delivered"
+                channel.stats.delivered += 1
+            try:
+                if channel.queue.empty():
+                    await self._send_digest(name, channel)
+            finally:
+                channel.queue.task_done()
+
+    async def _send_digest(self, name: str, channel: _Channel) -> None:
+        async with channel.digest_lock:
+            now = self.clock()
+            due = not self._running or now - channel.last_digest >= self.digest_interval
+            if channel.digest and due:
+                # Alerts leave the digest only once sent, so a worker cancelled
+                # mid-send on shutdown leaves them for the final flush.
+                alerts = list(channel.digest)
+                await self._flush_digest(name, channel, alerts)
+                del channel.digest[: len(alerts)]
+                channel.last_digest = now
+
+    async def _flush_digest(
+        self, name: str, channel: _Channel, alerts: list[Alert]
+    ) -> None:
+        subjects = [alert.subject for alert in alerts[: self.digest_subjects]]
+        more = len(alerts) - len(subjects)
+        body = "\n".join(subjects) + (f"\n... and {more} more" if more else "")
+        try:
+            await self._deliver(name, f"Digest: {len(alerts)} alerts on {name}", body)
+        except Exception as exc:
+            for alert in alerts:
+                alert.detail = f"Digest delivery failed: {exc}"
+            channel.stats.failed += 1
+        else:
+            channel.stats.digests += 1
+
+    async def _deliver(self, channel: str, subject: str, body: str) -> None:
+        attempt = 0
+        while True:
+            try:
+                await self.transport.send(channel, subject=subject, body=body)
+                return
+            except Exception:
+                if attempt >= self.max_retries:
+                    raise
+            await asyncio.sleep(random.uniform(0.0, self.backoff * 2**attempt))
+            attempt += 1
@@ -0,0 +1,18 @@
+"""Request-scoped accessors for notifier service state."""
+
+from __future__ import annotations
+
+from typing import Annotated
+
+from fastapi import Depends, Request
+
+from .delivery import DeliveryQueue
+
+
+def get_delivery(request: Request) -> DeliveryQueue:
+    """Return the alert delivery queue attached to the running application."""
+
+    return request.app.state.delivery
+
+
+Delivery = Annotated[DeliveryQueue, Depends(get_delivery)]
@@ -2,15 +2,90 @@
 
 from __future__ import annotations
 
+import contextlib
+import os
+from collections.abc import AsyncIterator
+
 from fastapi import FastAPI
+from goldshore_utils import configure_logging, export_from_env
+from goldshore_utils.responses import (
+    MetricsMiddleware,
+    NegotiatedResponse,
+    NegotiationMiddleware,
+    metrics_endpoint,
+)
 
+from .delivery import (
+    DEFAULT_DEDUP_WINDOW,
+    DEFAULT_DIGEST_INTERVAL,
+    DEFAULT_QUEUE_SIZE,
+    DEFAULT_WORKERS,
+    DeliveryQueue,
+    MemoryTransport,
+    Transport,
+    WebhookTransport,
+)
 from .routers import router
 
+WEBHOOK_URL_ENV = "NOTIFIER_WEBHOOK_URL"
+QUEUE_SIZE_ENV = "NOTIFIER_QUEUE_SIZE"
+WORKERS_ENV = "NOTIFIER_WORKERS"
+DEDUP_WINDOW_ENV = "NOTIFIER_DEDUP_WINDOW"
+DIGEST_INTERVAL_ENV = "NOTIFIER_DIGEST_INTERVAL"
+
+
+def _build_delivery(transport: Transport | None) -> DeliveryQueue:
+    if transport is None:
+        transport = (
+            WebhookTransport(base_url=os.environ[WEBHOOK_URL_ENV])
+            if WEBHOOK_URL_ENV in os.environ
+            else MemoryTransport()
+        )
+    return DeliveryQueue(
+        transport=transport,
+        queue_size=int(os.environ.get(QUEUE_SIZE_ENV, str(DEFAULT_QUEUE_SIZE))),
+        workers=int(os.environ.get(WORKERS_ENV, str(DEFAULT_WORKERS))),
+        dedup_window=float(os.environ.get(DEDUP_WINDOW_ENV, str(DEFAULT_DEDUP_WINDOW))),
+        digest_interval=float(
+            os.environ.get(DIGEST_INTERVAL_ENV, str(DEFAULT_DIGEST_INTERVAL))
+        ),
+    )
+
+
+@contextlib.asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Run the delivery workers while the service is up."""
+
+    configure_logging("notifier")
+    export_from_env("notifier")
+    delivery: DeliveryQueue = app.state.delivery
+    await delivery.start()
+    try:
+        yield
+    finally:
+        await delivery.stop()
+        aclose = getattr(delivery.transport, "aclose", None)
+        if aclose is not None:
+            await aclose()
+
+
+def create_app(*, transport: Transport | None = None) -> FastAPI:
+    """Return a FastAPI application with notifier routes registered.
 
-def create_app() -> FastAPI:
-    """Return a FastAPI application with notifier routes registered."""
+    ``transport`` overrides the outbound transport, which otherwise posts to
+    ``NOTIFIER_WEBHOOK_URL`` or, when unset, keeps messages in memory.
+    """
 
-    app = FastAPI(title="Gold Shore Notifier", version="0.1.0")
+    app = FastAPI(
+        title="Gold Shore Notifier",
+        version="0.1.0",
+        lifespan=lifespan,
+        default_response_class=NegotiatedResponse,
+    )
+    app.add_middleware(NegotiationMiddleware)
+    app.add_middleware(MetricsMiddleware)
+    app.add_route("/metrics", metrics_endpoint, include_in_schema=False)
+    app.state.delivery = _build_delivery(transport)
     app.include_router(router)
     return app
 
@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
-from fastapi import APIRouter
+from fastapi import APIRouter, HTTPException, Response, status
 from pydantic import BaseModel
 
+from .dependencies import Delivery
+
 router = APIRouter(prefix="/notifier", tags=["notifier"])
 
 
@@ -23,15 +25,58 @@ def healthcheck() -> dict[str, str]:
     return {"status": "ok"}
 
 
-@router.post("/alerts", summary="Dispatch an alert")
-def dispatch_alert(request: AlertRequest) -> dict[str, object]:
-    """Persist and schedule a new alert notification."""
+@router.get("/stats", summary="Delivery counters per channel")
+def delivery_stats(delivery: Delivery) -> dict[str, dict[str, int]]:
+    """Return queue depth and delivery outcomes for every channel."""
+
+    return delivery.stats()
+
+
+@router.post(
+    "/alerts", summary="Dispatch an alert", status_code=status.HTTP_202_ACCEPTED
+)
+async def dispatch_alert(
+    request: AlertRequest, delivery: Delivery
+) -> dict[str, object]:
+    """Queue a new alert for delivery without waiting on the channel."""
+
+    alert = delivery.submit(request.channel, subject=request.subject, body=request.body)
+    response: dict[str, object] = {
+        "id": alert.alert_id,
+        "status": alert.status,
+        "payload": request.model_dump(),
+    }
+    if alert.duplicate_of is not None:
+        response["duplicate_of"] = alert.duplicate_of
+    return response
+
+
+@router.get("/alerts/{alert_id}", summary="Inspect an alert")
+def get_alert(alert_id: str, delivery: Delivery) -> dict[str, object]:
+    """Return the delivery state of a recent alert."""
 
-    return {"id": "alert-001", "status": "queued", "payload": request.model_dump()}
+    alert = delivery.get(alert_id)
+    if alert is None:
+        raise HTTPException(status_code=404, detail="Alert not found")
+    return alert.as_dict()
 
 
 @router.post("/alerts/test", summary="Send a test alert")
-def test_alert(request: AlertRequest) -> dict[str, object]:
-    """Send a test alert without affecting production pipelines."""
+async def test_alert(
+    request: AlertRequest, delivery: Delivery, response: Response
+) -> dict[str, object]:
+    """Send a test alert straight through the transport, bypassing the queue."""
 
+    try:
+        await delivery.transport.send(
+            request.channel, subject=request.subject, body=request.body
+        )
+    except Exception as exc:
+        response.status_code = status.HTTP_502_BAD_GATEWAY
+        return {
+            "id": "alert-test",
+            "status": "failed",
+            "detail": str(exc),
+            "payload": request.model_dump(),
+        }
     return {"id": "alert-test", "status": "delivered", "payload": request.model_dump()}
@@ -0,0 +1,79 @@
+"""HTTP clients for the market data and executor services."""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass, field
+from typing import Protocol
+
+import httpx
+
+
+class MarketDataClient(Protocol):
+    """Source of reference quotes for plan compilation."""
+
+    async def quotes(self, symbols: Sequence[str]) -> dict[str, dict[str, float]]:
+        """Return the latest quote of every symbol."""
+
+
+class ExecutorClient(Protocol):
+    """Destination for compiled order batches."""
+
+    async def submit_orders(
+        self, orders: Sequence[Mapping[str, object]]
+    ) -> list[dict[str, object]]:
+        """Submit ``orders`` in one call and return their handles in order."""
+
+
+@dataclass
+class _ServiceClient:
+    base_url: str
+    timeout: float = 10.0
+    transport: httpx.AsyncBaseTransport | None = None
+    _http: httpx.AsyncClient | None = field(default=None, init=False, repr=False)
+
+    def _client(self) -> httpx.AsyncClient:
+        if self._http is None:
+            self._http = httpx.AsyncClient(
+                base_url=self.base_url, timeout=self.timeout, transport=self.transport
+            )
+        return self._http
+
+    async def aclose(self) -> None:
+        """Close the pooled connections."""
+
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
+
+
+@dataclass
+class HttpMarketDataClient(_ServiceClient):
+    """Fetch quotes through the market data service's batch endpoint."""
+
+    async def quotes(self, symbols: Sequence[str]) -> dict[str, dict[str, float]]:
+        """Return the latest quote of every symbol from one NDJSON response."""
+
+        response = await self._client().post(
+            "/marketdata/quotes/batch", json={"symbols": list(symbols)}
+        )
+        response.raise_for_status()
+        rows = (json.loads(line) for line in response.text.splitlines() if line)
+        return {row.pop("symbol"): row for row in rows}
+
+
+@dataclass
+class HttpExecutorClient(_ServiceClient):
+    """Submit order batches through the executor service's batch endpoint."""
+
+    async def submit_orders(
+        self, orders: Sequence[Mapping[str, object]]
+    ) -> list[dict[str, object]]:
+        """Submit ``orders`` in one request and return their handles in order."""
+
+        response = await self._client().post(
+            "/executor/orders/batch", json={"orders": list(orders)}
+        )
+        response.raise_for_status()
+        return response.json()
@@ -0,0 +1,286 @@
+"""Compilation of approved plans into priced, risk-checked order batches."""
+
+from __future__ import annotations
+
+import asyncio
+import math
+from collections.abc import Mapping, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+
+from goldshore_risk import Policy, RiskEngine
+
+from .clients import ExecutorClient, MarketDataClient
+from .plans import Plan, PlanStore
+
+DEFAULT_WINDOW_SECONDS = 0.05
+DEFAULT_MAX_BATCH = 500
+
+
+@dataclass(frozen=True)
+class CompiledOrder:
+    """A concrete order derived from one plan."""
+
+    plan_id: str
+    symbol: str
+    side: str
+    quantity: float
+    price: float
+
+    @property
+    def signed_quantity(self) -> float:
+        """Return the quantity, negative for sells."""
+
+        return self.quantity if self.side == "buy" else -self.quantity
+
+    def payload(self) -> dict[str, object]:
+        """Return the executor order payload, keyed by the plan for idempotency."""
+
+        return {
+            "symbol": self.symbol,
+            "side": self.side,
+            "quantity": self.quantity,
+            "price": self.price,
+            "client_order_id": self.plan_id,
+        }
+
+
+def reference_price(quote: Mapping[str, float] | None) -> float:
+    """Return the quote mid, falling back to the last trade, or ``0.0``."""
+
+    if not quote:
+        return 0.0
+    bid, ask = quote.get("bid", 0.0), quote.get("ask", 0.0)
+    if bid > 0.0 and ask > 0.0:
+        return 0.5 * (bid + ask)
+    return max(quote.get("last", 0.0), 0.0)
+
+
+def compile_orders(
+    plans: Sequence[Plan], quotes: Mapping[str, Mapping[str, float]]
+) -> tuple[list[CompiledOrder], dict[str, str]]:
+    """Size one whole-share order per plan from its notional and quote.
+
+    Positive notionals buy and negative notionals sell. Returns the orders
+    and the rejection reason of every plan that could not be sized.
+    """
+
+    orders: list[CompiledOrder] = []
+    rejected: dict[str, str] = {}
+    for plan in plans:
+        price = reference_price(quotes.get(plan.target_symbol))
+        if price <= 0.0:
+            rejected[plan.plan_id] = "No reference price"
+            continue
+        quantity = math.floor(abs(plan.notional) / price)
+        if quantity == 0:
+            rejected[plan.plan_id] = "Notional is below one share"
+            continue
+        orders.append(
+            CompiledOrder(
+                plan_id=plan.plan_id,
+                symbol=plan.target_symbol,
+                side="buy" if plan.notional > 0 else "sell",
+                quantity=float(quantity),
+                price=price,
+            )
+        )
+    return orders, rejected
+
+
+def check_orders(
+    policies: Sequence[Policy], orders: Sequence[CompiledOrder]
+) -> list[tuple[str, ...]]:
+    """Return the breached policies of each order, in order.
+
+    Approved orders count towards the exposure seen by later orders, so
+    several plans in the same symbol cannot jointly exceed a limit.
+    """
+
+    engine = RiskEngine(policies=list(policies))
+    breaches: list[tuple[str, ...]] = []
+    for order in orders:
+        decision = engine.check(
+            order.symbol, quantity=order.signed_quantity, price=order.price
+        )
+        if decision.approved:
+            engine.on_order(
+                order.plan_id,
+                symbol=order.symbol,
+                quantity=order.signed_quantity,
+                price=order.price,
+            )
+        breaches.append(decision.breaches)
+    return breaches
+
+
+@dataclass
+class PlanCompiler:
+    """Turn approved plans into orders and hand them to the executor in bulk.
+
+    :meth:`enqueue` returns immediately. A background worker collects plans
+    for ``window`` seconds (or until ``max_batch`` arrive), so a burst of
+    approvals becomes one batch. Each batch fetches quotes for all of its
+    symbols in one market data call, sizes the orders, runs every policy on
+    a worker (a process pool of ``workers`` when above one, split by
+    symbol), and submits the approved orders in one executor call. Batches
+    run as independent tasks, so the next burst is collected while the
+    previous one is still in flight.
+
+    Plans end ``submitted`` with the executor's ``order_id``, ``rejected``
+    when they cannot be sized, fail a policy or are rejected by the
+    executor, or ``failed`` when a downstream service errors.
+    """
+
+    plans: PlanStore
+    marketdata: MarketDataClient
+    executor: ExecutorClient
+    policies: Sequence[Policy] = ()
+    window: float = DEFAULT_WINDOW_SECONDS
+    max_batch: int = DEFAULT_MAX_BATCH
+    workers: int = 1
+    # ``None`` on the queue asks the worker to compile its batch and exit.
+    _queue: asyncio.Queue[str | None] | None = field(default=None, init=False)
+    _worker: asyncio.Task[None] | None = field(default=None, init=False)
+    _batches: set[asyncio.Task[None]] = field(default_factory=set, init=False)
+    _pool: ProcessPoolExecutor | None = field(default=None, init=False)
+
+    async def start(self) -> None:
+        """Start the background worker, requeueing plans left compiling."""
+
+        if self._worker is None:
+            self._queue = asyncio.Queue()
+            if self.workers > 1:
+                self._pool = ProcessPoolExecutor(max_workers=self.workers)
+            page, cursor = self.plans.query(status="compiling")
+            while page:
+                for plan in page:
+                    self._queue.put_nowait(plan.plan_id)
+                if cursor is None:
+                    break
+                page, cursor = self.plans.query(status="compiling", cursor=cursor)
+            self._worker = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Compile queued plans, wait for batches in flight, and stop."""
+
+        if self._worker is None or self._queue is None:
+            return
+        self._queue.put_nowait(None)
+        await self._worker
+        await asyncio.gather(*self._batches)
+        self._worker = None
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def enqueue(self, plan_id: str) -> Plan:
+        """Mark an approved plan ``compiling`` and queue it."""
+
+        if self._queue is None:
+            raise RuntimeError("Plan compiler has not been started")
+        plan = self.plans.update(plan_id, status="compiling")
+        self._queue.put_nowait(plan_id)
+        return plan
+
+    async def _run(self) -> None:
+        assert self._queue is not None
+        loop = asyncio.get_running_loop()
+        stopping = False
+        while not stopping:
+            first = await self._queue.get()
+            if first is None:
+                return
+            batch = [first]
+            deadline = loop.time() + self.window
+            while len(batch) < self.max_batch:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    plan_id = await asyncio.wait_for(self._queue.get(), remaining)
+                except asyncio.TimeoutError:  # noqa: UP041 - distinct on 3.10
+                    break
+                if plan_id is None:
+                    stopping = True
+                    break
+                batch.append(plan_id)
+            task = asyncio.create_task(self._compile(batch))
+            self._batches.add(task)
+            task.add_done_callback(self._batches.discard)
+
+    async def _compile(self, plan_ids: Sequence[str]) -> None:
+        plans = [
+            plan
+            for plan in (self.plans.get(plan_id) for plan_id in plan_ids)
+            if plan is not None and plan.status == "compiling"
+        ]
+        if not plans:
+            return
+        try:
+            quotes = await self.marketdata.quotes(
+                sorted({plan.target_symbol for plan in plans})
+            )
+            orders, rejected = compile_orders(plans, quotes)
+            breaches = await self._check(orders)
+            approved = []
+            for order, breached in zip(orders, breaches, strict=True):
+                if breached:
+                    rejected[order.plan_id] = "Risk check failed: " + ", ".join(
+                        breached
+                    )
+                else:
+                    approved.append(order)
+            handles = (
+                await self.executor.submit_orders(
+                    [order.payload() for order in approved]
+                )
+                if approved
+                else []
+            )
+        except Exception as exc:
+            # Any market data, risk or executor failure fails the whole batch.
+            for plan in plans:
+                self.plans.update(
+                    plan.plan_id, status="failed", detail=f"Compilation failed: {exc}"
+                )
+            return
+
+        for plan_id, reason in rejected.items():
+            self.plans.update(plan_id, status="rejected", detail=reason)
+        for order, handle in zip(approved, handles, strict=True):
+            # The executor's own risk check can reject an order synchronously.
+            rejected_by_executor = handle.get("status") == "rejected"
+            self.plans.update(
+                order.plan_id,
+                status="rejected" if rejected_by_executor else "submitted",
+                order_id=str(handle["order_id"]),
+                detail=handle.get("detail"),
+            )
+
+    async def _check(self, orders: Sequence[CompiledOrder]) -> list[tuple[str, ...]]:
+        if not self.policies or not orders:
+            return [() for _ in orders]
+        if self._pool is None:
+            return await asyncio.to_thread(check_orders, self.policies, orders)
+
+        groups: dict[str, list[int]] = {}
+        for index, order in enumerate(orders):
+            groups.setdefault(order.symbol, []).append(index)
+        loop = asyncio.get_running_loop()
+        results = await asyncio.gather(
+            *(
+                loop.run_in_executor(
+                    self._pool,
+                    check_orders,
+                    list(self.policies),
+                    [orders[index] for index in indices],
+                )
+                for indices in groups.values()
+            )
+        )
+        breaches: list[tuple[str, ...]] = [()] * len(orders)
+        for indices, result in zip(groups.values(), results, strict=True):
+            for index, breached in zip(indices, result, strict=True):
+                breaches[index] = breached
+        return breaches
@@ -0,0 +1,28 @@
+"""Request-scoped accessors for planner service state."""
+
+from __future__ import annotations
+
+from typing import Annotated
+
+from fastapi import Depends, Request
+
+from .compiler import PlanCompiler
+from .plans import PlanStore
+
+
+def get_plans(request: Request) -> PlanStore:
+    """Return the plan store attached to the running application."""
+
+    return request.app.state.plans
+
+
+Plans = Annotated[PlanStore, Depends(get_plans)]
+
+
+def get_compiler(request: Request) -> PlanCompiler | None:
+    """Return the plan compiler, or ``None`` when compilation is not configured."""
+
+    return request.app.state.compiler
+
+
+Compiler = Annotated[PlanCompiler | None, Depends(get_compiler)]
@@ -2,15 +2,116 @@
 
 from __future__ import annotations
 
+import contextlib
+import os
+from collections.abc import AsyncIterator
+
 from fastapi import FastAPI
+from goldshore_risk import Policy, PositionLimitPolicy
+from goldshore_utils import configure_logging, export_from_env
+from goldshore_utils.responses import (
+    MetricsMiddleware,
+    NegotiatedResponse,
+    NegotiationMiddleware,
+    metrics_endpoint,
+)
 
+from .clients import (
+    ExecutorClient,
+    HttpExecutorClient,
+    HttpMarketDataClient,
+    MarketDataClient,
+)
+from .compiler import DEFAULT_WINDOW_SECONDS, PlanCompiler
+from .plans import PlanStore
 from .routers import router
 
+DB_PATH_ENV = "PLANNER_DB_PATH"
+MARKETDATA_URL_ENV = "PLANNER_MARKETDATA_URL"
+EXECUTOR_URL_ENV = "PLANNER_EXECUTOR_URL"
+COMPILE_WINDOW_ENV = "PLANNER_COMPILE_WINDOW"
+RISK_WORKERS_ENV = "PLANNER_RISK_WORKERS"
+MAX_NOTIONAL_ENV = "PLANNER_MAX_NOTIONAL"
+
+
+def _build_policies() -> list[Policy]:
+    policies: list[Policy] = []
+    if MAX_NOTIONAL_ENV in os.environ:
+        policies.append(
+            PositionLimitPolicy(max_notional=float(os.environ[MAX_NOTIONAL_ENV]))
+        )
+    return policies
+
+
+def _build_compiler(
+    plans: PlanStore,
+    marketdata: MarketDataClient | None,
+    executor: ExecutorClient | None,
+) -> PlanCompiler | None:
+    if marketdata is None and MARKETDATA_URL_ENV in os.environ:
+        marketdata = HttpMarketDataClient(base_url=os.environ[MARKETDATA_URL_ENV])
+    if executor is None and EXECUTOR_URL_ENV in os.environ:
+        executor = HttpExecutorClient(base_url=os.environ[EXECUTOR_URL_ENV])
+    if marketdata is None or executor is None:
+        return None
+    return PlanCompiler(
+        plans=plans,
+        marketdata=marketdata,
+        executor=executor,
+        policies=_build_policies(),
+        window=float(os.environ.get(COMPILE_WINDOW_ENV, DEFAULT_WINDOW_SECONDS)),
+        workers=int(os.environ.get(RISK_WORKERS_ENV, "1")),
+    )
+
+
+@contextlib.asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Run the plan compiler while the service is up and close the store."""
+
+    configure_logging("planner")
+    export_from_env("planner")
+    compiler: PlanCompiler | None = app.state.compiler
+    if compiler is not None:
+        await compiler.start()
+    try:
+        yield
+    finally:
+        if compiler is not None:
+            await compiler.stop()
+            for client in (compiler.marketdata, compiler.executor):
+                aclose = getattr(client, "aclose", None)
+                if aclose is not None:
+                    await aclose()
+        app.state.plans.close()
+
+
+def create_app(
+    *,
+    marketdata: MarketDataClient | None = None,
+    executor: ExecutorClient | None = None,
+) -> FastAPI:
+    """Return a FastAPI application with planner routes registered.
 
-def create_app() -> FastAPI:
-    """Return a FastAPI application with planner routes registered."""
+    Plans are persisted to the SQLite database at ``PLANNER_DB_PATH`` when
+    set, and kept in memory otherwise. When market data and executor
+    clients are given, or ``PLANNER_MARKETDATA_URL`` and
+    ``PLANNER_EXECUTOR_URL`` are set, approved plans are compiled into
+    orders in batches collected over ``PLANNER_COMPILE_WINDOW`` seconds.
+    ``PLANNER_MAX_NOTIONAL`` registers a position limit checked on
+    ``PLANNER_RISK_WORKERS`` processes.
+    """
 
-    app = FastAPI(title="Gold Shore Planner", version="0.1.0")
+    app = FastAPI(
+        title="Gold Shore Planner",
+        version="0.1.0",
+        lifespan=lifespan,
+        default_response_class=NegotiatedResponse,
+    )
+    app.add_middleware(NegotiationMiddleware)
+    app.add_middleware(MetricsMiddleware)
+    app.add_route("/metrics", metrics_endpoint, include_in_schema=False)
+    app.state.plans = PlanStore(os.environ.get(DB_PATH_ENV))
+    app.state.compiler = _build_compiler(app.state.plans, marketdata, executor)
     app.include_router(router)
     return app
 
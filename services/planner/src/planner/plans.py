@@ -0,0 +1,271 @@
+"""Plan records and their SQLite-backed repository."""
+
+from __future__ import annotations
+
+import base64
+import binascii
+import os
+import sqlite3
+import threading
+import uuid
+from dataclasses import asdict, dataclass, fields
+from datetime import datetime
+from typing import Any
+
+from goldshore_utils import from_nanos, to_nanos, utc_now
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS plans (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    plan_id TEXT NOT NULL UNIQUE,
+    name TEXT NOT NULL,
+    rationale TEXT NOT NULL,
+    target_symbol TEXT NOT NULL,
+    notional REAL NOT NULL,
+    status TEXT NOT NULL,
+    created_ns INTEGER NOT NULL,
+    approved_by TEXT,
+    order_id TEXT,
+    detail TEXT
+);
+DROP INDEX IF EXISTS plans_by_status;
+DROP INDEX IF EXISTS plans_by_symbol;
+CREATE INDEX IF NOT EXISTS plans_by_status_created ON plans (status, created_ns, seq);
+CREATE INDEX IF NOT EXISTS plans_by_symbol_created
+    ON plans (target_symbol, created_ns, seq);
+CREATE INDEX IF NOT EXISTS plans_by_created ON plans (created_ns, seq);
+"""
+_COLUMNS = (
+    "seq",
+    "plan_id",
+    "name",
+    "rationale",
+    "target_symbol",
+    "notional",
+    "status",
+    "created_ns",
+    "approved_by",
+    "order_id",
+    "detail",
+)
+
+
+def new_plan_id() -> str:
+    """Return a fresh plan identifier."""
+
+    return f"plan-{uuid.uuid4().hex[:12]}"
+
+
+@dataclass(slots=True)
+class Plan:
+    """A proposed trading plan and its approval state.
+
+    Approved plans move through ``compiling`` to ``submitted`` (with the
+    executor's ``order_id``), ``rejected`` or ``failed``, with ``detail``
+    explaining the outcome.
+    """
+
+    plan_id: str
+    name: str
+    rationale: str
+    target_symbol: str
+    notional: float
+    status: str = "pending"
+    created_ns: int = 0
+    approved_by: str | None = None
+    order_id: str | None = None
+    detail: str | None = None
+    seq: int = 0
+
+    @property
+    def created_at(self) -> datetime:
+        """Return the creation time as an aware UTC datetime."""
+
+        return from_nanos(self.created_ns)
+
+    def details(self) -> dict[str, object]:
+        """Return the plan's fields for API responses."""
+
+        details = asdict(self)
+        for key in ("plan_id", "status", "created_ns", "seq"):
+            del details[key]
+        details["created_at"] = self.created_at.isoformat()
+        for key in ("approved_by", "order_id", "detail"):
+            if details[key] is None:
+                del details[key]
+        return details
+
+
+def encode_cursor(created_ns: int, seq: int) -> str:
+    """Return the opaque cursor that resumes listing after a plan."""
+
+    token = f"{created_ns}.{seq}".encode()
+    return base64.urlsafe_b64encode(token).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[int, int]:
+    """Return the ``(created_ns, seq)`` position encoded by :func:`encode_cursor`."""
+
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_ns, seq = base64.urlsafe_b64decode(padded.encode()).decode().split(".")
+        return int(created_ns), int(seq)
+    except (binascii.Error, UnicodeDecodeError, ValueError) as exc:
+        raise ValueError(f"Invalid cursor {cursor!r}") from exc
+
+
+class PlanStore:
+    """Plans held in memory by id and persisted to SQLite.
+
+    Every plan is kept in an in-memory primary index, so lookups never touch
+    the database. The SQLite table carries B-tree indexes on
+    ``(status, created_ns, seq)``, ``(target_symbol, created_ns, seq)`` and
+    ``(created_ns, seq)``. :meth:`query` lists in ``(created_ns, seq)`` order
+    with the same pair as its keyset cursor, so every combination of filters
+    is one range scan over an index already in listing order, with no sort.
+    One page of ids is read and resolved from memory, so cost depends on the
+    page size rather than the number of stored plans.
+    With a ``path`` the database runs in WAL mode and survives restarts;
+    without one it lives in memory.
+    """
+
+    def __init__(self, path: str | os.PathLike[str] | None = None) -> None:
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(
+            ":memory:" if path is None else os.fspath(path),
+            check_same_thread=False,
+            isolation_level=None,
+        )
+        if path is not None:
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.executescript(_SCHEMA)
+        self._plans: dict[str, Plan] = {}
+        for row in self._db.execute(f"SELECT {', '.join(_COLUMNS)} FROM plans"):
+            plan = Plan(**dict(zip(_COLUMNS, row, strict=True)))
+            self._plans[plan.plan_id] = plan
+
+    def __len__(self) -> int:
+        return len(self._plans)
+
+    def get(self, plan_id: str) -> Plan | None:
+        """Return the plan with ``plan_id`` if known."""
+
+        return self._plans.get(plan_id)
+
+    def create(
+        self,
+        *,
+        name: str,
+        rationale: str,
+        target_symbol: str,
+        notional: float,
+    ) -> Plan:
+        """Persist a new pending plan created now."""
+
+        plan = Plan(
+            plan_id=new_plan_id(),
+            name=name,
+            rationale=rationale,
+            target_symbol=target_symbol,
+            notional=notional,
+            created_ns=to_nanos(utc_now()),
+        )
+        values = {column: getattr(plan, column) for column in _COLUMNS[1:]}
+        with self._lock:
+            cursor = self._db.execute(
+                f"INSERT INTO plans ({', '.join(values)}) "
+                f"VALUES ({', '.join('?' * len(values))})",
+                tuple(values.values()),
+            )
+            plan.seq = int(cursor.lastrowid or 0)
+            self._plans[plan.plan_id] = plan
+        return plan
+
+    def update(self, plan_id: str, **changes: Any) -> Plan:
+        """Apply ``changes`` to a stored plan and persist them."""
+
+        allowed = {field.name for field in fields(Plan)} - {"plan_id", "seq"}
+        unknown = changes.keys() - allowed
+        if unknown:
+            raise ValueError(f"Unknown plan fields: {sorted(unknown)}")
+        with self._lock:
+            plan = self._plans[plan_id]
+            assignments = ", ".join(f"{name} = ?" for name in changes)
+            self._db.execute(
+                f"UPDATE plans SET {assignments} WHERE plan_id = ?",
+                (*changes.values(), plan_id),
+            )
+            for name, value in changes.items():
+                setattr(plan, name, value)
+        return plan
+
+    def query(  # noqa: PLR0913
+        self,
+        *,
+        status: str | None = None,
+        target_symbol: str | None = None,
+        created_after: datetime | None = None,
+        created_before: datetime | None = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: str | None = None,
+    ) -> tuple[list[Plan], str | None]:
+        """Return one page of matching plans, newest first, and the next cursor.
+
+        The cursor is ``None`` on the last page.
+        """
+
+        limit = max(1, min(limit, MAX_PAGE_SIZE))
+        sql, parameters = _select(
+            status=status,
+            target_symbol=target_symbol,
+            created_after=created_after,
+            created_before=created_before,
+            cursor=cursor,
+        )
+        with self._lock:
+            rows = self._db.execute(sql, (*parameters, limit + 1)).fetchall()
+        page = [self._plans[plan_id] for (plan_id,) in rows[:limit]]
+        next_cursor = None
+        if len(rows) > limit:
+            next_cursor = encode_cursor(page[-1].created_ns, page[-1].seq)
+        return page, next_cursor
+
+    def close(self) -> None:
+        """Close the database connection."""
+
+        with self._lock:
+            self._db.close()
+
+
+def _select(
+    *,
+    status: str | None,
+    target_symbol: str | None,
+    created_after: datetime | None,
+    created_before: datetime | None,
+    cursor: str | None,
+) -> tuple[str, list[object]]:
+    clauses: list[str] = []
+    parameters: list[object] = []
+    if status is not None:
+        clauses.append("status = ?")
+        parameters.append(status)
+    if target_symbol is not None:
+        clauses.append("target_symbol = ?")
+        parameters.append(target_symbol)
+    if created_after is not None:
+        clauses.append("created_ns >= ?")
+        parameters.append(to_nanos(created_after))
+    if created_before is not None:
+        clauses.append("created_ns < ?")
+        parameters.append(to_nanos(created_before))
+    if cursor is not None:
+        clauses.append("(created_ns, seq) < (?, ?)")
+        parameters.extend(decode_cursor(cursor))
+    where = f"WHERE {' AND '.join(clauses)} " if clauses else ""
+    sql = f"SELECT plan_id FROM plans {where}ORDER BY created_ns DESC, seq DESC LIMIT ?"
+    return sql, parameters
@@ -1,12 +1,20 @@
-"""Route stubs for the planner service."""
+"""HTTP routes for the planner service."""
 
 from __future__ import annotations
 
-from fastapi import APIRouter, HTTPException
+from datetime import datetime
+
+from fastapi import APIRouter, HTTPException, Query, Response
+from goldshore_utils.responses import NegotiatedResponse
 from pydantic import BaseModel
 
+from .dependencies import Compiler, Plans
+from .plans import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, Plan
+
 router = APIRouter(prefix="/planner", tags=["planner"])
 
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
 
 class PlanRequest(BaseModel):
     """Payload describing a proposed strategy plan."""
@@ -25,6 +33,17 @@ class PlanResponse(BaseModel):
     details: dict[str, object]
 
 
+def _response(plan: Plan) -> PlanResponse:
+    return PlanResponse(id=plan.plan_id, status=plan.status, details=plan.details())
+
+
+def _plan_or_404(plans: Plans, plan_id: str) -> Plan:
+    plan = plans.get(plan_id)
+    if plan is None:
+        raise HTTPException(status_code=404, detail="Plan not found")
+    return plan
+
+
 @router.get("/health", summary="Service health probe")
 def healthcheck() -> dict[str, str]:
     """Return readiness information for load balancers."""
@@ -33,19 +52,49 @@ def healthcheck() -> dict[str, str]:
 
 
 @router.post("/plans", response_model=PlanResponse, summary="Submit a new trading plan")
-def submit_plan(request: PlanRequest) -> PlanResponse:
-    """Accept a plan submission and return a placeholder record."""
+def submit_plan(request: PlanRequest, plans: Plans) -> PlanResponse:
+    """Store a new pending plan and return it."""
 
-    return PlanResponse(id="plan-000", status="pending", details=request.model_dump())
+    return _response(plans.create(**request.model_dump()))
 
 
 @router.get("/plans", response_model=list[PlanResponse], summary="List existing plans")
-def list_plans() -> list[PlanResponse]:
-    """Return a list of staged plans awaiting approval."""
-
-    return [
-        PlanResponse(id="plan-000", status="pending", details={"name": "Stub strategy"})
-    ]
+def list_plans(  # noqa: PLR0913
+    plans: Plans,
+    *,
+    status: str | None = None,
+    target_symbol: str | None = None,
+    created_after: datetime | None = None,
+    created_before: datetime | None = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: str | None = None,
+) -> Response:
+    """Return one page of plans, newest first, matching the filters.
+
+    When more plans match, the ``X-Next-Cursor`` header carries the cursor
+    for the following page. The page is encoded straight from the stored
+    plans rather than through response model validation.
+    """
+
+    try:
+        page, next_cursor = plans.query(
+            status=status,
+            target_symbol=target_symbol,
+            created_after=created_after,
+            created_before=created_before,
+            limit=limit,
+            cursor=cursor,
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=422, detail=str(exc)) from exc
+    headers = {NEXT_CURSOR_HEADER: next_cursor} if next_cursor is not None else None
+    return NegotiatedResponse(
+        [
+            {"id": plan.plan_id, "status": plan.status, "details": plan.details()}
+            for plan in page
+        ],
+        headers=headers,
+    )
 
 
 @router.get(
@@ -53,16 +102,10 @@ def list_plans() -> list[PlanResponse]:
     response_model=PlanResponse,
     summary="Fetch a specific plan",
 )
-def get_plan(plan_id: str) -> PlanResponse:
-    """Return a placeholder plan or raise when it cannot be found."""
+def get_plan(plan_id: str, plans: Plans) -> PlanResponse:
+    """Return the plan or raise when it cannot be found."""
 
-    if plan_id != "plan-000":
-        raise HTTPException(status_code=404, detail="Plan not found")
-    return PlanResponse(
-        id=plan_id,
-        status="pending",
-        details={"name": "Stub strategy"},
-    )
+    return _response(_plan_or_404(plans, plan_id))
 
 
 @router.post(
@@ -70,13 +113,18 @@ def get_plan(plan_id: str) -> PlanResponse:
     response_model=PlanResponse,
     summary="Approve a plan for execution",
 )
-def approve_plan(plan_id: str) -> PlanResponse:
-    """Transition a plan into the approved state and emit the placeholder status."""
-
-    if plan_id != "plan-000":
-        raise HTTPException(status_code=404, detail="Plan not found")
-    return PlanResponse(
-        id=plan_id,
-        status="approved",
-        details={"approved_by": "system"},
-    )
+async def approve_plan(plan_id: str, plans: Plans, compiler: Compiler) -> PlanResponse:
+    """Approve a pending plan and queue it for compilation into orders.
+
+    Without a configured compiler the plan simply stays ``approved``.
+    """
+
+    plan = _plan_or_404(plans, plan_id)
+    if plan.status != "pending":
+        raise HTTPException(
+            status_code=409, detail=f"Plan is {plan.status}, not pending"
+        )
+    plan = plans.update(plan_id, status="approved", approved_by="system")
+    if compiler is not None:
+        plan = compiler.enqueue(plan_id)
+    return _response(plan)
@@ -0,0 +1,104 @@
+"""Tests for the event-driven backtest engine."""
+
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+import pytest
+from goldshore_backtest import (
+    BacktestEngine,
+    QuoteStream,
+    RegimeStrategy,
+    parameter_grid,
+    run_sweep,
+)
+from goldshore_market import OptionChain, SnapshotStore
+from goldshore_risk import PositionLimitPolicy
+from goldshore_utils import utc_now
+
+START = datetime(2024, 1, 2, 14, 30, tzinfo=timezone.utc)  # noqa: UP017 - datetime.UTC needs 3.11
+
+
+def _trending_stream(ticks: int = 200) -> QuoteStream:
+    minutes = np.arange(ticks)
+    up = 100.0 * np.exp(0.002 * minutes)
+    down = 50.0 * np.exp(-0.002 * minutes)
+    stamps = [START + timedelta(minutes=int(minute)) for minute in minutes]
+    return QuoteStream.from_arrays(
+        timestamps=stamps + stamps,
+        symbols=["UP"] * ticks + ["DOWN"] * ticks,
+        bid=np.concatenate([up, down]) - 0.01,
+        ask=np.concatenate([up, down]) + 0.01,
+    )
+
+
+class ClockProbe:
+    def __init__(self) -> None:
+        self.seen: list[datetime] = []
+        self.chains: list[str] = []
+
+    def on_quote(self, context, symbol, bid, ask) -> None:
+        self.seen.append(utc_now())
+
+    def on_chain(self, context, snapshot) -> None:
+        self.chains.append(snapshot.symbol)
+
+
+def test_backtest_replays_in_simulated_time(tmp_path) -> None:
+    chain = OptionChain.from_columns(
+        "SPY",
+        strike=[400.0],
+        expiry=["2024-02-16"],
+        option_type=["call"],
+        bid=[1.0],
+        ask=[1.1],
+    )
+    with SnapshotStore(tmp_path) as store:
+        for minute in range(3):
+            store.append(
+                chain,
+                quote={"bid": 400.0 + minute, "ask": 400.1 + minute, "last": 400.0},
+                timestamp=START + timedelta(minutes=minute),
+            )
+        stream = QuoteStream.from_snapshots(store)
+
+    probe = ClockProbe()
+    result = BacktestEngine(strategy=probe).run(stream)
+    assert probe.seen == [START + timedelta(minutes=minute) for minute in range(3)]
+    assert probe.chains == ["SPY", "SPY", "SPY"]
+    assert utc_now() > START + timedelta(days=365)
+    assert result.metrics()["pnl"] == 0.0
+
+
+def test_regime_strategy_follows_trends_through_risk_checks() -> None:
+    stream = _trending_stream()
+    result = BacktestEngine(
+        strategy=RegimeStrategy(quantity=10),
+        policies=[PositionLimitPolicy(max_notional=5_000.0)],
+    ).run(stream)
+
+    metrics = result.metrics()
+    assert metrics["pnl"] > 0.0
+    assert metrics["trades"] == len(result.fills) == 2
+    assert {fill["side"] for fill in result.fills} == {"buy", "sell"}
+    assert result.equity.shape == (len(stream),)
+
+    request = result.to_evaluation_request("plan-42")
+    assert request["plan_id"] == "plan-42"
+    assert request["fills"][0]["timestamp"].startswith("2024-01-02T")
+
+    capped = BacktestEngine(
+        strategy=RegimeStrategy(quantity=100),
+        policies=[PositionLimitPolicy(max_notional=5_000.0)],
+    ).run(stream)
+    assert capped.metrics()["rejected"] > 0
+
+
+def test_parameter_sweep_runs_across_process_pool() -> None:
+    stream = _trending_stream(120)
+    grid = parameter_grid(quantity=[5, 10], window=[10, 20])
+    assert len(grid) == 4
+    sequential = run_sweep(stream, RegimeStrategy, grid, slippage_bps=1.0)
+    pooled = run_sweep(stream, RegimeStrategy, grid, workers=2, slippage_bps=1.0)
+    assert [result.parameters for result in pooled] == grid
+    for left, right in zip(sequential, pooled, strict=True):
+        assert left.metrics() == pytest.approx(right.metrics())
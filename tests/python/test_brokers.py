@@ -0,0 +1,138 @@
+"""Tests for the broker adapters against a local stub HTTP server."""
+
+import asyncio
+import json
+import threading
+from collections.abc import Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from goldshore_brokers import (
+    AlpacaPaperEquitiesClient,
+    AsyncAlpacaPaperEquitiesClient,
+    TokenBucket,
+)
+
+
+class StubAlpacaHandler(BaseHTTPRequestHandler):
+    """Serve canned Alpaca responses, throttling the first account request."""
+
+    protocol_version = "HTTP/1.1"
+    requests: list[tuple[str, str]] = []
+    throttle_account = True
+    retry_after = "0"
+
+    def log_message(self, *args: object) -> None:
+        pass
+
+    def _reply(self, status: int, body: object | None = None) -> None:
+        payload = b"" if body is None else json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        if status == 429:
+            self.send_header("Retry-After", type(self).retry_after)
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def do_GET(self) -> None:
+        type(self).requests.append(("GET", self.path))
+        if self.path == "/v2/account":
+            if type(self).throttle_account:
+                type(self).throttle_account = False
+                self._reply(429, {"message": "rate limit exceeded"})
+            else:
+                self._reply(200, {"status": "ACTIVE", "equity": "100000"})
+        else:
+            self._reply(200, {"id": self.path.rsplit("/", 1)[-1], "status": "filled"})
+
+    def do_POST(self) -> None:
+        length = int(self.headers["Content-Length"])
+        body = json.loads(self.rfile.read(length))
+        type(self).requests.append(("POST", self.path))
+        self._reply(200, {"id": f"order-{body['symbol']}", "status": "accepted"})
+
+    def do_DELETE(self) -> None:
+        type(self).requests.append(("DELETE", self.path))
+        self._reply(404 if self.path.endswith("missing") else 204)
+
+
+@pytest.fixture
+def stub_url() -> Iterator[str]:
+    StubAlpacaHandler.requests = []
+    StubAlpacaHandler.throttle_account = True
+    StubAlpacaHandler.retry_after = "0"
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubAlpacaHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.mark.parametrize(
+    "retry_after", ["0", "Wed, 21 Oct 2015 07:28:00 GMT", "shortly"]
+)
+def test_async_client_retries_throttled_reads(stub_url: str, retry_after: str) -> None:
+    StubAlpacaHandler.retry_after = retry_after
+
+    async def scenario() -> tuple[dict[str, object], bool, bool]:
+        async with AsyncAlpacaPaperEquitiesClient(
+            "key", "secret", base_url=stub_url, backoff=0.0
+        ) as client:
+            account = await client.get_account()
+            cancelled = await client.cancel_order("abc")
+            missing = await client.cancel_order("missing")
+            return account, cancelled, missing
+
+    account, cancelled, missing = asyncio.run(scenario())
+
+    assert account["status"] == "ACTIVE"
+    assert StubAlpacaHandler.requests[:2] == [("GET", "/v2/account")] * 2
+    assert cancelled is True
+    assert missing is False
+
+
+def test_async_client_batches_orders_over_pool(stub_url: str) -> None:
+    async def scenario() -> list[dict[str, object]]:
+        async with AsyncAlpacaPaperEquitiesClient(
+            "key", "secret", base_url=stub_url, max_connections=4
+        ) as client:
+            client.configure_ratelimit(burst=50, sustained=6000)
+            return await client.submit_orders(
+                [{"symbol": symbol, "qty": 1} for symbol in ("SPY", "QQQ", "IWM")]
+            )
+
+    results = asyncio.run(scenario())
+
+    assert [result["id"] for result in results] == [
+        "order-SPY",
+        "order-QQQ",
+        "order-IWM",
+    ]
+
+
+def test_token_bucket_applies_backpressure() -> None:
+    now = [0.0]
+    bucket = TokenBucket(burst=2, sustained=60, clock=lambda: now[0])
+
+    assert bucket.try_acquire()
+    assert bucket.try_acquire()
+    assert not bucket.try_acquire()
+    assert bucket.delay() == pytest.approx(1.0)
+
+    now[0] += 0.5
+    bucket.reconfigure(sustained=120)
+    assert bucket.delay() == pytest.approx(0.25)
+
+
+def test_sync_client_configures_ratelimit() -> None:
+    client = AlpacaPaperEquitiesClient("key", "secret")
+    client.configure_ratelimit(burst=5, sustained=100)
+    assert client.ratelimit is not None
+    client.configure_ratelimit(sustained=50)
+    assert (client.ratelimit.burst, client.ratelimit.sustained) == (5, 50)
+
+    client.submit_order({"symbol": "SPY", "qty": 1})
+    client.get_account()
+    assert client.ratelimit.tokens == pytest.approx(3.0, abs=0.01)
@@ -0,0 +1,134 @@
+"""Tests for the market data adapters."""
+
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+
+import numpy as np
+from goldshore_market import OptionChain, SimulatedOptionsClient, SnapshotStore
+from goldshore_options import implied_volatility_batch, price_and_greeks
+
+AS_OF = date(2026, 1, 2)
+UTC = timezone.utc  # noqa: UP017 - datetime.UTC needs 3.11
+
+
+def build_chain() -> OptionChain:
+    strikes = np.tile(np.arange(80.0, 121.0, 5.0), 4)
+    expiries = np.repeat(["2026-03-20", "2026-02-20"], 18)
+    types = np.tile(np.repeat(["call", "put"], 9), 2)
+    time_to_expiry = (
+        np.asarray(expiries, dtype="datetime64[D]") - np.datetime64(AS_OF)
+    ).astype(float) / 365.0
+    prices = price_and_greeks(
+        option_type=types,
+        spot=100.0,
+        strike=strikes,
+        time_to_expiry=time_to_expiry,
+        volatility=0.25,
+        rate=0.02,
+    ).price
+    return OptionChain.from_columns(
+        "SPY",
+        strike=strikes,
+        expiry=expiries,
+        option_type=types,
+        bid=prices - 0.05,
+        ask=prices + 0.05,
+        open_interest=np.arange(strikes.size),
+    )
+
+
+def test_chain_sorts_rows_and_slices_without_copying() -> None:
+    chain = build_chain()
+
+    assert chain.expiries.tolist() == [date(2026, 2, 20), date(2026, 3, 20)]
+    assert np.all(np.diff(chain.strike[:18]) >= 0)
+
+    february = chain.for_expiry(date(2026, 2, 20))
+    assert len(february) == 18
+    assert np.shares_memory(february.strike, chain.strike)
+
+    band = february.moneyness_band(100.0, 0.9, 1.1)
+    assert band.strike.min() == 90.0
+    assert band.strike.max() == 110.0
+    assert np.shares_memory(band.bid, chain.bid)
+
+
+def test_chain_feeds_batch_iv_and_round_trips_records() -> None:
+    chain = build_chain()
+
+    result = implied_volatility_batch(
+        spot=100.0,
+        rate=0.02,
+        target_price=chain.mid,
+        keys=chain.contract_keys(),
+        **chain.pricing_inputs(AS_OF),
+    )
+    np.testing.assert_allclose(result.volatility, 0.25, rtol=1e-6)
+
+    restored = OptionChain.from_records("SPY", chain.to_records())
+    np.testing.assert_array_equal(restored.strike, chain.strike)
+    np.testing.assert_array_equal(restored.is_call, chain.is_call)
+
+
+def test_simulated_client_filters_stored_chain_by_expiry() -> None:
+    client = SimulatedOptionsClient()
+    client.set_chain(build_chain())
+
+    assert len(client.get_chain("SPY")) == 36
+    assert len(client.get_chain("SPY", expiry=date(2026, 3, 20))) == 18
+    assert len(client.get_chain("QQQ")) == 0
+
+
+def test_snapshot_store_indexes_by_symbol_and_time(tmp_path: Path) -> None:
+    chain = build_chain()
+    opened = datetime(2026, 1, 2, 14, 30, tzinfo=UTC)
+    with SnapshotStore(tmp_path) as store:
+        for minute in range(3):
+            store.append(
+                chain,
+                quote={"bid": 99.9 + minute, "ask": 100.1 + minute, "last": 100.0},
+                timestamp=opened + timedelta(minutes=minute),
+            )
+        store.append(OptionChain.empty("QQQ"), timestamp=opened)
+
+    reopened = SnapshotStore(tmp_path)
+    assert reopened.symbols() == ["QQQ", "SPY"]
+
+    latest = reopened.latest("SPY")
+    assert latest is not None
+    assert latest.quote["bid"] == 101.9
+    assert not latest.chain.strike.flags.writeable
+    np.testing.assert_array_equal(latest.chain.expiry, chain.expiry)
+    np.testing.assert_array_equal(latest.chain.is_call, chain.is_call)
+
+    midway = reopened.at("SPY", opened + timedelta(minutes=1, seconds=30))
+    assert midway is not None
+    assert midway.timestamp == opened + timedelta(minutes=1)
+    assert reopened.at("SPY", opened - timedelta(seconds=1)) is None
+    assert len(list(reopened.history("SPY", start=opened + timedelta(minutes=1)))) == 2
+
+
+def test_snapshot_store_ignores_torn_tail(tmp_path: Path) -> None:
+    with SnapshotStore(tmp_path) as store:
+        store.append(build_chain(), timestamp=datetime(2026, 1, 2, tzinfo=UTC))
+    with open(tmp_path / "chains.idx", "ab") as index:
+        index.write(b"partial")
+
+    with SnapshotStore(tmp_path) as store:
+        assert len(store) == 1
+        store.append(build_chain(), timestamp=datetime(2026, 1, 3, tzinfo=UTC))
+
+    assert len(SnapshotStore(tmp_path)) == 2
+
+
+def test_client_restores_latest_chains_from_snapshots(tmp_path: Path) -> None:
+    source = SimulatedOptionsClient()
+    source.set_chain(build_chain())
+    source.set_quote("SPY", bid=99.95, ask=100.05, last=100.0)
+    with SnapshotStore(tmp_path) as store:
+        assert source.snapshot(store) == 1
+
+    restored = SimulatedOptionsClient()
+    assert restored.restore(SnapshotStore(tmp_path)) == 1
+    assert len(restored.get_chain("SPY", expiry=date(2026, 2, 20))) == 18
+    assert restored.get_quote("SPY")["ask"] == 100.05
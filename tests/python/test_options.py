@@ -0,0 +1,229 @@
+"""Tests for the option pricing kernel and scalar wrappers."""
+
+import math
+from datetime import date
+
+import numpy as np
+from goldshore_options import (
+    IVCache,
+    SVIParameters,
+    VolSurface,
+    black_scholes_price,
+    implied_volatility,
+    implied_volatility_batch,
+    option_delta,
+    option_gamma,
+    option_theta,
+    option_vega,
+    price_and_greeks,
+)
+
+CONTRACT = {
+    "spot": 100.0,
+    "strike": 105.0,
+    "time_to_expiry": 0.5,
+    "volatility": 0.25,
+    "rate": 0.03,
+    "dividend_yield": 0.01,
+}
+
+
+def test_put_call_parity_with_dividends() -> None:
+    call = black_scholes_price(option_type="call", **CONTRACT)
+    put = black_scholes_price(option_type="put", **CONTRACT)
+    forward = 100.0 * math.exp(-0.01 * 0.5) - 105.0 * math.exp(-0.03 * 0.5)
+    assert math.isclose(call - put, forward, abs_tol=1e-10)
+
+
+def test_greeks_match_finite_differences() -> None:
+    bump = 1e-4
+
+    def price(**overrides: float) -> float:
+        return black_scholes_price(option_type="put", **{**CONTRACT, **overrides})
+
+    spot, vol, expiry = CONTRACT["spot"], CONTRACT["volatility"], 0.5
+    delta = (price(spot=spot + bump) - price(spot=spot - bump)) / (2 * bump)
+    step = 0.01
+    gamma = (price(spot=spot + step) - 2 * price() + price(spot=spot - step)) / step**2
+    vega = (price(volatility=vol + bump) - price(volatility=vol - bump)) / (2 * bump)
+    theta = -(
+        price(time_to_expiry=expiry + bump) - price(time_to_expiry=expiry - bump)
+    ) / (2 * bump)
+
+    assert math.isclose(
+        option_delta(option_type="put", **CONTRACT), delta, rel_tol=1e-6
+    )
+    assert math.isclose(option_gamma(**CONTRACT), gamma, rel_tol=1e-4)
+    assert math.isclose(option_vega(**CONTRACT), vega, rel_tol=1e-6)
+    assert math.isclose(
+        option_theta(option_type="put", **CONTRACT), theta, rel_tol=1e-6
+    )
+
+
+def test_batch_matches_scalar_wrappers_and_broadcasts() -> None:
+    rng = np.random.default_rng(7)
+    strikes = rng.uniform(60.0, 140.0, 20_000)
+    expiries = rng.uniform(0.01, 2.0, 20_000)
+    types = np.where(rng.random(20_000) < 0.5, "call", "put")
+
+    batch = price_and_greeks(
+        option_type=types,
+        spot=100.0,
+        strike=strikes,
+        time_to_expiry=expiries,
+        volatility=0.3,
+        rate=0.02,
+    )
+
+    assert batch.price.shape == (20_000,)
+    for index in (0, 9_999, 19_999):
+        expected = black_scholes_price(
+            option_type=str(types[index]),
+            spot=100.0,
+            strike=float(strikes[index]),
+            time_to_expiry=float(expiries[index]),
+            volatility=0.3,
+            rate=0.02,
+        )
+        assert math.isclose(float(batch.price[index]), expected, rel_tol=1e-12)
+
+
+def test_expired_contracts_collapse_to_intrinsic() -> None:
+    batch = price_and_greeks(
+        option_type=["call", "put", "call"],
+        spot=110.0,
+        strike=[100.0, 100.0, 120.0],
+        time_to_expiry=0.0,
+        volatility=0.2,
+        rate=0.0,
+    )
+
+    np.testing.assert_allclose(batch.price, [10.0, 0.0, 0.0])
+    np.testing.assert_allclose(batch.delta, [1.0, 0.0, 0.0])
+    np.testing.assert_allclose(batch.gamma, 0.0)
+
+
+def test_implied_volatility_round_trips_scalar_price() -> None:
+    price = black_scholes_price(option_type="put", **CONTRACT)
+    solved = implied_volatility(
+        option_type="put",
+        spot=CONTRACT["spot"],
+        strike=CONTRACT["strike"],
+        time_to_expiry=CONTRACT["time_to_expiry"],
+        rate=CONTRACT["rate"],
+        dividend_yield=CONTRACT["dividend_yield"],
+        target_price=price,
+    )
+    assert math.isclose(solved, CONTRACT["volatility"], rel_tol=1e-7)
+
+
+def test_batch_implied_volatility_flags_prices_outside_the_bracket() -> None:
+    prices = price_and_greeks(
+        option_type="call",
+        spot=100.0,
+        strike=100.0,
+        time_to_expiry=0.5,
+        volatility=[8.0, 0.2],
+        rate=0.01,
+    ).price
+
+    result = implied_volatility_batch(
+        option_type="call",
+        spot=100.0,
+        strike=100.0,
+        time_to_expiry=0.5,
+        rate=0.01,
+        target_price=prices,
+    )
+    assert result.converged.tolist() == [False, True]
+    assert math.isnan(result.volatility[0])
+    assert math.isclose(result.volatility[1], 0.2, rel_tol=1e-7)
+
+
+def test_batch_implied_volatility_handles_wings_and_warm_starts() -> None:
+    strikes = np.array([40.0, 80.0, 100.0, 120.0, 250.0, 100.0])
+    vols = np.array([0.9, 0.35, 0.2, 0.25, 1.2, 0.2])
+    types = ["put", "put", "call", "call", "call", "call"]
+    prices = price_and_greeks(
+        option_type=types,
+        spot=100.0,
+        strike=strikes,
+        time_to_expiry=0.75,
+        volatility=vols,
+        rate=0.01,
+    ).price
+    prices[-1] = 150.0  # above the spot: no volatility reproduces it
+    keys = [
+        ("SPY", float(strike), kind)
+        for strike, kind in zip(strikes, types, strict=True)
+    ]
+    cache = IVCache()
+
+    cold = implied_volatility_batch(
+        option_type=types,
+        spot=100.0,
+        strike=strikes,
+        time_to_expiry=0.75,
+        rate=0.01,
+        target_price=prices,
+        keys=keys,
+        cache=cache,
+    )
+    warm = implied_volatility_batch(
+        option_type=types,
+        spot=100.0,
+        strike=strikes,
+        time_to_expiry=0.75,
+        rate=0.01,
+        target_price=prices,
+        keys=keys,
+        cache=cache,
+    )
+
+    np.testing.assert_allclose(cold.volatility[:-1], vols[:-1], rtol=1e-6)
+    assert np.isnan(cold.volatility[-1])
+    assert cold.failures == 1
+    assert len(cache) == len(strikes) - 1
+    assert warm.iterations[:-1].max() == 1
+
+
+def test_vol_surface_refits_only_dirty_expiries() -> None:
+    smile = SVIParameters(a=0.02, b=0.1, rho=-0.4, m=0.05, sigma=0.2)
+    moneyness = np.linspace(-0.5, 0.4, 25)
+    surface = VolSurface(spot=100.0, as_of=date(2026, 1, 2))
+    near, far = date(2026, 2, 2), date(2026, 7, 2)
+    for expiry in (near, far):
+        t = float(surface.time_to_expiry(expiry))
+        vols = np.sqrt(smile.total_variance(moneyness) / t)
+        surface.update_quotes(expiry, 100.0 * np.exp(moneyness), vols)
+
+    assert surface.refit() == [np.datetime64(near), np.datetime64(far)]
+    fitted = surface.fits[np.datetime64(far)].parameters
+    assert fitted is not None
+    assert math.isclose(fitted.rho, smile.rho, abs_tol=0.02)
+
+    untouched = surface.fits[np.datetime64(far)]
+    surface.update_quote(near, 100.0, 0.9)
+    surface.vol(100.0, near)
+    assert surface.fits[np.datetime64(far)] is untouched
+
+    t_far = float(surface.time_to_expiry(far))
+    atm = surface.vol([100.0, 100.0], [far, date(2026, 4, 2)])
+    assert math.isclose(
+        atm[0], math.sqrt(float(smile.total_variance(0.0)) / t_far), rel_tol=1e-3
+    )
+    assert np.all(np.isfinite(atm))
+
+
+def test_vol_surface_is_sticky_strike_between_refits() -> None:
+    surface = VolSurface(spot=100.0, as_of=date(2026, 1, 2), rate=0.03)
+    expiry = date(2026, 7, 2)
+    surface.update_quotes(expiry, [90.0, 100.0, 110.0], [0.3, 0.22, 0.26])
+    before = surface.vol([90.0, 100.0, 105.0], expiry)
+
+    surface.spot = 110.0
+    np.testing.assert_allclose(surface.vol([90.0, 100.0, 105.0], expiry), before)
+
+    surface.update_quote(expiry, 120.0, 0.3)
+    surface.refit()
+    assert surface.fits[np.datetime64(expiry)].forward > 110.0
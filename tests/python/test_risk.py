@@ -0,0 +1,107 @@
+"""Tests for the incremental risk engine."""
+
+import numpy as np
+import pytest
+from goldshore_options import price_and_greeks
+from goldshore_risk import (
+    DrawdownPolicy,
+    PortfolioPositions,
+    PositionLimitPolicy,
+    RiskEngine,
+    ScenarioEngine,
+    Scenarios,
+    VolatilityPolicy,
+)
+
+
+def test_engine_aggregates_match_full_recompute() -> None:
+    engine = RiskEngine(cash=10_000.0)
+    engine.on_fill("AAPL", quantity=10, price=100.0)
+    engine.on_fill("MSFT", quantity=-5, price=200.0)
+    engine.mark("AAPL", 110.0)
+    engine.on_order("o-1", symbol="AAPL", quantity=5, price=110.0)
+    engine.on_fill("AAPL", quantity=2, price=110.0, order_id="o-1")
+
+    incremental = engine.snapshot()
+    engine.recompute()
+    assert engine.snapshot() == pytest.approx(incremental)
+    assert incremental.gross_exposure == pytest.approx(12 * 110.0 + 1_000.0)
+    assert incremental.net_exposure == pytest.approx(12 * 110.0 - 1_000.0)
+    assert incremental.open_risk == pytest.approx(3 * 110.0)
+    assert engine.peak_equity == pytest.approx(10_100.0)
+
+    engine.on_order_closed("o-1")
+    assert engine.open_risk == pytest.approx(0.0)
+
+
+def test_engine_check_reports_every_breached_policy() -> None:
+    engine = RiskEngine(
+        cash=1_000.0,
+        volatility=0.6,
+        policies=[
+            PositionLimitPolicy(max_notional=1_000.0),
+            DrawdownPolicy(max_drawdown=0.2),
+            VolatilityPolicy(max_volatility=0.5),
+        ],
+    )
+    engine.on_fill("AAPL", quantity=5, price=100.0)
+    engine.on_order("o-1", symbol="AAPL", quantity=3, price=100.0)
+
+    decision = engine.check("AAPL", quantity=3)
+    assert decision.proposed_notional == pytest.approx(1_100.0)
+    assert decision.breaches == ("PositionLimitPolicy", "VolatilityPolicy")
+
+    engine.set_volatility(0.2)
+    engine.mark("AAPL", 40.0)
+    assert engine.check("AAPL", quantity=-5).breaches == ("DrawdownPolicy",)
+    assert engine.check("TSLA", quantity=1).breaches == ("NoReferencePrice",)
+
+
+def test_scenario_engine_linear_positions_match_closed_form() -> None:
+    positions = PortfolioPositions.from_columns(quantity=[10, -4], spot=[100, 50])
+    returns = np.linspace(-0.05, 0.05, 101)
+    result = ScenarioEngine(positions).run(Scenarios.historical(returns))
+
+    assert result.base_value == pytest.approx(800.0)
+    np.testing.assert_allclose(result.pnl, 800.0 * returns, atol=1e-9)
+    assert result.var(0.95) == pytest.approx(-np.quantile(800.0 * returns, 0.05))
+    assert result.expected_shortfall(0.95) >= result.var(0.95)
+    assert result.parametric_var(0.95) == pytest.approx(
+        1.6448536 * np.std(800.0 * returns), rel=1e-6
+    )
+    assert result.stress_drawdown() == pytest.approx(0.05)
+
+
+def test_scenario_engine_chunks_and_pool_agree_with_direct_pricing() -> None:
+    positions = PortfolioPositions.from_columns(
+        quantity=[2, -1, 50],
+        spot=[100, 100, 100],
+        strike=[95, 105, np.nan],
+        time_to_expiry=[0.5, 0.25, 0.0],
+        volatility=[0.2, 0.25, 0.0],
+        option_type=["call", "put", "call"],
+        is_option=[True, True, False],
+        multiplier=[100, 100, 1],
+        rate=0.01,
+    )
+    scenarios = Scenarios.grid(
+        spot=[-0.1, 0.0, 0.1], volatility=[-0.05, 0.05], rate=[0.0, 0.01]
+    )
+    assert len(scenarios) == 12
+
+    whole = ScenarioEngine(positions).run(scenarios)
+    chunked = ScenarioEngine(positions, chunk_cells=4).run(scenarios)
+    pooled = ScenarioEngine(positions, chunk_cells=9, workers=2).run(scenarios)
+    np.testing.assert_allclose(chunked.pnl, whole.pnl)
+    np.testing.assert_allclose(pooled.pnl, whole.pnl)
+
+    shocked = price_and_greeks(
+        option_type=["call", "put"],
+        spot=90.0,
+        strike=[95.0, 105.0],
+        time_to_expiry=[0.5, 0.25],
+        volatility=[0.15, 0.2],
+        rate=0.01,
+    ).price
+    expected = 200 * shocked[0] - 100 * shocked[1] + 50 * 90.0
+    assert whole.pnl[0] == pytest.approx(expected - whole.base_value)
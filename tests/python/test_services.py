@@ -1,12 +1,34 @@
 """Smoke tests for the FastAPI service factories."""
 
+import asyncio
+import json
+import time
+from datetime import date, datetime, timezone
+
+import pytest
+import httpx
 from fastapi.testclient import TestClient
+from goldshore_options import VolSurface
+from goldshore_risk import PositionLimitPolicy
 
 from planner.main import create_app as create_planner_app
+from planner.clients import HttpExecutorClient, HttpMarketDataClient
+from planner.compiler import PlanCompiler
+from planner.plans import PlanStore, _select
 from executor.main import create_app as create_executor_app
+from executor.orders import Order, OrderStore
+from marketdata.cache import TTLCache
+from marketdata.main import _price_contracts
 from marketdata.main import create_app as create_marketdata_app
+from marketdata.streaming import QuoteHub, StreamedContract
+from notifier.delivery import DeliveryQueue, MemoryTransport, WebhookTransport
 from notifier.main import create_app as create_notifier_app
+from evaluator.analytics import analyze_fills
+from evaluator.cache import ResultCache
 from evaluator.main import create_app as create_evaluator_app
+from launcher.main import create_app as create_launcher_app
+
+UTC = timezone.utc  # noqa: UP017 - datetime.UTC needs 3.11
 
 
 def test_planner_health() -> None:
@@ -16,25 +38,920 @@ def test_planner_health() -> None:
     assert response.json()["status"] == "ok"
 
 
+def _plan(symbol: str, index: int) -> dict[str, object]:
+    return {
+        "name": f"Plan {index}",
+        "rationale": "Test",
+        "target_symbol": symbol,
+        "notional": 1000.0 * index,
+    }
+
+
+def test_planner_lists_plans_with_filters_and_cursors(monkeypatch, tmp_path) -> None:
+    monkeypatch.setenv("PLANNER_DB_PATH", str(tmp_path / "plans.db"))
+    with TestClient(create_planner_app()) as client:
+        created = [
+            client.post("/planner/plans", json=_plan(symbol, index)).json()
+            for index, symbol in enumerate(["SPY", "QQQ"] * 5)
+        ]
+        assert all(plan["status"] == "pending" for plan in created)
+        approved = client.post(f"/planner/plans/{created[0]['id']}/approve")
+        assert approved.json()["details"]["approved_by"] == "system"
+        assert (
+            client.post(f"/planner/plans/{created[0]['id']}/approve").status_code == 409
+        )
+
+        first = client.get(
+            "/planner/plans", params={"target_symbol": "SPY", "limit": 2}
+        )
+        cursor = first.headers["X-Next-Cursor"]
+        second = client.get(
+            "/planner/plans",
+            params={"target_symbol": "SPY", "limit": 2, "cursor": cursor},
+        )
+        last = client.get(
+            "/planner/plans",
+            params={
+                "target_symbol": "SPY",
+                "limit": 2,
+                "cursor": second.headers["X-Next-Cursor"],
+            },
+        )
+        assert "X-Next-Cursor" not in last.headers
+        ids = [plan["id"] for page in (first, second, last) for plan in page.json()]
+        assert ids == [plan["id"] for plan in created[-2::-2]]
+
+        approved_only = client.get(
+            "/planner/plans", params={"status": "approved"}
+        ).json()
+        assert [plan["id"] for plan in approved_only] == [created[0]["id"]]
+        bad = client.get("/planner/plans", params={"cursor": "!!"})
+        assert bad.status_code == 422
+
+    with TestClient(create_planner_app()) as restarted:
+        fetched = restarted.get(f"/planner/plans/{created[0]['id']}").json()
+        assert fetched["status"] == "approved"
+        assert len(restarted.get("/planner/plans").json()) == 10
+        assert restarted.get("/planner/plans/plan-missing").status_code == 404
+
+
+def test_plan_store_filters_by_creation_time() -> None:
+    store = PlanStore()
+    early = store.create(**_plan("SPY", 1))
+    late = store.create(**_plan("SPY", 2))
+    page, cursor = store.query(created_after=late.created_at)
+    assert cursor is None
+    assert page[-1] is not early
+    assert late in page
+    assert store.query(created_before=early.created_at) == ([], None)
+
+
+@pytest.mark.parametrize(
+    "filters",
+    [
+        {},
+        {"status": "pending"},
+        {"target_symbol": "SPY"},
+        {"created_after": datetime(2026, 1, 1, tzinfo=UTC)},
+        {
+            "status": "pending",
+            "created_after": datetime(2026, 1, 1, tzinfo=UTC),
+            "created_before": datetime(2026, 2, 1, tzinfo=UTC),
+        },
+    ],
+)
+def test_plan_store_queries_scan_an_index_without_sorting(filters) -> None:
+    store = PlanStore()
+    for index in range(3):
+        store.create(**_plan("SPY", index))
+    _, cursor = store.query(limit=1)
+    query = {
+        "status": None,
+        "target_symbol": None,
+        "created_after": None,
+        "created_before": None,
+        **filters,
+        "cursor": cursor,
+    }
+    sql, parameters = _select(**query)
+    steps = [
+        row[-1]
+        for row in store._db.execute(f"EXPLAIN QUERY PLAN {sql}", (*parameters, 1))
+    ]
+    assert all("USING INDEX" in step for step in steps), steps
+    assert not any("TEMP B-TREE" in step for step in steps), steps
+
+
+class FakeMarketData:
+    def __init__(self, quotes: dict[str, dict[str, float]]) -> None:
+        self.quotes_by_symbol = quotes
+        self.calls: list[list[str]] = []
+
+    async def quotes(self, symbols: list[str]) -> dict[str, dict[str, float]]:
+        self.calls.append(list(symbols))
+        return {symbol: self.quotes_by_symbol.get(symbol, {}) for symbol in symbols}
+
+
+class FakeExecutor:
+    def __init__(self) -> None:
+        self.batches: list[list[dict[str, object]]] = []
+
+    async def submit_orders(
+        self, orders: list[dict[str, object]]
+    ) -> list[dict[str, object]]:
+        self.batches.append(list(orders))
+        return [
+            {"order_id": f"ord-{index}", "detail": None}
+            for index, _ in enumerate(orders)
+        ]
+
+
+def _wait_for_plans(client: TestClient, ids: list[str]) -> list[dict[str, object]]:
+    for _ in range(200):
+        plans = [client.get(f"/planner/plans/{plan_id}").json() for plan_id in ids]
+        if all(plan["status"] != "compiling" for plan in plans):
+            return plans
+        time.sleep(0.01)
+    raise AssertionError("plans were not compiled")
+
+
+def test_planner_compiles_approved_plans_in_one_batch(monkeypatch) -> None:
+    monkeypatch.setenv("PLANNER_COMPILE_WINDOW", "0.2")
+    monkeypatch.setenv("PLANNER_MAX_NOTIONAL", "5000")
+    marketdata = FakeMarketData({"SPY": {"bid": 99.0, "ask": 101.0, "last": 100.0}})
+    executor = FakeExecutor()
+    app = create_planner_app(marketdata=marketdata, executor=executor)
+    with TestClient(app) as client:
+        ids = [
+            client.post("/planner/plans", json=_plan(symbol, 1)).json()["id"]
+            for symbol in ("SPY", "QQQ")
+        ]
+        ids.append(
+            client.post(
+                "/planner/plans", json=dict(_plan("SPY", 1), notional=9000.0)
+            ).json()["id"]
+        )
+        ids.append(
+            client.post(
+                "/planner/plans", json=dict(_plan("SPY", 1), notional=-50.0)
+            ).json()["id"]
+        )
+        statuses = [
+            client.post(f"/planner/plans/{plan_id}/approve").json()["status"]
+            for plan_id in ids
+        ]
+        assert statuses == ["compiling"] * 4
+        spy, qqq, large, small = _wait_for_plans(client, ids)
+
+    assert marketdata.calls == [["QQQ", "SPY"]]
+    assert executor.batches == [
+        [
+            {
+                "symbol": "SPY",
+                "side": "buy",
+                "quantity": 10.0,
+                "price": 100.0,
+                "client_order_id": ids[0],
+            }
+        ]
+    ]
+    assert spy["status"] == "submitted"
+    assert spy["details"]["order_id"] == "ord-0"
+    assert qqq["details"]["detail"] == "No reference price"
+    assert large["details"]["detail"] == "Risk check failed: PositionLimitPolicy"
+    assert small["details"]["detail"] == "Notional is below one share"
+    assert {plan["status"] for plan in (qqq, large, small)} == {"rejected"}
+
+
+def test_plan_compiler_uses_batch_service_endpoints() -> None:
+    marketdata_app = create_marketdata_app()
+    marketdata_app.state.options_client.set_quote(
+        "SPY", bid=99.0, ask=101.0, last=100.0
+    )
+    executor_app = create_executor_app(broker=RecordingBroker())
+    store = PlanStore()
+    plans = [store.create(**_plan("SPY", index)) for index in (1, 2)]
+
+    async def scenario() -> None:
+        async with executor_app.router.lifespan_context(executor_app):
+            compiler = PlanCompiler(
+                plans=store,
+                marketdata=HttpMarketDataClient(
+                    base_url="http://marketdata",
+                    transport=httpx.ASGITransport(app=marketdata_app),
+                ),
+                executor=HttpExecutorClient(
+                    base_url="http://executor",
+                    transport=httpx.ASGITransport(app=executor_app),
+                ),
+                policies=[PositionLimitPolicy(max_notional=1_000_000.0)],
+                window=0.01,
+                workers=2,
+            )
+            await compiler.start()
+            for plan in plans:
+                store.update(plan.plan_id, status="approved")
+                compiler.enqueue(plan.plan_id)
+            await compiler.stop()
+            await compiler.marketdata.aclose()
+            await compiler.executor.aclose()
+
+    asyncio.run(scenario())
+    assert [plan.status for plan in plans] == ["submitted", "submitted"]
+    orders = [executor_app.state.pipeline.get(plan.order_id) for plan in plans]
+    assert [order.client_order_id for order in orders] == [
+        plan.plan_id for plan in plans
+    ]
+    assert [order.quantity for order in orders] == [10.0, 20.0]
+
+
 def test_executor_health() -> None:
     client = TestClient(create_executor_app())
     response = client.get("/executor/health")
     assert response.status_code == 200
 
 
+class RecordingBroker:
+    def __init__(self) -> None:
+        self.payloads: list[dict[str, object]] = []
+
+    def submit_order(self, payload: dict[str, object]) -> dict[str, object]:
+        self.payloads.append(payload)
+        return {"id": f"broker-{len(self.payloads)}"}
+
+
+class FlakyBroker(RecordingBroker):
+    def submit_order(self, payload: dict[str, object]) -> dict[str, object]:
+        if payload["symbol"] == "QQQ":
+            raise RuntimeError("boom")
+        return super().submit_order(payload)
+
+
+def _wait_for_status(client: TestClient, order_id: str) -> dict[str, object]:
+    for _ in range(200):
+        body = client.get(f"/executor/orders/{order_id}").json()
+        if body["status"] != "queued":
+            return body
+        time.sleep(0.01)
+    raise AssertionError(f"Order {order_id} never left the queue")
+
+
+def test_executor_nets_orders_within_window(monkeypatch) -> None:
+    monkeypatch.setenv("EXECUTOR_NETTING_WINDOW", "0.2")
+    broker = RecordingBroker()
+    with TestClient(create_executor_app(broker=broker)) as client:
+        orders = [
+            {"symbol": "AAPL", "side": "buy", "quantity": 10},
+            {"symbol": "AAPL", "side": "sell", "quantity": 10},
+            {"symbol": "MSFT", "side": "buy", "quantity": 5},
+            {"symbol": "MSFT", "side": "sell", "quantity": 2},
+            {"symbol": "QQQ", "side": "buy", "quantity": 0.1},
+            {"symbol": "QQQ", "side": "buy", "quantity": 0.2},
+            {"symbol": "QQQ", "side": "sell", "quantity": 0.3},
+        ]
+        handles = [
+            client.post("/executor/orders/submit", json=order).json()
+            for order in orders
+        ]
+        assert {handle["status"] for handle in handles} == {"queued"}
+        statuses = [_wait_for_status(client, h["order_id"]) for h in handles]
+
+    assert [status["status"] for status in statuses] == [
+        "netted",
+        "netted",
+        "submitted",
+        "submitted",
+        "netted",
+        "netted",
+        "netted",
+    ]
+    assert statuses[2]["broker_order_id"] == "broker-1"
+    assert len(broker.payloads) == 1
+    assert broker.payloads[0]["symbol"] == "MSFT"
+    assert broker.payloads[0]["side"] == "buy"
+    assert broker.payloads[0]["qty"] == 3
+
+
+def test_executor_rejects_only_the_failed_child_order(monkeypatch) -> None:
+    monkeypatch.setenv("EXECUTOR_NETTING_WINDOW", "0.2")
+    broker = FlakyBroker()
+    with TestClient(create_executor_app(broker=broker)) as client:
+        handles = [
+            client.post(
+                "/executor/orders/submit",
+                json={"symbol": symbol, "side": "buy", "quantity": 1},
+            ).json()
+            for symbol in ("SPY", "QQQ")
+        ]
+        spy, qqq = [_wait_for_status(client, h["order_id"]) for h in handles]
+
+    assert (spy["status"], spy["broker_order_id"]) == ("submitted", "broker-1")
+    assert (qqq["status"], qqq["detail"]) == ("rejected", "boom")
+
+
+def test_executor_cancels_queued_orders(monkeypatch) -> None:
+    monkeypatch.setenv("EXECUTOR_NETTING_WINDOW", "5")
+    broker = RecordingBroker()
+    with TestClient(create_executor_app(broker=broker)) as client:
+        handle = client.post(
+            "/executor/orders/submit",
+            json={"symbol": "AAPL", "side": "buy", "quantity": 1},
+        ).json()
+        response = client.post(
+            "/executor/orders/cancel", json={"order_id": handle["order_id"]}
+        )
+        assert response.json()["status"] == "cancelled"
+        assert client.get("/executor/orders/missing").status_code == 404
+    assert broker.payloads == []
+
+
+def test_executor_lists_orders_with_negotiated_encoding(monkeypatch) -> None:
+    monkeypatch.setenv("EXECUTOR_NETTING_WINDOW", "5")
+    with TestClient(create_executor_app(broker=RecordingBroker())) as client:
+        handle = client.post(
+            "/executor/orders/submit",
+            json={"symbol": "AAPL", "side": "buy", "quantity": 2},
+        ).json()
+        response = client.get(
+            "/executor/orders",
+            params={"symbol": "AAPL"},
+            headers={"Accept": "text/html, */*;q=0.1"},
+        )
+    assert response.headers["content-type"] == "application/json"
+    assert response.headers["vary"] == "Accept"
+    [order] = response.json()
+    assert order["order_id"] == handle["order_id"]
+    assert order["quantity"] == 2.0
+
+
+def test_executor_rejects_orders_failing_risk_checks(monkeypatch) -> None:
+    monkeypatch.setenv("EXECUTOR_MAX_NOTIONAL", "1000")
+    broker = RecordingBroker()
+    with TestClient(create_executor_app(broker=broker)) as client:
+        accepted = client.post(
+            "/executor/orders/submit",
+            json={"symbol": "AAPL", "side": "buy", "quantity": 5, "price": 100},
+        ).json()
+        rejected = client.post(
+            "/executor/orders/submit",
+            json={"symbol": "AAPL", "side": "buy", "quantity": 6, "price": 100},
+        ).json()
+    assert accepted["status"] == "queued"
+    assert rejected["status"] == "rejected"
+    assert rejected["detail"] == "Risk check failed: PositionLimitPolicy"
+    assert [payload["qty"] for payload in broker.payloads] == [5]
+
+
+def test_executor_moves_submitted_orders_out_of_open_risk(monkeypatch) -> None:
+    monkeypatch.setenv("EXECUTOR_MAX_NOTIONAL", "10000")
+    monkeypatch.setenv("EXECUTOR_NETTING_WINDOW", "0.01")
+    broker = RecordingBroker()
+    app = create_executor_app(broker=broker)
+    with TestClient(app) as client:
+        statuses = []
+        for side in ("buy", "sell", "buy", "sell", "buy"):
+            order = client.post(
+                "/executor/orders/submit",
+                json={"symbol": "SPY", "side": side, "quantity": 80, "price": 100},
+            ).json()
+            statuses.append(_wait_for_status(client, order["order_id"])["status"])
+        over_limit = client.post(
+            "/executor/orders/submit",
+            json={"symbol": "SPY", "side": "buy", "quantity": 30, "price": 100},
+        ).json()
+
+    engine = app.state.pipeline.risk
+    assert statuses == ["submitted"] * 5
+    assert over_limit["status"] == "rejected"
+    assert len(broker.payloads) == 5
+    assert engine.quantities["SPY"] == 80.0
+    assert engine.open_risk == 0.0
+    assert engine.snapshot().net_exposure == 8000.0
+
+
+def test_order_store_recovers_from_checkpoint_and_journal(tmp_path) -> None:
+    with OrderStore(tmp_path, checkpoint_interval=3) as store:
+        for index in range(4):
+            store.add(
+                Order(
+                    order_id=f"o-{index}",
+                    symbol="AAPL" if index % 2 else "MSFT",
+                    side="buy",
+                    quantity=1.0,
+                    client_order_id=f"c-{index}",
+                )
+            )
+        store.update("o-1", status="submitted", broker_order_id="b-1")
+    with open(tmp_path / "orders.journal", "a", encoding="utf-8") as journal:
+        journal.write('{"seq": 99, "order": {"order_id"')
+
+    recovered = OrderStore(tmp_path)
+    assert len(recovered) == 4
+    assert recovered.seq == 5
+    assert recovered.get_by_client_order_id("c-1").broker_order_id == "b-1"
+    assert [order.order_id for order in recovered.for_symbol("AAPL")] == [
+        "o-1",
+        "o-3",
+    ]
+    assert [order.order_id for order in recovered.with_status("queued")] == [
+        "o-0",
+        "o-2",
+        "o-3",
+    ]
+    recovered.update("o-0", status="cancelled")
+    recovered.close()
+    assert OrderStore(tmp_path).get("o-0").status == "cancelled"
+
+
 def test_marketdata_health() -> None:
     client = TestClient(create_marketdata_app())
     response = client.get("/marketdata/health")
     assert response.status_code == 200
 
 
+def test_marketdata_greeks_read_from_surface() -> None:
+    app = create_marketdata_app()
+    surface = VolSurface(spot=100.0, as_of=date(2026, 1, 2))
+    surface.update_quotes(date(2026, 7, 2), [90.0, 100.0, 110.0], [0.3, 0.25, 0.28])
+    app.state.options_client.set_surface("SPY", surface)
+    client = TestClient(app)
+
+    response = client.get(
+        "/marketdata/greeks/SPY",
+        params={"strike": 100.0, "expiry": "2026-07-02", "option_type": "put"},
+    )
+    assert response.status_code == 200
+    body = response.json()
+    assert body["symbol"] == "SPY"
+    assert -1.0 < body["delta"] < 0.0
+    assert body["vega"] > 0.0
+
+    expired = client.get(
+        "/marketdata/greeks/SPY", params={"strike": 100.0, "expiry": "2026-01-02"}
+    )
+    assert expired.status_code == 422
+
+
+def test_marketdata_metrics_time_routes_and_pricing() -> None:
+    app = create_marketdata_app()
+    surface = VolSurface(spot=100.0, as_of=date(2026, 1, 2))
+    surface.update_quotes(date(2026, 7, 2), [90.0, 100.0, 110.0], [0.3, 0.25, 0.28])
+    app.state.options_client.set_surface("SPY", surface)
+    client = TestClient(app)
+    client.get(
+        "/marketdata/greeks/SPY", params={"strike": 100.0, "expiry": "2026-07-02"}
+    )
+
+    response = client.get("/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    assert (
+        'goldshore_http_request_seconds_count{method="GET",'
+        'route="/marketdata/greeks/{symbol}",status="200"}'
+    ) in response.text
+    assert "# TYPE goldshore_options_price_seconds histogram" in response.text
+    assert "/metrics" not in client.get("/openapi.json").json()["paths"]
+
+
+def test_marketdata_restores_snapshots_on_start(tmp_path, monkeypatch) -> None:
+    monkeypatch.setenv("MARKETDATA_SNAPSHOT_DIR", str(tmp_path))
+    with TestClient(create_marketdata_app()) as client:
+        client.app.state.options_client.set_quote("SPY", bid=1.0, ask=2.0, last=1.5)
+
+    restarted = TestClient(create_marketdata_app())
+    response = restarted.get("/marketdata/quotes/SPY")
+    assert response.status_code == 200
+    assert response.json() == {"symbol": "SPY", "bid": 1.0, "ask": 2.0, "last": 1.5}
+
+
+def test_ttl_cache_coalesces_concurrent_misses() -> None:
+    calls = 0
+
+    async def fetch() -> dict[str, float]:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return {"bid": 1.0}
+
+    async def burst() -> list[dict[str, float]]:
+        cache: TTLCache[dict[str, float]] = TTLCache(ttl=60.0)
+        results = await asyncio.gather(*(cache.get("SPY", fetch) for _ in range(200)))
+        assert cache.stats.misses == 1
+        assert cache.stats.coalesced == 199
+        return results
+
+    results = asyncio.run(burst())
+    assert calls == 1
+    assert all(result == {"bid": 1.0} for result in results)
+
+
+def test_ttl_cache_expires_and_evicts_least_recently_used() -> None:
+    now = 0.0
+    cache: TTLCache[str] = TTLCache(ttl=1.0, max_entries=2, clock=lambda: now)
+
+    async def value(text: str) -> str:
+        return text
+
+    async def scenario() -> None:
+        nonlocal now
+        assert await cache.get("a", lambda: value("a1")) == "a1"
+        assert await cache.get("a", lambda: value("a2")) == "a1"
+        now = 2.0
+        assert await cache.get("a", lambda: value("a3")) == "a3"
+        await cache.get("b", lambda: value("b"))
+        await cache.get("a", lambda: value("unused"))
+        await cache.get("c", lambda: value("c"))
+        assert len(cache) == 2
+        assert await cache.get("b", lambda: value("b2")) == "b2"
+
+    asyncio.run(scenario())
+    assert cache.stats.expirations == 1
+    assert cache.stats.evictions == 2
+
+
+def test_marketdata_serves_quotes_from_cache(monkeypatch) -> None:
+    monkeypatch.setenv("MARKETDATA_QUOTE_TTL_MS", "60000")
+    app = create_marketdata_app()
+    app.state.options_client.set_quote("SPY", bid=1.0, ask=2.0, last=1.5)
+    client = TestClient(app)
+
+    assert client.get("/marketdata/quotes/SPY").json()["bid"] == 1.0
+    app.state.options_client.set_quote("SPY", bid=3.0, ask=4.0, last=3.5)
+    assert client.get("/marketdata/quotes/SPY").json()["bid"] == 1.0
+    assert client.get("/marketdata/options/SPY").json() == []
+    stats = client.get("/marketdata/cache").json()
+    assert stats["quotes"]["hits"] == 1
+    assert stats["quotes"]["misses"] == 1
+    assert stats["chains"]["misses"] == 1
+
+
+def test_quote_hub_sends_deltas_and_conflates_slow_subscribers() -> None:
+    async def scenario() -> None:
+        hub = QuoteHub()
+        fast = hub.subscribe(["SPY"])
+        slow = hub.subscribe(["SPY", "QQQ"])
+        fast_frames = fast.frames()
+
+        first = hub.publish("SPY", {"bid": 1.0, "ask": 2.0})
+        assert hub.publish("SPY", {"bid": 1.0, "ask": 2.0}) is None
+        assert await anext(fast_frames) == first.full
+        second = hub.publish("SPY", {"bid": 1.5, "ask": 2.0})
+        assert (
+            second.delta
+            == b'event: delta\ndata: {"symbol":"SPY","seq":2,"bid":1.5}\n\n'
+        )
+        assert await anext(fast_frames) == second.delta
+
+        hub.close()
+        slow_frames = [frame async for frame in slow.frames()]
+        assert slow_frames == [second.full]
+        assert slow.conflated == 1
+        assert hub.symbols() == ["SPY"]
+        assert [frame async for frame in fast_frames] == []
+        assert hub.symbols() == []
+
+    asyncio.run(scenario())
+
+
+def test_marketdata_streams_quote_snapshots() -> None:
+    with TestClient(create_marketdata_app()) as client:
+        app = client.app
+        app.state.options_client.set_quote("SPY", bid=1.0, ask=2.0, last=1.5)
+        app.state.hub.publish("SPY", app.state.options_client.get_quote("SPY"))
+        app.state.hub.close()
+        response = client.get("/marketdata/stream", params={"symbols": "SPY,QQQ"})
+        assert response.headers["content-type"].startswith("text/event-stream")
+        assert response.text == (
+            "event: snapshot\n"
+            'data: {"symbol":"SPY","seq":1,"bid":1.0,"ask":2.0,"last":1.5}\n\n'
+        )
+        assert (
+            client.get("/marketdata/stream", params={"symbols": ","}).status_code == 422
+        )
+
+
+def test_marketdata_streams_greeks_for_subscribed_contracts() -> None:
+    with TestClient(create_marketdata_app()) as client:
+        app = client.app
+        surface = VolSurface(spot=100.0, as_of=date(2026, 1, 2))
+        surface.update_quotes(date(2026, 7, 2), [90.0, 110.0], [0.3, 0.28])
+        app.state.options_client.set_surface("SPY", surface)
+        contract = StreamedContract.parse("SPY:2026-07-02:100.0:call")
+        greeks = _price_contracts(app.state.options_client, [contract])
+        app.state.hub.publish(contract.key, greeks[contract.key])
+        app.state.hub.close()
+        response = client.get(
+            "/marketdata/stream", params={"contracts": "SPY:2026-07-02:100:call"}
+        )
+        single = client.get(
+            "/marketdata/greeks/SPY",
+            params={"strike": 100.0, "expiry": "2026-07-02", "option_type": "call"},
+        ).json()
+        event, data = response.text.strip().split("\n")
+        assert event == "event: snapshot"
+        payload = json.loads(data.removeprefix("data: "))
+        assert payload["symbol"] == "SPY:2026-07-02:100:call"
+        for name in ("delta", "gamma", "theta", "vega", "rho"):
+            assert payload[name] == pytest.approx(single[name])
+        for contracts in ("SPY:2026-07-02:100", "SPY:2026-07-02:100:straddle"):
+            response = client.get("/marketdata/stream", params={"contracts": contracts})
+            assert response.status_code == 422
+
+
+def test_marketdata_batch_greeks_match_single_contract_route() -> None:
+    app = create_marketdata_app()
+    surface = VolSurface(spot=100.0, as_of=date(2026, 1, 2))
+    surface.update_quotes(date(2026, 7, 2), [90.0, 100.0, 110.0], [0.3, 0.25, 0.28])
+    app.state.options_client.set_surface("SPY", surface)
+    client = TestClient(app)
+    contracts = [
+        {
+            "symbol": symbol,
+            "strike": strike,
+            "expiry": "2026-07-02",
+            "option_type": kind,
+        }
+        for strike in (90.0, 100.0, 110.0)
+        for symbol, kind in (("SPY", "put"), ("QQQ", "call"), ("SPY", "call"))
+    ]
+
+    response = client.post("/marketdata/greeks/batch", json={"contracts": contracts})
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    rows = [json.loads(line) for line in response.text.splitlines()]
+    assert [(row["symbol"], row["strike"]) for row in rows] == [
+        (contract["symbol"], contract["strike"]) for contract in contracts
+    ]
+    for contract, row in zip(contracts, rows, strict=True):
+        single = client.get(
+            f"/marketdata/greeks/{contract['symbol']}",
+            params={key: contract[key] for key in ("strike", "expiry", "option_type")},
+        ).json()
+        assert row["delta"] == pytest.approx(single["delta"])
+        assert row["vega"] == pytest.approx(single["vega"])
+
+    expired = dict(contracts[0], expiry="2025-01-02")
+    assert (
+        client.post(
+            "/marketdata/greeks/batch", json={"contracts": [expired]}
+        ).status_code
+        == 422
+    )
+
+
+def test_marketdata_batch_quotes_stream_ndjson() -> None:
+    app = create_marketdata_app()
+    app.state.options_client.set_quote("SPY", bid=1.0, ask=2.0, last=1.5)
+    response = TestClient(app).post(
+        "/marketdata/quotes/batch", json={"symbols": ["SPY", "QQQ"]}
+    )
+    assert response.status_code == 200
+    assert response.text == (
+        '{"symbol":"SPY","bid":1.0,"ask":2.0,"last":1.5}\n'
+        '{"symbol":"QQQ","bid":0.0,"ask":0.0,"last":0.0}\n'
+    )
+
+
 def test_notifier_health() -> None:
     client = TestClient(create_notifier_app())
     response = client.get("/notifier/health")
     assert response.status_code == 200
 
 
+def test_notifier_delivers_and_deduplicates_alerts() -> None:
+    transport = MemoryTransport()
+    with TestClient(create_notifier_app(transport=transport)) as client:
+        payload = {"channel": "ops", "subject": "Feed down", "body": "Quotes stale"}
+        first = client.post("/notifier/alerts", json=payload)
+        repeat = client.post("/notifier/alerts", json=payload)
+        assert first.status_code == 202
+        assert repeat.json()["status"] == "deduplicated"
+        assert repeat.json()["duplicate_of"] == first.json()["id"]
+    assert list(transport.sent) == [("ops", "Feed down", "Quotes stale")]
+    alert = client.app.state.delivery.get(first.json()["id"])
+    assert alert.status == "delivered"
+
+
+def test_delivery_queue_digests_flooded_channel() -> None:
+    class SlowTransport(MemoryTransport):
+        async def send(self, channel: str, *, subject: str, body: str) -> None:
+            await asyncio.sleep(0.01)
+            await super().send(channel, subject=subject, body=body)
+
+    async def scenario() -> tuple[DeliveryQueue, list, list]:
+        transport = SlowTransport()
+        delivery = DeliveryQueue(
+            transport=transport, queue_size=2, workers=1, digest_subjects=3
+        )
+        await delivery.start()
+        alerts = [
+            delivery.submit("pager", subject=f"Breach {index}", body="")
+            for index in range(10)
+        ]
+        await delivery.stop()
+        return delivery, alerts, list(transport.sent)
+
+    delivery, alerts, sent = asyncio.run(scenario())
+    assert [alert.status for alert in alerts] == ["delivered"] * 2 + ["digested"] * 8
+    assert len(sent) == 3
+    channel, subject, body = sent[-1]
+    assert subject == "Digest: 8 alerts on pager"
+    assert body.splitlines() == ["Breach 2", "Breach 3", "Breach 4", "... and 5 more"]
+    assert delivery.stats()["pager"]["digests"] == 1
+
+
+def test_webhook_transport_retries_through_pooled_client() -> None:
+    calls: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url.path)
+        return httpx.Response(503 if len(calls) == 1 else 204)
+
+    async def scenario() -> str:
+        transport = WebhookTransport(
+            base_url="http://hooks", transport=httpx.MockTransport(handler)
+        )
+        delivery = DeliveryQueue(transport=transport, backoff=0.0)
+        await delivery.start()
+        alert = delivery.submit("ops", subject="Fill", body="AAPL")
+        await delivery.stop()
+        await transport.aclose()
+        return alert.status
+
+    assert asyncio.run(scenario()) == "delivered"
+    assert calls == ["/ops", "/ops"]
+
+
 def test_evaluator_health() -> None:
     client = TestClient(create_evaluator_app())
     response = client.get("/evaluator/health")
     assert response.status_code == 200
+
+
+FILLS = [
+    {
+        "timestamp": "2024-01-02T14:30:00+00:00",
+        "symbol": "AAPL",
+        "side": "buy",
+        "quantity": 100,
+        "price": 10.0,
+        "commission": 1.0,
+        "arrival_price": 9.9,
+    },
+    {
+        "timestamp": "2024-01-02T14:31:00+00:00",
+        "symbol": "AAPL",
+        "side": "buy",
+        "quantity": 100,
+        "price": 12.0,
+        "commission": 1.0,
+    },
+    {
+        "timestamp": "2024-01-02T14:32:00+00:00",
+        "symbol": "AAPL",
+        "side": "sell",
+        "quantity": 50,
+        "price": 13.0,
+        "commission": 1.0,
+    },
+    {
+        "timestamp": "2024-01-02T14:30:30+00:00",
+        "symbol": "SPY240216C400",
+        "side": "buy",
+        "quantity": 10,
+        "price": 5.0,
+        "delta": 0.5,
+        "gamma": 0.02,
+        "underlying_price": 400.0,
+    },
+]
+
+
+def test_fill_analytics_splits_realized_and_unrealized_pnl() -> None:
+    analytics = analyze_fills(
+        FILLS, marks={"AAPL": 14.0}, underlying_marks={"SPY240216C400": 402.0}
+    )
+    metrics = analytics.metrics()
+    assert analytics.symbols == ("AAPL", "SPY240216C400")
+    assert list(analytics.position) == [150.0, 10.0]
+    assert metrics["realized_pnl"] == 50 * (13.0 - 11.0)
+    assert metrics["unrealized_pnl"] == 150 * (14.0 - 11.0)
+    assert metrics["commission"] == 3.0
+    assert metrics["pnl"] == 100.0 + 450.0 - 3.0
+    # Only the first fill carries an arrival price; later fills use the first price.
+    assert metrics["implementation_shortfall"] == pytest.approx(
+        100 * 0.1 + 100 * 2.0 - 50 * 3.0 + 3.0
+    )
+    assert metrics["delta"] == 5.0
+    assert metrics["delta_pnl"] == pytest.approx(10.0)
+    assert metrics["gamma_pnl"] == pytest.approx(0.4)
+    assert metrics["residual_pnl"] == pytest.approx(metrics["pnl"] - 10.4)
+
+
+def test_evaluator_scores_fills_inline() -> None:
+    with TestClient(create_evaluator_app()) as client:
+        response = client.post(
+            "/evaluator/evaluations",
+            json={"plan_id": "plan-1", "fills": FILLS, "marks": {"AAPL": 14.0}},
+        )
+        assert response.status_code == 200
+        body = response.json()
+        assert body["status"] == "completed"
+        assert body["metrics"]["pnl"] == pytest.approx(547.0)
+        fetched = client.get(f"/evaluator/evaluations/{body['id']}").json()
+        assert fetched == body
+        assert client.get("/evaluator/evaluations/eval-missing").status_code == 404
+
+        invalid = client.post(
+            "/evaluator/evaluations",
+            json={"plan_id": "plan-2", "fills": [{"symbol": "AAPL", "price": 1.0}]},
+        ).json()
+        assert invalid["status"] == "failed"
+
+
+def test_evaluator_runs_large_evaluations_in_background(monkeypatch) -> None:
+    monkeypatch.setenv("EVALUATOR_ASYNC_THRESHOLD", "2")
+    with TestClient(create_evaluator_app()) as client:
+        response = client.post(
+            "/evaluator/evaluations", json={"plan_id": "plan-1", "fills": FILLS * 50}
+        )
+        assert response.status_code == 202
+        evaluation_id = response.json()["id"]
+        deadline = time.monotonic() + 5.0
+        body = response.json()
+        while body["status"] == "pending" and time.monotonic() < deadline:
+            time.sleep(0.01)
+            body = client.get(f"/evaluator/evaluations/{evaluation_id}").json()
+        assert body["status"] == "completed"
+        assert body["metrics"]["fills"] == 200.0
+
+
+def test_evaluator_deduplicates_identical_requests(monkeypatch, tmp_path) -> None:
+    monkeypatch.setenv("EVALUATOR_CACHE_DIR", str(tmp_path))
+    payload = {"plan_id": "plan-1", "fills": FILLS, "marks": {"AAPL": 14.0}}
+    with TestClient(create_evaluator_app()) as client:
+        first = client.post("/evaluator/evaluations", json=payload).json()
+        reordered = [dict(reversed(list(fill.items()))) for fill in FILLS]
+        second = client.post(
+            "/evaluator/evaluations", json={**payload, "fills": reordered}
+        ).json()
+        assert second == first
+        other = client.post(
+            "/evaluator/evaluations", json={**payload, "marks": {"AAPL": 15.0}}
+        ).json()
+        assert other["id"] != first["id"]
+        stats = client.get("/evaluator/cache").json()
+        assert stats["memory_hits"] == 1
+        assert stats["misses"] == 2
+        assert stats["disk_entries"] == 2
+
+    with TestClient(create_evaluator_app()) as client:
+        fetched = client.get(f"/evaluator/evaluations/{first['id']}").json()
+        assert fetched == first
+        assert client.get("/evaluator/cache").json()["disk_hits"] == 1
+
+
+def test_result_cache_evicts_by_count_and_size(tmp_path) -> None:
+    cache = ResultCache(tmp_path, memory_entries=2, max_bytes=100)
+    for index in range(4):
+        cache.put(f"key{index}", {"plan_id": "p", "metrics": {"pnl": float(index)}})
+    assert cache.stats.evictions == 2
+    assert cache.stats.disk_bytes <= 100
+    assert cache.stats.disk_evictions >= 1
+    assert cache.get("key3") == {"plan_id": "p", "metrics": {"pnl": 3.0}}
+    assert cache.get("key0") is None
+    assert cache.stats.misses == 1
+
+
+def test_launcher_runs_plan_to_order_in_one_process(monkeypatch) -> None:
+    monkeypatch.setenv("PLANNER_COMPILE_WINDOW", "0.05")
+    monkeypatch.setenv("EXECUTOR_NETTING_WINDOW", "0.01")
+    monkeypatch.setenv("EXECUTOR_MAX_NOTIONAL", "5000")
+    broker = RecordingBroker()
+    transport = MemoryTransport()
+    app = create_launcher_app(broker=broker, notifier_transport=transport)
+    app.state.options_client.quotes["SPY"] = {"bid": 99.0, "ask": 101.0, "last": 100.0}
+    with TestClient(app) as client:
+        ids = [
+            client.post(
+                "/planner/plans", json=dict(_plan("SPY", 1), notional=notional)
+            ).json()["id"]
+            for notional in (1000.0, 9000.0)
+        ]
+        for plan_id in ids:
+            client.post(f"/planner/plans/{plan_id}/approve")
+        small, large = _wait_for_plans(client, ids)
+        orders = [
+            _wait_for_status(client, plan["details"]["order_id"])
+            for plan in (small, large)
+        ]
+        assert client.get("/notifier/health").status_code == 200
+
+    assert [order["status"] for order in orders] == ["submitted", "rejected"]
+    assert [order["client_order_id"] for order in orders] == ids
+    assert [plan["status"] for plan in (small, large)] == ["submitted", "rejected"]
+    assert large["details"]["detail"] == orders[1]["detail"]
+    assert broker.payloads[0]["qty"] == 10.0
+    [(channel, subject, body)] = transport.sent
+    assert (channel, subject) == ("orders", "Order rejected: SPY")
+    assert body.startswith(orders[1]["order_id"])
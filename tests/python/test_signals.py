@@ -0,0 +1,143 @@
+"""Tests for streaming signal statistics."""
+
+import math
+import random
+import statistics
+
+import numpy as np
+import pandas as pd
+import pytest
+from goldshore_signals import (
+    OrderBookState,
+    RollingExtremes,
+    RollingMoments,
+    SignalBook,
+    StreamingSignal,
+    classify_volatility,
+    detect_regime,
+    evaluate_panel,
+    rolling_features,
+    score_liquidity,
+)
+
+
+def test_rolling_statistics_match_window_recomputation() -> None:
+    rng = random.Random(7)
+    values = [rng.gauss(0.0, 1.0) for _ in range(500)]
+    moments = RollingMoments(window=30)
+    extremes = RollingExtremes(window=30)
+    for index, value in enumerate(values):
+        moments.update(value)
+        extremes.update(value)
+        window = values[max(0, index - 29) : index + 1]
+        assert moments.mean == pytest.approx(statistics.fmean(window))
+        assert extremes.minimum == min(window)
+        assert extremes.maximum == max(window)
+        if len(window) > 1:
+            assert moments.variance == pytest.approx(statistics.variance(window))
+
+
+def test_streaming_signal_labels_trends_and_volatility() -> None:
+    rising = [100.0 * math.exp(0.01 * day) for day in range(30)]
+    assert detect_regime(rising) == "trending_up"
+    assert detect_regime(rising[::-1]) == "trending_down"
+    assert detect_regime(rising[:5]) == "unknown"
+
+    rng = random.Random(11)
+    quiet = [100.0]
+    wild = [100.0]
+    for _ in range(60):
+        quiet.append(quiet[-1] * math.exp(rng.gauss(0.0, 0.002)))
+        wild.append(wild[-1] * math.exp(rng.gauss(0.0, 0.05)))
+    assert classify_volatility(quiet) == "low"
+    assert classify_volatility(wild) == "high"
+    assert detect_regime(quiet) == "range_bound"
+
+    signal = StreamingSignal()
+    for price in wild:
+        state = signal.update(price)
+    assert state.volatility == classify_volatility(wild)
+    assert state.regime == detect_regime(wild)
+    assert state.rolling_max == max(wild[-21:])
+
+    book = SignalBook()
+    book.update("AAPL", 100.0)
+    assert book.update("AAPL", 101.0).regime == "unknown"
+    assert set(book.signals) == {"AAPL"}
+
+
+def _random_panel(steps: int, width: int) -> np.ndarray:
+    rng = np.random.default_rng(3)
+    scales = np.linspace(0.001, 0.05, width)
+    drift = np.where(np.arange(width) % 3 == 0, 0.01, 0.0)
+    moves = rng.normal(drift, scales, size=(steps - 1, width))
+    return 100.0 * np.exp(np.vstack([np.zeros(width), np.cumsum(moves, axis=0)]))
+
+
+def test_evaluate_panel_matches_streaming_signals() -> None:
+    prices = _random_panel(80, 12)
+    frame = pd.DataFrame(prices, columns=[f"S{i}" for i in range(12)])
+    signals = evaluate_panel(frame)
+    pooled = evaluate_panel(prices, workers=2, chunk_symbols=5)
+
+    for column in range(12):
+        signal = StreamingSignal()
+        for price in prices[:, column]:
+            state = signal.update(float(price))
+        assert signals.regime[column] == state.regime
+        assert signals.volatility[column] == state.volatility
+        assert signals.realized_volatility[column] == pytest.approx(
+            state.realized_volatility
+        )
+        assert signals.ewma_volatility[column] == pytest.approx(state.ewma_volatility)
+        assert signals.rolling_max[column] == state.rolling_max
+    np.testing.assert_array_equal(pooled.regime, signals.regime)
+    assert list(signals.to_frame().index[:2]) == ["S0", "S1"]
+
+
+def test_rolling_features_match_last_window_and_skip_gaps() -> None:
+    prices = _random_panel(40, 3)
+    prices[30, 1] = np.nan
+    features = rolling_features(prices, window=5)
+
+    returns = np.log(prices[-5:, 0] / prices[-6:-1, 0])
+    assert features.rolling_mean[-1, 0] == pytest.approx(returns.mean())
+    assert features.rolling_std[-1, 0] == pytest.approx(returns.std(ddof=1))
+    assert features.rolling_min[-1, 0] == prices[-6:, 0].min()
+    assert np.isnan(features.rolling_mean[:5]).all()
+    assert np.isnan(features.rolling_mean[30:36, 1]).all()
+    assert np.isfinite(features.rolling_mean[36:, 1]).all()
+
+
+def test_order_book_state_tracks_aggregates_through_deltas() -> None:
+    rng = random.Random(5)
+    book = OrderBookState(band_bps=50.0)
+    levels: dict[tuple[str, float], float] = {}
+    for _ in range(2_000):
+        side = rng.choice(["bid", "ask"])
+        offset = rng.randint(1, 40) * 0.01
+        price = round(100.0 - offset if side == "bid" else 100.0 + offset, 2)
+        size = rng.choice([0.0, rng.randint(1, 500)])
+        book.apply(side, price, size)
+        if size:
+            levels[(side, price)] = size
+        else:
+            levels.pop((side, price), None)
+
+    frame = pd.DataFrame(
+        [(side, price, size) for (side, price), size in levels.items()],
+        columns=["side", "price", "size"],
+    )
+    rebuilt = OrderBookState.from_frame(frame, band_bps=50.0)
+    assert book.best_bid == rebuilt.best_bid
+    assert book.best_ask == rebuilt.best_ask
+    assert book.bid_depth == pytest.approx(rebuilt.bid_depth)
+    assert book.ask_depth == pytest.approx(rebuilt.ask_depth)
+    assert book.imbalance == pytest.approx(rebuilt.imbalance)
+    assert score_liquidity(frame, band_bps=50.0) == pytest.approx(book.score)
+
+    tight = OrderBookState()
+    tight.apply_many([("bid", 99.99, 10.0), ("ask", 100.01, 10.0)])
+    assert tight.spread_bps == pytest.approx(2.0)
+    assert tight.score == pytest.approx(2_000.0 / 3.0)
+    assert score_liquidity(frame.iloc[0:0]) == 0.0
@@ -0,0 +1,203 @@
+"""Tests for the shared utilities."""
+
+import asyncio
+import io
+import logging
+import queue
+from dataclasses import dataclass
+from datetime import datetime, timezone
+
+import numpy as np
+from goldshore_utils import EventBus, Registry, SocketBridge, timed
+from goldshore_utils.logging import JSONFormatter, _NonBlockingHandler
+from goldshore_utils.metrics import (
+    REGISTRY,
+    bucket_index,
+    bucket_upper_bound,
+    render_prometheus,
+)
+from goldshore_utils.serialization import (
+    ARROW_MEDIA_TYPE,
+    JSON_MEDIA_TYPE,
+    MSGPACK_MEDIA_TYPE,
+    available_media_types,
+    dumps,
+    loads,
+    negotiate,
+)
+from pydantic import BaseModel
+
+
+@dataclass(frozen=True)
+class Tick:
+    symbol: str
+
+
+@dataclass(frozen=True)
+class Trade(Tick):
+    quantity: float
+
+
+def test_event_bus_routes_by_type_and_isolates_failures() -> None:
+    bus = EventBus()
+    ticks: list[Tick] = []
+    trades: list[Trade] = []
+
+    async def record_trade(event: Trade) -> None:
+        trades.append(event)
+
+    def fail(event: Tick) -> None:
+        raise RuntimeError("handler bug")
+
+    async def scenario() -> None:
+        bus.subscribe(Tick, fail)
+        bus.subscribe(Tick, ticks.append)
+        unsubscribe = bus.subscribe(Trade, record_trade)
+        trade = Trade("SPY", 5.0)
+        bus.publish(Tick("QQQ"))
+        bus.publish(trade)
+        await bus.drain()
+        unsubscribe()
+        bus.publish(Trade("SPY", 1.0))
+        await bus.drain()
+        assert trades[0] is trade
+
+    asyncio.run(scenario())
+    assert ticks == [Tick("QQQ"), Trade("SPY", 5.0), Trade("SPY", 1.0)]
+    assert trades == [Trade("SPY", 5.0)]
+
+
+def test_socket_bridge_relays_events_between_buses(tmp_path) -> None:
+    async def scenario() -> tuple[list[Tick], list[Tick]]:
+        server_bus, client_bus = EventBus(), EventBus()
+        received: list[Tick] = []
+        echoed: list[Tick] = []
+        client_bus.subscribe(Tick, received.append)
+        server_bus.subscribe(Tick, echoed.append)
+        path = tmp_path / "events.sock"
+        server = SocketBridge(server_bus, path, [Tick])
+        client = SocketBridge(client_bus, path, [Tick])
+        await server.serve()
+        await client.connect()
+        for _ in range(100):
+            if server._writers:
+                break
+            await asyncio.sleep(0.01)
+        server_bus.publish(Trade("SPY", 2.0))
+        for _ in range(100):
+            if received:
+                break
+            await asyncio.sleep(0.01)
+        await asyncio.sleep(0.05)
+        await client.close()
+        await server.close()
+        return received, echoed
+
+    received, echoed = asyncio.run(scenario())
+    assert received == [Trade("SPY", 2.0)]
+    assert echoed == [Trade("SPY", 2.0)]
+
+
+def test_dumps_encodes_dataclasses_arrays_and_models_directly() -> None:
+    class Quote(BaseModel):
+        symbol: str
+        at: datetime
+
+    at = datetime(2024, 1, 2, 14, 30, tzinfo=timezone.utc)  # noqa: UP017 - datetime.UTC needs 3.11
+    payload = {
+        "trade": Trade("SPY", 5.0),
+        "prices": np.array([1.5, 2.5]),
+        "quote": Quote(symbol="QQQ", at=at),
+        "nan": float("nan"),
+    }
+
+    assert loads(dumps(payload)) == {
+        "trade": {"symbol": "SPY", "quantity": 5.0},
+        "prices": [1.5, 2.5],
+        "quote": {"symbol": "QQQ", "at": "2024-01-02T14:30:00Z"},
+        "nan": None,
+    }
+    assert dumps(Quote(symbol="QQQ", at=at)) == (
+        b'{"symbol":"QQQ","at":"2024-01-02T14:30:00Z"}'
+    )
+
+
+def test_negotiate_honours_quality_and_falls_back_to_json() -> None:
+    assert negotiate(None) == JSON_MEDIA_TYPE
+    assert negotiate("text/html, */*;q=0.1") == JSON_MEDIA_TYPE
+    assert negotiate(f"{ARROW_MEDIA_TYPE};q=0.9, {JSON_MEDIA_TYPE}") == JSON_MEDIA_TYPE
+    expected = (
+        MSGPACK_MEDIA_TYPE
+        if MSGPACK_MEDIA_TYPE in available_media_types()
+        else JSON_MEDIA_TYPE
+    )
+    assert negotiate(f"{JSON_MEDIA_TYPE};q=0.5, application/x-msgpack") == expected
+    # Arrow only applies to record lists.
+    assert negotiate(ARROW_MEDIA_TYPE, {"symbol": "SPY"}) == JSON_MEDIA_TYPE
+
+
+def test_histogram_buckets_bound_relative_error() -> None:
+    for value in (0, 1, 17, 999, 123_456, 10**9):
+        upper = bucket_upper_bound(bucket_index(value))
+        assert value < upper <= max(value * 1.0625 + 1, value + 1)
+
+    registry = Registry()
+    histogram = registry.histogram("latency_seconds", "Latency", path="/x")
+    for micros in range(1, 101):
+        histogram.record(micros * 1000)
+
+    assert histogram.count == 100
+    assert 49e-6 <= histogram.quantile(0.5) <= 53e-6
+    assert 99e-6 <= histogram.quantile(0.99) <= 105e-6
+    below, middle, above = histogram.cumulative([1e-7, 5e-5, 2e-4])
+    assert (below, above) == (0, 100)
+    assert 47 <= middle <= 50
+
+
+def test_render_prometheus_and_timed_functions() -> None:
+    registry = Registry()
+    registry.counter("jobs_total", "Jobs run", queue="a").inc(3)
+
+    @timed("work_seconds", "Work", registry=registry)
+    def work() -> int:
+        return 1
+
+    @timed("async_work_seconds", registry=registry)
+    async def async_work() -> int:
+        return 2
+
+    assert work() == 1
+    assert asyncio.run(async_work()) == 2
+
+    text = render_prometheus(registry, bounds=[1.0])
+    assert "# HELP jobs_total Jobs run\n# TYPE jobs_total counter\n" in text
+    assert 'jobs_total{queue="a"} 3' in text
+    assert "# TYPE work_seconds histogram" in text
+    assert 'work_seconds_bucket{le="1.0"} 1' in text
+    assert 'work_seconds_bucket{le="+Inf"} 1' in text
+    assert "async_work_seconds_count 1" in text
+
+
+def test_json_formatter_and_dropping_queue_handler() -> None:
+    stream = io.StringIO()
+    writer = logging.StreamHandler(stream)
+    writer.setFormatter(JSONFormatter("planner"))
+    logger = logging.getLogger("goldshore.test.json")
+    logger.propagate = False
+    logger.addHandler(writer)
+    logger.warning("plan %s compiled", "p-1", extra={"plan_id": "p-1"})
+    logger.removeHandler(writer)
+
+    document = loads(stream.getvalue())
+    assert document["level"] == "warning"
+    assert document["service"] == "planner"
+    assert document["event"] == "plan p-1 compiled"
+    assert document["plan_id"] == "p-1"
+
+    handler = _NonBlockingHandler(queue.Queue(maxsize=1))
+    dropped = REGISTRY.counter("goldshore_log_records_dropped_total")
+    before = dropped.value
+    record = logger.makeRecord(logger.name, logging.INFO, "", 0, "x", (), None)
+    handler.emit(record)
+    handler.emit(record)
+    assert dropped.value == before + 1